@@ -22,7 +22,13 @@ from homeassistant.const import (
     REQUIRED_NEXT_PYTHON_VER,
 )
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers import (
+    area_registry,
+    config_per_platform,
+    device_registry,
+    entity_registry,
+    startup_report,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
@@ -445,12 +451,79 @@ async def async_setup_multi_components(
         )
 
 
+def _async_measure_stage(
+    hass: core.HomeAssistant, stage: str, step: str
+) -> contextlib.AbstractContextManager[None]:
+    """Measure a step of a bootstrap stage for the startup report."""
+    return startup_report.async_measure(
+        hass, startup_report.CATEGORY_STAGES, stage, step
+    )
+
+
+async def _async_preimport_integrations(
+    hass: core.HomeAssistant,
+    domains: set[str],
+    integration_cache: dict[str, loader.Integration],
+    config: dict[str, Any],
+) -> None:
+    """Import the integrations of a stage and their platforms in the executor.
+
+    Integrations that are still being set up, like those of a stage that
+    timed out, or that have a config flow in progress import their modules
+    on the event loop. They are skipped, with the integrations depending on
+    them, so the executor never imports the same modules concurrently.
+    """
+    busy = {
+        domain
+        for domain, task in hass.data.get(DATA_SETUP, {}).items()
+        if not task.done()
+    }
+    busy.update(
+        flow["handler"]
+        for flow in hass.config_entries.flow.async_progress(include_uninitialized=True)
+    )
+    domains = domains - busy
+
+    platforms: dict[str, set[str]] = {}
+    for domain in domains:
+        for p_type, _ in config_per_platform(config, domain):
+            if isinstance(p_type, str) and "." not in p_type and p_type not in busy:
+                platforms.setdefault(p_type, set()).add(domain)
+
+    integrations = {
+        domain: integration_cache[domain]
+        for domain in (*domains, *platforms)
+        if domain in integration_cache
+    }
+    for int_or_exc in await asyncio.gather(
+        *(
+            loader.async_get_integration(hass, p_type)
+            for p_type in platforms
+            if p_type not in integrations
+        ),
+        return_exceptions=True,
+    ):
+        if isinstance(int_or_exc, loader.Integration):
+            integrations[int_or_exc.domain] = int_or_exc
+
+    await loader.async_preimport_integrations(
+        hass,
+        (
+            integration
+            for integration in integrations.values()
+            if not busy.intersection(integration.dependencies)
+        ),
+        platforms,
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
     """Set up all the integrations."""
     hass.data[DATA_SETUP_STARTED] = {}
     setup_time = hass.data[DATA_SETUP_TIME] = {}
+    startup_report.async_start_report(hass)
 
     watch_task = asyncio.create_task(_async_watch_pending_setups(hass))
 
@@ -500,12 +573,14 @@ async def _async_set_up_integrations(
     # Load logging as soon as possible
     if logging_domains := domains_to_setup & LOGGING_INTEGRATIONS:
         _LOGGER.info("Setting up logging: %s", logging_domains)
-        await async_setup_multi_components(hass, logging_domains, config)
+        with _async_measure_stage(hass, "logging", "setup"):
+            await async_setup_multi_components(hass, logging_domains, config)
 
     # Start up debuggers. Start these first in case they want to wait.
     if debuggers := domains_to_setup & DEBUGGER_INTEGRATIONS:
         _LOGGER.debug("Setting up debuggers: %s", debuggers)
-        await async_setup_multi_components(hass, debuggers, config)
+        with _async_measure_stage(hass, "debuggers", "setup"):
+            await async_setup_multi_components(hass, debuggers, config)
 
     # calculate what components to setup in what stage
     stage_1_domains = set()
@@ -544,7 +619,12 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
+                with _async_measure_stage(hass, "stage_1", "preimport"):
+                    await _async_preimport_integrations(
+                        hass, stage_1_domains, integration_cache, config
+                    )
+                with _async_measure_stage(hass, "stage_1", "setup"):
+                    await async_setup_multi_components(hass, stage_1_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 1 - moving forward")
 
@@ -557,7 +637,12 @@ async def _async_set_up_integrations(
             async with hass.timeout.async_timeout(
                 STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                with _async_measure_stage(hass, "stage_2", "preimport"):
+                    await _async_preimport_integrations(
+                        hass, stage_2_domains, integration_cache, config
+                    )
+                with _async_measure_stage(hass, "stage_2", "setup"):
+                    await async_setup_multi_components(hass, stage_2_domains, config)
         except asyncio.TimeoutError:
             _LOGGER.warning("Setup timed out for stage 2 - moving forward")
 
@@ -565,12 +650,17 @@ async def _async_set_up_integrations(
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
         async with hass.timeout.async_timeout(WRAP_UP_TIMEOUT, cool_down=COOLDOWN_TIME):
-            await hass.async_block_till_done()
+            with _async_measure_stage(hass, "wrap_up", "setup"):
+                await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
 
     watch_task.cancel()
     async_dispatcher_send(hass, SIGNAL_BOOTSTRAP_INTEGRATONS, {})
+    try:
+        await startup_report.async_save_report(hass)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Error saving the startup report")
 
     _LOGGER.debug(
         "Integration setup times: %s",
@@ -581,3 +671,12 @@ async def _async_set_up_integrations(
             )
         },
     )
+    _LOGGER.debug(
+        "Module import times: %s",
+        dict(
+            sorted(
+                hass.data.get(loader.DATA_IMPORT_TIME, {}).items(),
+                key=lambda item: item[1],
+            )
+        ),
+    )
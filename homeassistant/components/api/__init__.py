@@ -13,6 +13,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     MATCH_ALL,
@@ -208,7 +209,15 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        # Splice in the JSON of the states, which is encoded once per state
+        try:
+            states_json = f'[{",".join(state.as_dict_json for state in states)}]'
+        except (ValueError, TypeError):
+            # Logs the bad data and responds with an error
+            return self.json(states)
+        response = web.Response(body=states_json, content_type=CONTENT_TYPE_JSON)
+        response.enable_compression()
+        return response
 
 
 class APIEntityStateView(HomeAssistantView):
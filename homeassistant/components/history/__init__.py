@@ -1,6 +1,7 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Iterable
 from datetime import datetime as dt, timedelta
 from http import HTTPStatus
@@ -9,6 +10,7 @@ import time
 from typing import cast
 
 from aiohttp import web
+from aiohttp.hdrs import CONTENT_TYPE
 from sqlalchemy import not_, or_
 import voluptuous as vol
 
@@ -20,21 +22,31 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.components.recorder.util import session_scope
-from homeassistant.const import CONF_DOMAINS, CONF_ENTITIES, CONF_EXCLUDE, CONF_INCLUDE
-from homeassistant.core import HomeAssistant
+from homeassistant.components.websocket_api.messages import message_to_json
+from homeassistant.const import (
+    CONF_DOMAINS,
+    CONF_ENTITIES,
+    CONF_EXCLUDE,
+    CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
+)
+from homeassistant.core import HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.deprecation import deprecated_class, deprecated_function
 from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_dumps
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
 _LOGGER = logging.getLogger(__name__)
 
 DOMAIN = "history"
+DATA_FILTERS = "history_filters"
 CONF_ORDER = "use_include_order"
 
 GLOB_TO_SQL_CHARS = {
@@ -92,7 +104,9 @@ async def async_setup(hass, config):
     """Set up the history hooks."""
     conf = config.get(DOMAIN, {})
 
-    filters = sqlalchemy_filter_from_include_exclude_conf(conf)
+    filters = hass.data[DATA_FILTERS] = sqlalchemy_filter_from_include_exclude_conf(
+        conf
+    )
 
     use_include_order = conf.get(CONF_ORDER)
 
@@ -104,6 +118,9 @@ async def async_setup(hass, config):
         ws_get_statistics_during_period
     )
     hass.components.websocket_api.async_register_command(ws_get_list_statistic_ids)
+    hass.components.websocket_api.async_register_command(
+        ws_stream_history_during_period
+    )
 
     return True
 
@@ -175,6 +192,109 @@ async def ws_get_list_statistic_ids(
     connection.send_result(msg["id"], statistic_ids)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "history/stream_history_during_period",
+        vol.Required("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("entity_ids"): [str],
+        vol.Optional("include_start_time_state", default=True): bool,
+        vol.Optional("significant_changes_only", default=True): bool,
+        vol.Optional("minimal_response", default=False): bool,
+        vol.Optional("columnar", default=False): bool,
+    }
+)
+@websocket_api.async_response
+async def ws_stream_history_during_period(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Stream the history of one entity at a time.
+
+    The states of each entity are sent as an event message, an event
+    with only "done" marks the end of the stream.
+    """
+    start_time_str = msg["start_time"]
+    end_time_str = msg.get("end_time")
+
+    if start_time := dt_util.parse_datetime(start_time_str):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    if end_time_str:
+        if end_time := dt_util.parse_datetime(end_time_str):
+            end_time = dt_util.as_utc(end_time)
+        else:
+            connection.send_error(msg["id"], "invalid_end_time", "Invalid end_time")
+            return
+    else:
+        end_time = None
+
+    entity_ids = msg.get("entity_ids")
+    if entity_ids is not None:
+        entity_ids = [entity_id.lower() for entity_id in entity_ids]
+
+    cancelled = False
+
+    @callback
+    def _async_cancel_stream() -> None:
+        """Stop streaming when the client unsubscribes."""
+        nonlocal cancelled
+        cancelled = True
+
+    def _stream_history() -> None:
+        """Send the history from the executor, one entity at a time."""
+        with session_scope(hass=hass) as session:
+            for states in history.stream_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                hass.data[DATA_FILTERS],
+                msg["include_start_time_state"],
+                msg["significant_changes_only"],
+                msg["minimal_response"],
+                msg["columnar"],
+            ):
+                if cancelled:
+                    return
+                run_callback_threadsafe(
+                    hass.loop,
+                    connection.send_message,
+                    message_to_json(
+                        websocket_api.event_message(
+                            msg["id"], {_entity_id(states): states}
+                        )
+                    ),
+                ).result()
+                # Don't read the database faster than the client reads
+                # the messages, the connection is closed when too many
+                # messages are pending
+                asyncio.run_coroutine_threadsafe(
+                    connection.async_wait_writable(), hass.loop
+                ).result()
+
+    connection.subscriptions[msg["id"]] = _async_cancel_stream
+    connection.send_result(msg["id"])
+    try:
+        await hass.async_add_executor_job(_stream_history)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Error streaming the history")
+        if not cancelled:
+            connection.subscriptions.pop(msg["id"], None)
+            connection.send_error(
+                msg["id"],
+                websocket_api.ERR_UNKNOWN_ERROR,
+                "Error streaming the history",
+            )
+        return
+    if not cancelled:
+        connection.subscriptions.pop(msg["id"], None)
+        connection.send_message(websocket_api.event_message(msg["id"], {"done": True}))
+
+
 class HistoryPeriodView(HomeAssistantView):
     """Handle history period requests."""
 
@@ -189,7 +309,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         if datetime and (datetime_ := dt_util.parse_datetime(datetime)) is None:
@@ -223,6 +343,8 @@ class HistoryPeriodView(HomeAssistantView):
         )
 
         minimal_response = "minimal_response" in request.query
+        columnar = "columnar" in request.query
+        stream = "stream" in request.query
 
         hass = request.app["hass"]
 
@@ -233,6 +355,32 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
+        if stream:
+            response = web.StreamResponse(headers={CONTENT_TYPE: CONTENT_TYPE_JSON})
+            response.enable_compression()
+            await response.prepare(request)
+            try:
+                await hass.async_add_executor_job(
+                    self._stream_significant_states_json,
+                    hass,
+                    response,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    columnar,
+                )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error streaming the history")
+                # Never end the body, the client must see it is truncated
+                if (transport := request.transport) is not None:
+                    transport.close()
+                return response
+            await response.write_eof()
+            return response
+
         return cast(
             web.Response,
             await hass.async_add_executor_job(
@@ -244,6 +392,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                columnar,
             ),
         )
 
@@ -256,6 +405,7 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        columnar,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
@@ -271,12 +421,15 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                columnar,
             )
 
         result = list(result.values())
         if _LOGGER.isEnabledFor(logging.DEBUG):
             elapsed = time.perf_counter() - timer_start
-            _LOGGER.debug("Extracted %d states in %fs", sum(map(len, result)), elapsed)
+            _LOGGER.debug(
+                "Extracted %d states in %fs", sum(map(_state_count, result)), elapsed
+            )
 
         # Optionally reorder the result to respect the ordering given
         # by any entities explicitly included in the configuration.
@@ -284,7 +437,7 @@ class HistoryPeriodView(HomeAssistantView):
             sorted_result = []
             for order_entity in self.filters.included_entities:
                 for state_list in result:
-                    if state_list[0].entity_id == order_entity:
+                    if _entity_id(state_list) == order_entity:
                         sorted_result.append(state_list)
                         result.remove(state_list)
                         break
@@ -293,6 +446,67 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    def _stream_significant_states_json(
+        self,
+        hass,
+        response,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        columnar,
+    ):
+        """Write significant states from the database as json, one entity at a time.
+
+        The entities are not reordered to respect use_include_order.
+        """
+        timer_start = time.perf_counter()
+        state_count = 0
+
+        def _write(data: bytes) -> None:
+            """Write to the response, waiting for the transport to drain."""
+            asyncio.run_coroutine_threadsafe(response.write(data), hass.loop).result()
+
+        separator = b"["
+        with session_scope(hass=hass) as session:
+            for states in history.stream_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                self.filters,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                columnar,
+            ):
+                _write(separator + json_dumps(states).encode("UTF-8"))
+                separator = b","
+                state_count += _state_count(states)
+        _write(b"[]" if separator == b"[" else b"]")
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed %d states in %fs", state_count, elapsed)
+
+
+def _entity_id(states):
+    """Return the entity_id of the history of one entity."""
+    if isinstance(states, dict):
+        # Columnar history
+        return states[history.ENTITY_ID_KEY]
+    return states[0].entity_id
+
+
+def _state_count(states):
+    """Return the number of states in the history of one entity."""
+    if isinstance(states, dict):
+        return len(states[history.STATE_KEY])
+    return len(states)
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
@@ -9,7 +9,7 @@ from homeassistant.components.automation import (
     AutomationActionType,
     AutomationTriggerInfo,
 )
-from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM
+from homeassistant.const import CONF_EVENT_DATA, CONF_PLATFORM, MATCH_ALL
 from homeassistant.core import CALLBACK_TYPE, Event, HassJob, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.typing import ConfigType
@@ -53,6 +53,7 @@ async def async_attach_trigger(
     removes = []
 
     event_data_schema = None
+    event_data_key: tuple[str, str] | None = None
     if CONF_EVENT_DATA in config:
         # Render the schema input
         template.attach(hass, config[CONF_EVENT_DATA])
@@ -65,6 +66,16 @@ async def async_attach_trigger(
             {vol.Required(key): value for key, value in event_data.items()},
             extra=vol.ALLOW_EXTRA,
         )
+        # Let the event bus route the events by the first string in the
+        # data, like the device identifier of device triggers
+        event_data_key = next(
+            (
+                (key, value)
+                for key, value in event_data.items()
+                if isinstance(value, str)
+            ),
+            None,
+        )
 
     event_context_schema = None
     if CONF_EVENT_CONTEXT in config:
@@ -113,7 +124,10 @@ async def async_attach_trigger(
         )
 
     removes = [
-        hass.bus.async_listen(event_type, handle_event) for event_type in event_types
+        hass.bus.async_listen(event_type, handle_event)
+        if event_data_key is None or event_type == MATCH_ALL
+        else hass.bus.async_listen_keyed(event_type, *event_data_key, handle_event)
+        for event_type in event_types
     ]
 
     @callback
@@ -1,9 +1,11 @@
 """Event parser and human readable log generator."""
+import asyncio
 from contextlib import suppress
 from datetime import timedelta
 from http import HTTPStatus
 from itertools import groupby
 import json
+import logging
 import re
 
 import sqlalchemy
@@ -11,12 +13,18 @@ from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
+    EventData,
     Events,
+    StateAttributes,
     States,
+    decode_attributes_from_row,
+    decode_event_data_from_row,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -28,13 +36,20 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_LOGBOOK_ENTRY,
     EVENT_STATE_CHANGED,
 )
-from homeassistant.core import DOMAIN as HA_DOMAIN, callback, split_entity_id
+from homeassistant.core import (
+    DOMAIN as HA_DOMAIN,
+    Event,
+    HomeAssistant,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import InvalidEntityFormatError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
@@ -48,6 +63,8 @@ from homeassistant.helpers.integration_platform import (
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
+_LOGGER = logging.getLogger(__name__)
+
 ENTITY_ID_JSON_TEMPLATE = '"entity_id":"{}"'
 ENTITY_ID_JSON_EXTRACT = re.compile('"entity_id": ?"([^"]+)"')
 DOMAIN_JSON_EXTRACT = re.compile('"domain": ?"([^"]+)"')
@@ -57,9 +74,17 @@ ATTR_MESSAGE = "message"
 CONTINUOUS_DOMAINS = ["proximity", "sensor"]
 
 DOMAIN = "logbook"
+DATA_FILTERS = "logbook_filters"
 
 GROUP_BY_MINUTES = 15
 
+# The number of contexts of live events kept to augment later events
+LIVE_CONTEXT_LOOKUP_SIZE = 1024
+
+# How long to wait for the recorder to commit before sending the
+# historical events of an event stream
+COMMIT_TIMEOUT = 10
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
@@ -86,8 +111,10 @@ ALL_EVENT_TYPES = [
 ]
 
 EVENT_COLUMNS = [
+    Events.event_id,
     Events.event_type,
     Events.event_data,
+    EventData.shared_data,
     Events.time_fired,
     Events.context_id,
     Events.context_user_id,
@@ -158,7 +185,9 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
+    hass.data[DATA_FILTERS] = (filters, entities_filter)
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    hass.components.websocket_api.async_register_command(ws_event_stream)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -178,6 +207,134 @@ async def _process_logbook_platform(hass, domain, platform):
     platform.async_describe_events(hass, _async_describe_event)
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/event_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("entity_ids"): [str],
+    }
+)
+@websocket_api.async_response
+async def ws_event_stream(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Send the logbook since start_time, then keep sending new entries.
+
+    The entries are sent as {"events": [...]} event messages, the
+    historical entries are read from the database once.
+    """
+    if start_time := dt_util.parse_datetime(msg["start_time"]):
+        start_time = dt_util.as_utc(start_time)
+    else:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+
+    entity_ids = msg.get("entity_ids")
+    if entity_ids is not None:
+        try:
+            entity_ids = cv.entity_ids(entity_ids)
+        except vol.Invalid:
+            connection.send_error(msg["id"], "invalid_entity_ids", "Invalid entity_ids")
+            return
+
+    filters, entities_filter = hass.data[DATA_FILTERS]
+    if entity_ids is not None:
+        entities_filter = generate_filter([], entity_ids, [], [])
+    entity_attr_cache = EntityAttributeCache(hass)
+    context_lookup = {None: None}
+    # Live events are held back until the historical entries are sent
+    pending_events: list[Event] | None = []
+
+    @callback
+    def _async_send_events(events: list) -> None:
+        """Send logbook entries to the client."""
+        connection.send_message(
+            websocket_api.event_message(msg["id"], {"events": events})
+        )
+
+    @callback
+    def _async_humanify_live_event(event: Event) -> None:
+        """Send the logbook entry of a live event, if there is one."""
+        partial_event = LiveEventPartialState(event)
+        if event.event_type == EVENT_STATE_CHANGED and not _keep_live_state_change(
+            event, entities_filter
+        ):
+            return
+        context_lookup.setdefault(partial_event.context_id, partial_event)
+        while len(context_lookup) > LIVE_CONTEXT_LOOKUP_SIZE:
+            # Keep the None key, events without a context id look it up
+            del context_lookup[
+                next(context_id for context_id in context_lookup if context_id)
+            ]
+        if event.event_type == EVENT_CALL_SERVICE or (
+            event.event_type != EVENT_STATE_CHANGED
+            and not _keep_event(hass, partial_event, entities_filter)
+        ):
+            return
+        if entries := list(
+            humanify(hass, [partial_event], entity_attr_cache, context_lookup)
+        ):
+            _async_send_events(entries)
+
+    @callback
+    def _async_forward_event(event: Event) -> None:
+        """Forward a live event, or hold it back until the history is sent."""
+        if pending_events is not None:
+            pending_events.append(event)
+            return
+        _async_humanify_live_event(event)
+
+    subscription_time = dt_util.utcnow()
+    unsubs = [
+        hass.bus.async_listen(event_type, _async_forward_event)
+        for event_type in (*ALL_EVENT_TYPES, *hass.data.get(DOMAIN, {}))
+    ]
+
+    @callback
+    def _async_unsub() -> None:
+        """Stop sending live entries."""
+        for unsub in unsubs:
+            unsub()
+
+    connection.subscriptions[msg["id"]] = _async_unsub
+    connection.send_result(msg["id"])
+
+    # Make sure the events fired before subscribing are in the database
+    with suppress(asyncio.TimeoutError):
+        await asyncio.wait_for(
+            hass.data[DATA_INSTANCE].async_commit(), timeout=COMMIT_TIMEOUT
+        )
+
+    try:
+        entries = await hass.async_add_executor_job(
+            _get_events,
+            hass,
+            start_time,
+            subscription_time,
+            entity_ids,
+            filters,
+            entities_filter,
+            False,
+            None,
+            entity_attr_cache,
+            context_lookup,
+        )
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Error reading the logbook")
+        if connection.subscriptions.pop(msg["id"], None) is not None:
+            _async_unsub()
+            connection.send_error(
+                msg["id"], websocket_api.ERR_UNKNOWN_ERROR, "Error reading the logbook"
+            )
+        return
+    finally:
+        events, pending_events = pending_events, None
+
+    _async_send_events(entries)
+    for event in events:
+        _async_humanify_live_event(event)
+
+
 class LogbookView(HomeAssistantView):
     """Handle logbook view requests."""
 
@@ -231,6 +388,38 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTPStatus.BAD_REQUEST
             )
 
+        if (limit := request.query.get("limit")) is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                limit = 0
+            if limit < 1:
+                return self.json_message("Invalid limit", HTTPStatus.BAD_REQUEST)
+
+            cursor = None
+            if (cursor_str := request.query.get("cursor")) is not None and (
+                cursor := _parse_cursor(cursor_str)
+            ) is None:
+                return self.json_message("Invalid cursor", HTTPStatus.BAD_REQUEST)
+
+            def json_events_page():
+                """Fetch a page of events and generate JSON."""
+                events, next_cursor = _get_events_page(
+                    hass,
+                    start_day,
+                    end_day,
+                    limit,
+                    cursor,
+                    entity_ids,
+                    self.filters,
+                    self.entities_filter,
+                    entity_matches_only,
+                    context_id,
+                )
+                return self.json({"events": events, "next_cursor": next_cursor})
+
+            return await hass.async_add_executor_job(json_events_page)
+
         def json_events():
             """Fetch events and generate JSON."""
             return self.json(
@@ -411,72 +600,190 @@ def _get_events(
     entities_filter=None,
     entity_matches_only=False,
     context_id=None,
+    entity_attr_cache=None,
+    context_lookup=None,
 ):
     """Get events for a period of time."""
     assert not (
         entity_ids and context_id
     ), "can't pass in both entity_ids and context_id"
 
-    entity_attr_cache = EntityAttributeCache(hass)
-    context_lookup = {None: None}
-
-    def yield_events(query):
-        """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
-            event = LazyEventPartialState(row)
-            context_lookup.setdefault(event.context_id, event)
-            if event.event_type == EVENT_CALL_SERVICE:
-                continue
-            if event.event_type == EVENT_STATE_CHANGED or _keep_event(
-                hass, event, entities_filter
-            ):
-                yield event
+    if entity_attr_cache is None:
+        entity_attr_cache = EntityAttributeCache(hass)
+    if context_lookup is None:
+        context_lookup = {None: None}
 
     if entity_ids is not None:
         entities_filter = generate_filter([], entity_ids, [], [])
 
     with session_scope(hass=hass) as session:
-        old_state = aliased(States, name="old_state")
+        query = _generate_logbook_query(
+            hass,
+            session,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entity_matches_only,
+            context_id,
+        ).order_by(Events.time_fired)
 
-        if entity_ids is not None:
-            query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_event_types_filter(
-                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        return list(
+            humanify(
+                hass,
+                _yield_events(
+                    hass, query.yield_per(1000), entities_filter, context_lookup
+                ),
+                entity_attr_cache,
+                context_lookup,
             )
-            if entity_matches_only:
-                # When entity_matches_only is provided, contexts and events that do not
-                # contain the entity_ids are not included in the logbook response.
-                query = _apply_event_entity_id_matchers(query, entity_ids)
-
-            query = query.union_all(
-                _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
+        )
+
+
+def _get_events_page(
+    hass,
+    start_day,
+    end_day,
+    limit,
+    cursor=None,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    context_id=None,
+):
+    """Get the newest page of events before the cursor.
+
+    The events are paginated with a keyset on (time_fired, event_id)
+    which uses the time_fired index. Returns the entries of the page
+    and the cursor of the next, older, page; None if this is the last
+    page. Events are only grouped and augmented with their context
+    within a page.
+    """
+    assert not (
+        entity_ids and context_id
+    ), "can't pass in both entity_ids and context_id"
+
+    entity_attr_cache = EntityAttributeCache(hass)
+    context_lookup = {None: None}
+
+    if entity_ids is not None:
+        entities_filter = generate_filter([], entity_ids, [], [])
+
+    with session_scope(hass=hass) as session:
+        query = _generate_logbook_query(
+            hass,
+            session,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entity_matches_only,
+            context_id,
+        )
+        if cursor is not None:
+            before_time_fired, before_event_id = cursor
+            query = query.filter(
+                (Events.time_fired < before_time_fired)
+                | (
+                    (Events.time_fired == before_time_fired)
+                    & (Events.event_id < before_event_id)
                 )
             )
-        else:
-            query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_events_types_and_states_filter(
-                hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
+        rows = (
+            query.order_by(Events.time_fired.desc(), Events.event_id.desc())
+            .limit(limit)
+            .all()
+        )
+
+        next_cursor = None
+        if len(rows) == limit:
+            next_cursor = _format_cursor(rows[-1].time_fired, rows[-1].event_id)
+
+        entries = list(
+            humanify(
+                hass,
+                _yield_events(hass, reversed(rows), entities_filter, context_lookup),
+                entity_attr_cache,
+                context_lookup,
             )
-            if filters:
-                query = query.filter(
-                    filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
-                )
+        )
+        return entries, next_cursor
 
-            if context_id is not None:
-                query = query.filter(Events.context_id == context_id)
 
-        query = query.order_by(Events.time_fired)
+def _format_cursor(time_fired, event_id):
+    """Return the cursor of the page before an event."""
+    return f"{process_timestamp_to_utc_isoformat(time_fired)}|{event_id}"
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+
+def _parse_cursor(cursor):
+    """Return the time_fired and event_id of a cursor, None if it is invalid."""
+    time_fired_str, _, event_id_str = cursor.rpartition("|")
+    if (time_fired := dt_util.parse_datetime(time_fired_str)) is None:
+        return None
+    try:
+        return dt_util.as_utc(time_fired), int(event_id_str)
+    except ValueError:
+        return None
+
+
+def _yield_events(hass, rows, entities_filter, context_lookup):
+    """Yield Events that are not filtered away."""
+    for row in rows:
+        event = LazyEventPartialState(row)
+        context_lookup.setdefault(event.context_id, event)
+        if event.event_type == EVENT_CALL_SERVICE:
+            continue
+        if event.event_type == EVENT_STATE_CHANGED or _keep_event(
+            hass, event, entities_filter
+        ):
+            yield event
+
+
+def _generate_logbook_query(
+    hass,
+    session,
+    start_day,
+    end_day,
+    entity_ids,
+    filters,
+    entity_matches_only,
+    context_id,
+):
+    """Return the unordered query of the events for a period of time."""
+    old_state = aliased(States, name="old_state")
+
+    if entity_ids is not None:
+        query = _generate_events_query_without_states(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_event_types_filter(
+            hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        )
+        if entity_matches_only:
+            # When entity_matches_only is provided, contexts and events that do not
+            # contain the entity_ids are not included in the logbook response.
+            query = _apply_event_entity_id_matchers(query, entity_ids)
+
+        return query.union_all(
+            _generate_states_query(session, start_day, end_day, old_state, entity_ids)
         )
 
+    query = _generate_events_query(session)
+    query = _apply_event_time_filter(query, start_day, end_day)
+    query = _apply_events_types_and_states_filter(hass, query, old_state).filter(
+        (States.last_updated == States.last_changed)
+        | (Events.event_type != EVENT_STATE_CHANGED)
+    )
+    if filters:
+        query = query.filter(
+            filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
+        )
+
+    if context_id is not None:
+        query = query.filter(Events.context_id == context_id)
+
+    return query
+
 
 def _generate_events_query(session):
     return session.query(
@@ -485,6 +792,7 @@ def _generate_events_query(session):
         States.entity_id,
         States.domain,
         States.attributes,
+        StateAttributes.shared_attrs,
     )
 
 
@@ -495,14 +803,19 @@ def _generate_events_query_without_states(session):
         literal(value=None, type_=sqlalchemy.String).label("entity_id"),
         literal(value=None, type_=sqlalchemy.String).label("domain"),
         literal(value=None, type_=sqlalchemy.Text).label("attributes"),
-    )
+        literal(value=None, type_=sqlalchemy.Text).label("shared_attrs"),
+    ).outerjoin(EventData, (Events.data_id == EventData.data_id))
 
 
 def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
     return (
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
+        .outerjoin(EventData, (Events.data_id == EventData.data_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
@@ -515,8 +828,12 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
 
 def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
-        query.outerjoin(States, (Events.event_id == States.event_id))
+        query.outerjoin(EventData, (Events.data_id == EventData.data_id))
+        .outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -546,7 +863,13 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(
+            # States recorded before schema version 25 have the attributes
+            # in the states table instead of the state_attributes table
+            sqlalchemy.func.coalesce(
+                StateAttributes.shared_attrs, States.attributes, EMPTY_JSON_OBJECT
+            ).contains(UNIT_OF_MEASUREMENT_JSON)
+        ),
     )
 
 
@@ -566,7 +889,11 @@ def _apply_event_entity_id_matchers(events_query, entity_ids):
     return events_query.filter(
         sqlalchemy.or_(
             *(
-                Events.event_data.contains(ENTITY_ID_JSON_TEMPLATE.format(entity_id))
+                # Events recorded before schema version 26 have the data
+                # in the events table instead of the event_data table
+                sqlalchemy.func.coalesce(
+                    EventData.shared_data, Events.event_data, EMPTY_JSON_OBJECT
+                ).contains(ENTITY_ID_JSON_TEMPLATE.format(entity_id))
                 for entity_id in entity_ids
             )
         )
@@ -593,6 +920,20 @@ def _keep_event(hass, event, entities_filter):
     return entities_filter is None or entities_filter(f"{domain}.")
 
 
+def _keep_live_state_change(event, entities_filter):
+    """Filter live state changes like the database query does."""
+    old_state = event.data.get("old_state")
+    new_state = event.data.get("new_state")
+    if old_state is None or new_state is None or old_state.state == new_state.state:
+        return False
+    if (
+        new_state.domain in CONTINUOUS_DOMAINS
+        and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+    ):
+        return False
+    return entities_filter is None or entities_filter(new_state.entity_id)
+
+
 def _augment_data_with_context(
     data, entity_id, event, context_lookup, entity_attr_cache, external_events
 ):
@@ -701,7 +1042,7 @@ class LazyEventPartialState:
         if self._attributes:
             return self._attributes.get(ATTR_ICON)
 
-        result = ICON_JSON_EXTRACT.search(self._row.attributes)
+        result = ICON_JSON_EXTRACT.search(decode_attributes_from_row(self._row))
         return result and result.group(1)
 
     @property
@@ -710,7 +1051,7 @@ class LazyEventPartialState:
         if self._event_data:
             return self._event_data.get(ATTR_ENTITY_ID)
 
-        result = ENTITY_ID_JSON_EXTRACT.search(self._row.event_data)
+        result = ENTITY_ID_JSON_EXTRACT.search(decode_event_data_from_row(self._row))
         return result and result.group(1)
 
     @property
@@ -719,30 +1060,29 @@ class LazyEventPartialState:
         if self._event_data:
             return self._event_data.get(ATTR_DOMAIN)
 
-        result = DOMAIN_JSON_EXTRACT.search(self._row.event_data)
+        result = DOMAIN_JSON_EXTRACT.search(decode_event_data_from_row(self._row))
         return result and result.group(1)
 
     @property
     def attributes(self):
         """State attributes."""
         if not self._attributes:
-            if (
-                self._row.attributes is None
-                or self._row.attributes == EMPTY_JSON_OBJECT
-            ):
+            attributes = decode_attributes_from_row(self._row)
+            if attributes == EMPTY_JSON_OBJECT:
                 self._attributes = {}
             else:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(attributes)
         return self._attributes
 
     @property
     def data(self):
         """Event data."""
         if not self._event_data:
-            if self._row.event_data == EMPTY_JSON_OBJECT:
+            event_data = decode_event_data_from_row(self._row)
+            if event_data == EMPTY_JSON_OBJECT:
                 self._event_data = {}
             else:
-                self._event_data = json.loads(self._row.event_data)
+                self._event_data = json.loads(event_data)
         return self._event_data
 
     @property
@@ -756,6 +1096,76 @@ class LazyEventPartialState:
         return self._time_fired_isoformat
 
 
+class LiveEventPartialState:
+    """A core Event with limited State, for humanifying live events."""
+
+    __slots__ = [
+        "_time_fired",
+        "_time_fired_isoformat",
+        "data",
+        "attributes",
+        "event_type",
+        "entity_id",
+        "state",
+        "domain",
+        "context_id",
+        "context_user_id",
+        "context_parent_id",
+        "time_fired_minute",
+    ]
+
+    def __init__(self, event):
+        """Init the live event."""
+        self._time_fired = event.time_fired
+        self._time_fired_isoformat = None
+        self.data = event.data
+        self.event_type = event.event_type
+        self.context_id = event.context.id
+        self.context_user_id = event.context.user_id
+        self.context_parent_id = event.context.parent_id
+        self.time_fired_minute = event.time_fired.minute
+        if (
+            event.event_type == EVENT_STATE_CHANGED
+            and (new_state := event.data.get("new_state")) is not None
+        ):
+            self.entity_id = new_state.entity_id
+            self.state = new_state.state
+            self.domain = new_state.domain
+            self.attributes = new_state.attributes
+        else:
+            self.entity_id = None
+            self.state = None
+            self.domain = None
+            self.attributes = {}
+
+    @property
+    def attributes_icon(self):
+        """Return the icon from the attributes."""
+        return self.attributes.get(ATTR_ICON)
+
+    @property
+    def data_entity_id(self):
+        """Return the entity id from the data."""
+        entity_id = self.data.get(ATTR_ENTITY_ID)
+        return entity_id if isinstance(entity_id, str) else None
+
+    @property
+    def data_domain(self):
+        """Return the domain from the data."""
+        domain = self.data.get(ATTR_DOMAIN)
+        return domain if isinstance(domain, str) else None
+
+    @property
+    def time_fired_isoformat(self):
+        """Time event was fired in utc isoformat."""
+        if not self._time_fired_isoformat:
+            self._time_fired_isoformat = process_timestamp_to_utc_isoformat(
+                self._time_fired
+            )
+
+        return self._time_fired_isoformat
+
+
 class EntityAttributeCache:
     """A cache to lookup static entity_id attribute.
 
@@ -6,7 +6,7 @@ import logging
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.models import States, with_shared_attrs
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.const import (
     ATTR_TEMPERATURE,
@@ -311,7 +311,7 @@ class Plant(Entity):
         _LOGGER.debug("Initializing values for %s from the database", self._name)
         with session_scope(hass=self.hass) as session:
             query = (
-                session.query(States)
+                with_shared_attrs(session.query(States))
                 .filter(
                     (States.entity_id == entity_id.lower())
                     and (States.last_updated > start_date)
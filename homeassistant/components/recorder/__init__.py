@@ -12,8 +12,9 @@ import queue
 import sqlite3
 import threading
 import time
-from typing import Any
+from typing import Any, cast
 
+from lru import LRU  # pylint: disable=no-name-in-module
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import scoped_session, sessionmaker
@@ -24,6 +25,8 @@ import voluptuous as vol
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    CONF_DOMAINS,
+    CONF_ENTITIES,
     CONF_EXCLUDE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
@@ -35,6 +38,7 @@ from homeassistant.const import (
 from homeassistant.core import CoreState, HomeAssistant, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entityfilter import (
+    CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER,
     convert_include_exclude_filter,
@@ -54,17 +58,22 @@ from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
 from . import history, migration, purge, statistics, websocket_api
+from .bulk_insert import SUPPORTED_DIALECTS as BULK_INSERT_DIALECTS, BulkInserter
 from .const import (
     CONF_DB_INTEGRITY_CHECK,
     DATA_INSTANCE,
     DOMAIN,
+    JOURNAL_FILE,
     MAX_QUEUE_BACKLOG,
     SQLITE_URL_PREFIX,
 )
+from .journal import RecorderJournal
 from .models import (
     Base,
+    EventData,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -126,6 +135,19 @@ KEEPALIVE_TIME = 30
 # States and Events objects
 EXPIRE_AFTER_COMMITS = 120
 
+# The number of attribute ids to cache in memory
+#
+# Based on:
+# - The number of overlapping attributes
+# - How frequently states with overlapping attributes will change
+# - How much memory our low end hardware has
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
+EVENT_DATA_ID_CACHE_SIZE = 2048
+
+# The number of events replayed from the journal before other
+# tasks in the queue get a turn
+JOURNAL_REPLAY_EVENTS = 1000
+
 DB_LOCK_TIMEOUT = 30
 DB_LOCK_QUEUE_CHECK_TIMEOUT = 1
 
@@ -137,6 +159,9 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_RETENTION = "retention"
+CONF_KEEP_DAYS = "keep_days"
 
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
@@ -145,6 +170,17 @@ EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
     {vol.Optional(CONF_EVENT_TYPES): vol.All(cv.ensure_list, [cv.string])}
 )
 
+RETENTION_POLICY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_DOMAINS, default=[]): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_ENTITIES, default=[]): cv.entity_ids,
+        vol.Optional(CONF_ENTITY_GLOBS, default=[]): vol.All(
+            cv.ensure_list, [cv.string]
+        ),
+        vol.Required(CONF_KEEP_DAYS): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
 FILTER_SCHEMA = INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.extend(
     {vol.Optional(CONF_EXCLUDE, default=EXCLUDE_SCHEMA({})): EXCLUDE_SCHEMA}
 )
@@ -165,6 +201,10 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
+                    vol.Optional(CONF_RETENTION, default=[]): vol.All(
+                        cv.ensure_list, [RETENTION_POLICY_SCHEMA]
+                    ),
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -241,6 +281,20 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    bulk_insert = conf[CONF_BULK_INSERT]
+    retention_policies = [
+        purge.RetentionPolicy(
+            generate_filter(
+                policy[CONF_DOMAINS],
+                policy[CONF_ENTITIES],
+                [],
+                [],
+                policy[CONF_ENTITY_GLOBS],
+            ),
+            policy[CONF_KEEP_DAYS],
+        )
+        for policy in conf[CONF_RETENTION]
+    ]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
@@ -263,7 +317,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        bulk_insert=bulk_insert,
+        retention_policies=retention_policies,
     )
+    await hass.async_add_executor_job(instance.journal.load)
     instance.async_initialize()
     instance.start()
     _async_register_services(hass, instance)
@@ -444,6 +501,18 @@ class WaitTask(RecorderTask):
         instance._queue_watch.set()  # pylint: disable=[protected-access]
 
 
+@dataclass
+class CommitTask(RecorderTask):
+    """An object to insert into the recorder queue to commit the pending events."""
+
+    committed: asyncio.Event
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._commit_event_session_or_retry()  # pylint: disable=[protected-access]
+        instance.hass.loop.call_soon_threadsafe(self.committed.set)
+
+
 @dataclass
 class DatabaseLockTask(RecorderTask):
     """An object to insert into the recorder queue to prevent writes to the database."""
@@ -457,6 +526,15 @@ class DatabaseLockTask(RecorderTask):
         instance._lock_database(self)  # pylint: disable=[protected-access]
 
 
+@dataclass
+class JournalReplayTask(RecorderTask):
+    """An object to insert into the recorder queue to replay spilled events."""
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._replay_journal()  # pylint: disable=[protected-access]
+
+
 @dataclass
 class StopTask(RecorderTask):
     """An object to insert into the recorder queue to stop the event handler."""
@@ -494,6 +572,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        bulk_insert: bool,
+        retention_policies: list[purge.RetentionPolicy],
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -502,7 +582,14 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.keep_days = keep_days
         self.commit_interval = commit_interval
+        self.bulk_insert = bulk_insert
+        self.retention_policies = retention_policies
         self.queue: queue.SimpleQueue[RecorderTask] = queue.SimpleQueue()
+        self.journal = RecorderJournal(
+            hass,
+            hass.config.path(JOURNAL_FILE),
+            lambda: self.queue.put(JournalReplayTask()),
+        )
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -520,7 +607,14 @@ class Recorder(threading.Thread):
         self._commits_without_expire = 0
         self._keepalive_count = 0
         self._old_states: dict[str, States] = {}
+        self._state_attributes_ids: LRU = LRU(STATE_ATTRIBUTES_ID_CACHE_SIZE)
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
+        self._event_data_ids: LRU = LRU(EVENT_DATA_ID_CACHE_SIZE)
+        self._pending_event_data: dict[str, EventData] = {}
         self._pending_expunge: list[States] = []
+        self._bulk_inserter: BulkInserter | None = None
+        self._rows_written = 0
+        self._write_seconds = 0.0
         self.event_session = None
         self.get_session = None
         self._completed_first_database_setup = None
@@ -551,12 +645,17 @@ class Recorder(threading.Thread):
     def _async_check_queue(self, *_):
         """Periodic check of the queue size to ensure we do not exaust memory.
 
-        The queue grows during migraton or if something really goes wrong.
+        Events which do not fit in the queue are spilled to the journal,
+        the queue only grows if the journal cannot be written. Time changed
+        events are never spilled, so the queue can grow past the backlog
+        while spilling without exhausting memory.
         """
         size = self.queue.qsize()
         _LOGGER.debug("Recorder queue size is: %s", size)
         if self.queue.qsize() <= MAX_QUEUE_BACKLOG:
             return
+        if self.journal.spilling and not self.journal.failed:
+            return
         _LOGGER.error(
             "The recorder queue reached the maximum size of %s; Events are no longer being recorded",
             MAX_QUEUE_BACKLOG,
@@ -874,7 +973,9 @@ class Recorder(threading.Thread):
             # Notify that lock is being held, wait until database can be used again.
             self.hass.add_job(_async_set_database_locked, task)
             while not task.database_unlock.wait(timeout=DB_LOCK_QUEUE_CHECK_TIMEOUT):
-                if self.queue.qsize() > MAX_QUEUE_BACKLOG * 0.9:
+                # Events are spilled to the journal while the queue is full,
+                # the lock is only given up when the journal cannot be written
+                if self.journal.failed and self.queue.qsize() > MAX_QUEUE_BACKLOG * 0.9:
                     _LOGGER.warning(
                         "Database queue backlog reached more than 90% of maximum queue "
                         "length while waiting for backup to finish; recorder will now "
@@ -889,6 +990,13 @@ class Recorder(threading.Thread):
         )
 
     def _process_one_event(self, event):
+        started = time.monotonic()
+        try:
+            self._process_one_event_or_commit(event)
+        finally:
+            self._write_seconds += time.monotonic() - started
+
+    def _process_one_event_or_commit(self, event):
         if event.event_type == EVENT_TIME_CHANGED:
             self._keepalive_count += 1
             if self._keepalive_count >= KEEPALIVE_TIME:
@@ -904,20 +1012,42 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
 
-        try:
-            if event.event_type == EVENT_STATE_CHANGED:
-                dbevent = Events.from_event(event, event_data="{}")
-            else:
-                dbevent = Events.from_event(event)
-            dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
-        except (TypeError, ValueError):
-            _LOGGER.warning("Event is not JSON serializable: %s", event)
-            return
+        if self._bulk_inserter:
+            self._bulk_inserter.add_event(event)
+        else:
+            self._add_event_to_session(event)
+
+        # If they do not have a commit interval
+        # than we commit right away
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
+    def _add_event_to_session(self, event):
+        """Add the event, and its state for state_changed events, to the session."""
+        dbevent = Events.from_event(event)
+        # The data of state_changed events is stored in the states
+        # and state_attributes tables
+        if event.event_type != EVENT_STATE_CHANGED and event.data:
+            try:
+                dbevent_data = EventData.from_event(event)
+            except (TypeError, ValueError):
+                _LOGGER.warning("Event is not JSON serializable: %s", event)
+                return
+            self._link_event_data(dbevent, dbevent_data)
+        dbevent.created = event.time_fired
+        self.event_session.add(dbevent)
 
         if event.event_type == EVENT_STATE_CHANGED:
             try:
                 dbstate = States.from_event(event)
+                dbstate_attributes = StateAttributes.from_event(event)
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "State is not JSON serializable: %s",
+                    event.data.get("new_state"),
+                )
+            else:
+                self._link_state_attributes(dbstate, dbstate_attributes)
                 has_new_state = event.data.get("new_state")
                 if dbstate.entity_id in self._old_states:
                     old_state = self._old_states.pop(dbstate.entity_id)
@@ -933,16 +1063,84 @@ class Recorder(threading.Thread):
                 if has_new_state:
                     self._old_states[dbstate.entity_id] = dbstate
                     self._pending_expunge.append(dbstate)
-            except (TypeError, ValueError):
-                _LOGGER.warning(
-                    "State is not JSON serializable: %s",
-                    event.data.get("new_state"),
-                )
 
-        # If they do not have a commit interval
-        # than we commit right away
-        if not self.commit_interval:
-            self._commit_event_session_or_retry()
+    def _link_event_data(self, dbevent: Events, dbevent_data: EventData) -> None:
+        """Point the event at a shared event_data row.
+
+        Event data is deduplicated by its json encoding so identical
+        data is only stored once.
+        """
+        shared_data = dbevent_data.shared_data
+        # Matching data found in the pending commit
+        if pending_event_data := self._pending_event_data.get(shared_data):
+            dbevent.event_data_rel = pending_event_data
+        # Matching data id found in the cache
+        elif data_id := self._event_data_ids.get(shared_data):
+            dbevent.data_id = data_id
+        # Matching data found in the database
+        elif data_id := self._find_shared_data_in_db(dbevent_data.hash, shared_data):
+            dbevent.data_id = data_id
+            self._event_data_ids[shared_data] = data_id
+        # No matching data found, save it in the DB
+        else:
+            dbevent.event_data_rel = dbevent_data
+            self._pending_event_data[shared_data] = dbevent_data
+            self.event_session.add(dbevent_data)
+
+    def _link_state_attributes(
+        self, dbstate: States, dbstate_attributes: StateAttributes
+    ) -> None:
+        """Point the state at a shared state_attributes row.
+
+        Attributes are deduplicated by their json encoding so identical
+        attributes are only stored once.
+        """
+        shared_attrs = dbstate_attributes.shared_attrs
+        # Matching attributes found in the pending commit
+        if pending_attributes := self._pending_state_attributes.get(shared_attrs):
+            dbstate.state_attributes = pending_attributes
+        # Matching attributes id found in the cache
+        elif attributes_id := self._state_attributes_ids.get(shared_attrs):
+            dbstate.attributes_id = attributes_id
+        # Matching attributes found in the database
+        elif attributes_id := self._find_shared_attr_in_db(
+            dbstate_attributes.hash, shared_attrs
+        ):
+            dbstate.attributes_id = attributes_id
+            self._state_attributes_ids[shared_attrs] = attributes_id
+        # No matching attributes found, save them in the DB
+        else:
+            dbstate.state_attributes = dbstate_attributes
+            self._pending_state_attributes[shared_attrs] = dbstate_attributes
+            self.event_session.add(dbstate_attributes)
+
+    def _find_shared_data_in_db(self, data_hash: int, shared_data: str) -> int | None:
+        """Find shared event data in the db from the hash and shared_data."""
+        # Do not flush the pending rows; that would start a write
+        # transaction outside of the commit interval
+        with self.event_session.no_autoflush:
+            if event_data := (
+                self.event_session.query(EventData.data_id)
+                .filter(EventData.hash == data_hash)
+                .filter(EventData.shared_data == shared_data)
+                .first()
+            ):
+                return cast(int, event_data[0])
+        return None
+
+    def _find_shared_attr_in_db(self, attr_hash: int, shared_attrs: str) -> int | None:
+        """Find shared attributes in the db from the hash and shared_attrs."""
+        # Do not flush the pending rows; that would start a write
+        # transaction outside of the commit interval
+        with self.event_session.no_autoflush:
+            if attributes := (
+                self.event_session.query(StateAttributes.attributes_id)
+                .filter(StateAttributes.hash == attr_hash)
+                .filter(StateAttributes.shared_attrs == shared_attrs)
+                .first()
+            ):
+                return cast(int, attributes[0])
+        return None
 
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
@@ -956,7 +1154,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self.event_session.new
+            and not self.event_session.dirty
+            and not (self._bulk_inserter and self._bulk_inserter.pending)
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -977,8 +1179,12 @@ class Recorder(threading.Thread):
                 time.sleep(self.db_retry_wait)
 
     def _commit_event_session(self):
-        self._commits_without_expire += 1
+        if self._bulk_inserter and self._bulk_inserter.pending:
+            self._commit_bulk_inserts()
+            return
 
+        self._commits_without_expire += 1
+        self._rows_written += len(self.event_session.new)
         if self._pending_expunge:
             self.event_session.flush()
             for dbstate in self._pending_expunge:
@@ -989,6 +1195,19 @@ class Recorder(threading.Thread):
             self._pending_expunge = []
         self.event_session.commit()
 
+        # We just committed the state attributes to the database
+        # and we now know the attributes_ids. We can save
+        # many selects for matching attributes by loading them
+        # into the LRU cache now.
+        for state_attr in self._pending_state_attributes.values():
+            self._state_attributes_ids[
+                state_attr.shared_attrs
+            ] = state_attr.attributes_id
+        self._pending_state_attributes = {}
+        for event_data in self._pending_event_data.values():
+            self._event_data_ids[event_data.shared_data] = event_data.data_id
+        self._pending_event_data = {}
+
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
         # do it after EXPIRE_AFTER_COMMITS commits
@@ -996,6 +1215,30 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             self.event_session.expire_all()
 
+    def _commit_bulk_inserts(self):
+        """Insert the buffered events and states and commit them."""
+        try:
+            rows = self._bulk_inserter.write(self.event_session)
+            self.event_session.commit()
+        except SQLAlchemyError:
+            # Roll back so the write can be retried
+            self.event_session.rollback()
+            raise
+        self._bulk_inserter.committed()
+        self._rows_written += rows
+
+    @property
+    def using_bulk_insert(self) -> bool:
+        """Return if events and states are inserted with executemany."""
+        return self._bulk_inserter is not None
+
+    @property
+    def rows_per_second(self) -> float | None:
+        """Return the number of rows written per second spent processing events."""
+        if not self._rows_written or not self._write_seconds:
+            return None
+        return self._rows_written / self._write_seconds
+
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
         self._close_event_session()
@@ -1007,6 +1250,12 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._state_attributes_ids.clear()
+        self._pending_state_attributes = {}
+        self._event_data_ids.clear()
+        self._pending_event_data = {}
+        if self._bulk_inserter:
+            self._bulk_inserter.reset()
 
         if not self.event_session:
             return
@@ -1034,9 +1283,26 @@ class Recorder(threading.Thread):
         _LOGGER.debug("Sending keepalive")
         self.event_session.connection().scalar(select([1]))
 
+    def _replay_journal(self):
+        """Replay the next events spilled to the journal."""
+        for event in self.journal.read(JOURNAL_REPLAY_EVENTS):
+            self._process_one_event(event)
+        self._commit_event_session_or_retry()
+        if not self.journal.finish_replay():
+            self.queue.put(JournalReplayTask())
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
+        # Time changed events are never spilled, they keep the keepalive
+        # and the commits going while the journal is replayed
+        if (
+            event.event_type != EVENT_TIME_CHANGED
+            and (self.journal.spilling or self.queue.qsize() >= MAX_QUEUE_BACKLOG)
+            and not self.journal.failed
+            and self.journal.async_spill(event)
+        ):
+            return
         self.queue.put(EventTask(event))
 
     def block_till_done(self):
@@ -1055,6 +1321,12 @@ class Recorder(threading.Thread):
         self.queue.put(WaitTask())
         self._queue_watch.wait()
 
+    async def async_commit(self) -> None:
+        """Wait until the events queued so far have been committed."""
+        committed = asyncio.Event()
+        self.queue.put(CommitTask(committed))
+        await committed.wait()
+
     async def lock_database(self) -> bool:
         """Lock database so it can be backed up safely."""
         if self._database_lock_task:
@@ -1124,6 +1396,17 @@ class Recorder(threading.Thread):
 
         Base.metadata.create_all(self.engine)
         self.get_session = scoped_session(sessionmaker(bind=self.engine))
+
+        self._bulk_inserter = None
+        if self.bulk_insert:
+            if self.engine.dialect.name in BULK_INSERT_DIALECTS:
+                self._bulk_inserter = BulkInserter(self)
+            else:
+                _LOGGER.warning(
+                    "Bulk inserts are not supported with %s, "
+                    "events and states are inserted one by one",
+                    self.engine.dialect.name,
+                )
         _LOGGER.debug("Connected to recorder database")
 
     @property
@@ -1190,6 +1473,7 @@ class Recorder(threading.Thread):
         self.hass.add_job(self._async_stop_queue_watcher_and_event_listener)
         self._end_session()
         self._close_connection()
+        self.journal.close()
 
     @property
     def recording(self):
@@ -0,0 +1,248 @@
+"""Batched bulk inserts of events and states for the recorder."""
+# pylint: disable=protected-access
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm.session import Session
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, split_entity_id
+
+from .models import EventData, Events, StateAttributes, States
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+# The recorder can only assign the primary keys of the events and
+# states itself when inserting an explicit value into an auto increment
+# column also advances it. PostgreSQL sequences are not advanced.
+SUPPORTED_DIALECTS = {"mysql", "sqlite"}
+
+
+class BulkInserter:
+    """Buffer events and states between commits and insert them with executemany.
+
+    The recorder is the only writer of the events and states tables so it
+    assigns their primary keys itself. This links states to their event and
+    to their old state while buffering, without reading back the ids row by
+    row or keeping ORM relationships around.
+    """
+
+    def __init__(self, instance: Recorder) -> None:
+        """Initialize the bulk inserter."""
+        self.instance = instance
+        self._events: list[dict[str, Any]] = []
+        self._states: list[dict[str, Any]] = []
+        # Shared rows which are not in the database yet, keyed by their
+        # json encoding with the hash as value
+        self._pending_event_data: dict[str, int] = {}
+        self._pending_state_attributes: dict[str, int] = {}
+        self._events_with_pending_data: list[tuple[dict[str, Any], str]] = []
+        self._states_with_pending_attributes: list[tuple[dict[str, Any], str]] = []
+        # The ids of the shared rows inserted by the last write
+        self._inserted_ids: tuple[dict[str, int], dict[str, int]] = ({}, {})
+        # The id of the last state of each entity, buffered or in the database
+        self._old_state_ids: dict[str, int] = {}
+        self._next_event_id: int | None = None
+        self._next_state_id: int | None = None
+
+    @property
+    def pending(self) -> bool:
+        """Return if there are buffered rows to insert."""
+        return bool(self._events)
+
+    def add_event(self, event: Event) -> None:
+        """Buffer an event, and its state for state_changed events."""
+        session = self.instance.event_session
+        event_row: dict[str, Any] = {
+            "event_type": event.event_type,
+            "event_data": None,
+            "origin": str(event.origin.value),
+            "time_fired": event.time_fired,
+            "created": event.time_fired,
+            "context_id": event.context.id,
+            "context_user_id": event.context.user_id,
+            "context_parent_id": event.context.parent_id,
+            "data_id": None,
+        }
+        # The data of state_changed events is stored in the states
+        # and state_attributes tables
+        if event.event_type != EVENT_STATE_CHANGED and event.data:
+            try:
+                shared_data = EventData.shared_data_from_event(event)
+            except (TypeError, ValueError):
+                _LOGGER.warning("Event is not JSON serializable: %s", event)
+                return
+            event_row["data_id"] = self._data_id_or_pending(shared_data)
+            if event_row["data_id"] is None:
+                self._events_with_pending_data.append((event_row, shared_data))
+        event_row["event_id"] = self._allocate_event_id(session)
+        self._events.append(event_row)
+
+        if event.event_type != EVENT_STATE_CHANGED:
+            return
+
+        try:
+            shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "State is not JSON serializable: %s", event.data.get("new_state")
+            )
+            return
+
+        entity_id = event.data["entity_id"]
+        state_row: dict[str, Any] = {
+            "state_id": self._allocate_state_id(session),
+            "entity_id": entity_id,
+            "attributes": None,
+            "event_id": event_row["event_id"],
+            "created": event.time_fired,
+            "old_state_id": self._old_state_ids.pop(entity_id, None),
+            "attributes_id": self._attributes_id_or_pending(shared_attrs),
+        }
+        if (state := event.data.get("new_state")) is None:
+            # State got deleted
+            state_row["state"] = ""
+            state_row["domain"] = split_entity_id(entity_id)[0]
+            state_row["last_changed"] = event.time_fired
+            state_row["last_updated"] = event.time_fired
+        else:
+            state_row["state"] = state.state
+            state_row["domain"] = state.domain
+            state_row["last_changed"] = state.last_changed
+            state_row["last_updated"] = state.last_updated
+            self._old_state_ids[entity_id] = state_row["state_id"]
+        if state_row["attributes_id"] is None:
+            self._states_with_pending_attributes.append((state_row, shared_attrs))
+        self._states.append(state_row)
+
+    def write(self, session: Session) -> int:
+        """Insert the buffered rows and return the number of rows inserted.
+
+        The rows are kept until committed is called, so the write can
+        be retried after the transaction has been rolled back.
+        """
+        data_ids = _insert_shared_rows(
+            session, EventData, "shared_data", self._pending_event_data
+        )
+        for event_row, shared_data in self._events_with_pending_data:
+            event_row["data_id"] = data_ids[shared_data]
+        attributes_ids = _insert_shared_rows(
+            session, StateAttributes, "shared_attrs", self._pending_state_attributes
+        )
+        for state_row, shared_attrs in self._states_with_pending_attributes:
+            state_row["attributes_id"] = attributes_ids[shared_attrs]
+
+        session.execute(insert(Events.__table__), self._events)
+        if self._states:
+            session.execute(insert(States.__table__), self._states)
+        self._inserted_ids = (data_ids, attributes_ids)
+        return (
+            len(data_ids) + len(attributes_ids) + len(self._events) + len(self._states)
+        )
+
+    def committed(self) -> None:
+        """Clear the buffer after the inserted rows have been committed."""
+        data_ids, attributes_ids = self._inserted_ids
+        # We now know the ids of the new shared rows and can save
+        # many selects for matching rows by loading them into the
+        # LRU caches of the recorder.
+        instance = self.instance
+        for shared_data, data_id in data_ids.items():
+            instance._event_data_ids[shared_data] = data_id
+        for shared_attrs, attributes_id in attributes_ids.items():
+            instance._state_attributes_ids[shared_attrs] = attributes_id
+        self._clear_buffer()
+
+    def reset(self) -> None:
+        """Drop the buffered rows and everything derived from the database."""
+        self._clear_buffer()
+        self._old_state_ids = {}
+        self._next_event_id = None
+        self._next_state_id = None
+
+    def evict_purged_states(self, purged_state_ids: set[int]) -> None:
+        """Stop using purged states as old state of new states."""
+        for entity_id, state_id in list(self._old_state_ids.items()):
+            if state_id in purged_state_ids:
+                del self._old_state_ids[entity_id]
+
+    def _clear_buffer(self) -> None:
+        """Clear the buffered rows."""
+        self._events = []
+        self._states = []
+        self._pending_event_data = {}
+        self._pending_state_attributes = {}
+        self._events_with_pending_data = []
+        self._states_with_pending_attributes = []
+        self._inserted_ids = ({}, {})
+
+    def _allocate_event_id(self, session: Session) -> int:
+        """Return the id for the next event."""
+        if self._next_event_id is None:
+            self._next_event_id = _max_id(session, Events.event_id) + 1
+        event_id = self._next_event_id
+        self._next_event_id += 1
+        return event_id
+
+    def _allocate_state_id(self, session: Session) -> int:
+        """Return the id for the next state."""
+        if self._next_state_id is None:
+            self._next_state_id = _max_id(session, States.state_id) + 1
+        state_id = self._next_state_id
+        self._next_state_id += 1
+        return state_id
+
+    def _data_id_or_pending(self, shared_data: str) -> int | None:
+        """Return the id of matching shared event data, None if it is pending."""
+        if shared_data in self._pending_event_data:
+            return None
+        instance = self.instance
+        if data_id := instance._event_data_ids.get(shared_data):
+            return data_id
+        data_hash = EventData.hash_shared_data(shared_data)
+        if data_id := instance._find_shared_data_in_db(data_hash, shared_data):
+            instance._event_data_ids[shared_data] = data_id
+            return data_id
+        self._pending_event_data[shared_data] = data_hash
+        return None
+
+    def _attributes_id_or_pending(self, shared_attrs: str) -> int | None:
+        """Return the id of matching shared attributes, None if they are pending."""
+        if shared_attrs in self._pending_state_attributes:
+            return None
+        instance = self.instance
+        if attributes_id := instance._state_attributes_ids.get(shared_attrs):
+            return attributes_id
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        if attributes_id := instance._find_shared_attr_in_db(attr_hash, shared_attrs):
+            instance._state_attributes_ids[shared_attrs] = attributes_id
+            return attributes_id
+        self._pending_state_attributes[shared_attrs] = attr_hash
+        return None
+
+
+def _max_id(session: Session, column: Any) -> int:
+    """Return the highest id in use for a primary key column."""
+    return session.execute(select(func.max(column))).scalar() or 0
+
+
+def _insert_shared_rows(
+    session: Session, table: Any, column: str, pending: dict[str, int]
+) -> dict[str, int]:
+    """Insert new shared rows and return their ids.
+
+    Thanks to the deduplication there are only a few new shared rows per
+    commit, so they are inserted one by one to get their ids back.
+    """
+    return {
+        shared: session.execute(
+            insert(table.__table__).values({"hash": shared_hash, column: shared})
+        ).inserted_primary_key[0]
+        for shared, shared_hash in pending.items()
+    }
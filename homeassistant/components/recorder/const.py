@@ -8,6 +8,9 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 MAX_QUEUE_BACKLOG = 30000
 
+# Events which do not fit in the queue are spilled to this file
+JOURNAL_FILE = "home-assistant_v2.recorder-journal"
+
 # The maximum number of rows (events) we purge in one delete statement
 
 # sqlite3 has a limit of 999 until version 3.32.0
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 from itertools import groupby
+import json
 import logging
 import time
 
@@ -13,7 +14,14 @@ from homeassistant.components import recorder
 from homeassistant.core import split_entity_id
 import homeassistant.util.dt as dt_util
 
-from .models import LazyState, States, process_timestamp_to_utc_isoformat
+from .models import (
+    LazyState,
+    StateAttributes,
+    States,
+    decode_attributes_from_row,
+    process_timestamp_to_utc_isoformat,
+    process_timestamp_to_utc_timestamp,
+)
 from .util import execute, session_scope
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
@@ -22,6 +30,9 @@ _LOGGER = logging.getLogger(__name__)
 
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
+ENTITY_ID_KEY = "entity_id"
+LAST_UPDATED_KEY = "last_updated"
+ATTRIBUTES_KEY = "attributes"
 
 SIGNIFICANT_DOMAINS = (
     "climate",
@@ -46,10 +57,14 @@ QUERY_STATES = [
     States.attributes,
     States.last_changed,
     States.last_updated,
+    StateAttributes.shared_attrs,
 ]
 
 HISTORY_BAKERY = "recorder_history_bakery"
 
+# The number of rows fetched at a time when streaming states
+STREAM_BATCH_SIZE = 1000
+
 
 def async_setup(hass):
     """Set up the history hooks."""
@@ -72,6 +87,7 @@ def get_significant_states_with_session(
     include_start_time_state=True,
     significant_changes_only=True,
     minimal_response=False,
+    columnar=False,
 ):
     """
     Return states changes during UTC period start_time - end_time.
@@ -84,12 +100,112 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    With columnar the states of each entity are returned as parallel
+    lists, see _entity_columns.
     """
     timer_start = time.perf_counter()
 
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
+    )
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return (_sorted_states_to_columns if columnar else _sorted_states_to_dict)(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+    )
+
+
+def stream_significant_states_with_session(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+    columnar=False,
+):
+    """Yield the significant state changes of one entity at a time.
+
+    Takes the same arguments as get_significant_states_with_session, but
+    the rows are fetched from a server side cursor in batches, so only the
+    states of a single entity are held in memory.
+
+    The entities are yielded in the order of the database, the entities
+    which only have a state at start_time come last.
+    """
+    initial_states = {}
+    if include_start_time_state:
+        initial_states = {
+            state.entity_id: state
+            for state in _get_initial_states(
+                hass, session, start_time, entity_ids, filters
+            )
+        }
+
+    states = _significant_states_query(
+        hass,
+        session,
+        start_time,
+        end_time,
+        entity_ids,
+        filters,
+        significant_changes_only,
+    ).with_post_criteria(lambda q: q.yield_per(STREAM_BATCH_SIZE))
+
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        initial_state = initial_states.pop(ent_id, None)
+        if columnar:
+            yield _entity_columns(ent_id, group, initial_state, minimal_response)
+            continue
+        ent_results = [] if initial_state is None else [initial_state]
+        _append_entity_states(ent_results, ent_id, group, minimal_response)
+        yield ent_results
+
+    for ent_id, initial_state in initial_states.items():
+        if columnar:
+            yield _entity_columns(ent_id, (), initial_state, minimal_response)
+        else:
+            yield [initial_state]
+
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+):
+    """Return the query for the significant states, sorted by entity_id."""
     baked_query = hass.data[HISTORY_BAKERY](
         lambda session: session.query(*QUERY_STATES)
     )
+    baked_query += lambda q: q.outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
 
     if significant_changes_only:
         baked_query += lambda q: q.filter(
@@ -116,25 +232,8 @@ def get_significant_states_with_session(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
-    )
-
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
-
-    return _sorted_states_to_dict(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
 
@@ -144,6 +243,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
         baked_query = hass.data[HISTORY_BAKERY](
             lambda session: session.query(*QUERY_STATES)
         )
+        baked_query += lambda q: q.outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -156,7 +258,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -180,10 +284,15 @@ def get_last_state_changes(hass, number_of_states, entity_id):
         baked_query = hass.data[HISTORY_BAKERY](
             lambda session: session.query(*QUERY_STATES)
         )
+        baked_query += lambda q: q.outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        )
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -243,7 +352,9 @@ def _get_states_with_session(
 
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
 
     if entity_ids:
         # We got an include-list of entities, accelerate the query by filtering already
@@ -311,6 +422,9 @@ def _get_single_entity_states_with_session(hass, session, utc_point_in_time, ent
     baked_query = hass.data[HISTORY_BAKERY](
         lambda session: session.query(*QUERY_STATES)
     )
+    baked_query += lambda q: q.outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -355,63 +469,185 @@ def _sorted_states_to_dict(
     # Get the states at the start time
     timer_start = time.perf_counter()
     if include_start_time_state:
-        run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
+        for state in _get_initial_states(
+            hass, session, start_time, entity_ids, filters
         ):
-            state.last_changed = start_time
-            state.last_updated = start_time
             result[state.entity_id].append(state)
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
+    # Append all changes to it
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        _append_entity_states(result[ent_id], ent_id, group, minimal_response)
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _get_initial_states(hass, session, start_time, entity_ids, filters):
+    """Return the states at start_time, moved to start_time."""
+    run = recorder.run_information_from_instance(hass, start_time)
+    states = _get_states_with_session(
+        hass, session, start_time, entity_ids, run=run, filters=filters
+    )
+    for state in states:
+        state.last_changed = start_time
+        state.last_updated = start_time
+    return states
+
+
+def _append_entity_states(ent_results, ent_id, group, minimal_response):
+    """Append the states of one entity from the sorted SQL results."""
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(LazyState(db_state) for db_state in group)
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        ent_results.append(LazyState(next(group)))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
     # Called in a tight loop so cache the function
     # here
     _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
 
-    # Append all changes to it
-    for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    db_state.last_changed
+                ),
+            }
+        )
+        prev_state = db_state
+
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
+
+
+def _sorted_states_to_columns(
+    hass,
+    session,
+    states,
+    start_time,
+    entity_ids,
+    filters=None,
+    include_start_time_state=True,
+    minimal_response=False,
+):
+    """Convert SQL results into a columnar JSON friendly data structure.
+
+    Like _sorted_states_to_dict, but the states of each entity are
+    converted by _entity_columns.
+    """
+    initial_states = {}
+    if include_start_time_state:
+        initial_states = {
+            state.entity_id: state
+            for state in _get_initial_states(
+                hass, session, start_time, entity_ids, filters
             )
-            prev_state = db_state
+        }
+
+    # Keep the order of the entity ids, then of the states at the start time
+    order = {ent_id: None for ent_id in entity_ids or ()}
+    order.update(dict.fromkeys(initial_states))
+    result = {}
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        result[ent_id] = _entity_columns(
+            ent_id, group, initial_states.pop(ent_id, None), minimal_response
+        )
+    for ent_id, initial_state in initial_states.items():
+        result[ent_id] = _entity_columns(ent_id, (), initial_state, minimal_response)
 
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+    return {
+        ent_id: result.pop(ent_id) for ent_id in [*order, *result] if ent_id in result
+    }
 
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+
+def _entity_columns(ent_id, group, initial_state, minimal_response):
+    """Convert the states of one entity to parallel lists.
+
+    The states are converted straight from the rows with the last_updated
+    timestamps as UTC epoch floats. The attributes are only given when they
+    differ from the previous state and are None otherwise. last_changed
+    is the last_updated of the last change of the state.
+
+    With minimal response states which do not change the state are left
+    out and only the first state has attributes.
+    """
+    states = []
+    last_updated = []
+    attributes = []
+    prev_state = None
+    prev_attributes = None
+    prev_raw_attributes = None
+
+    if initial_state is not None:
+        prev_state = initial_state.state
+        prev_attributes = initial_state.attributes
+        states.append(prev_state)
+        last_updated.append(initial_state.last_updated.timestamp())
+        attributes.append(prev_attributes)
+
+    # Called in a tight loop so cache the functions
+    # here
+    _decode_attributes_from_row = decode_attributes_from_row
+    _process_timestamp_to_utc_timestamp = process_timestamp_to_utc_timestamp
+    need_attributes = (
+        not minimal_response or split_entity_id(ent_id)[0] in NEED_ATTRIBUTE_DOMAINS
+    )
+
+    for db_state in group:
+        state = db_state.state or ""
+        if not need_attributes and state == prev_state:
+            continue
+        states.append(state)
+        last_updated.append(_process_timestamp_to_utc_timestamp(db_state.last_updated))
+        prev_state = state
+
+        if not need_attributes and attributes:
+            attributes.append(None)
+            continue
+        # Only decode the attributes when their json changes
+        raw_attributes = _decode_attributes_from_row(db_state)
+        if raw_attributes == prev_raw_attributes:
+            attributes.append(None)
+            continue
+        prev_raw_attributes = raw_attributes
+        try:
+            decoded_attributes = json.loads(raw_attributes)
+        except ValueError:
+            # When json.loads fails
+            _LOGGER.exception("Error converting row to state attributes: %s", db_state)
+            decoded_attributes = {}
+        attributes.append(
+            None if decoded_attributes == prev_attributes else decoded_attributes
+        )
+        prev_attributes = decoded_attributes
+
+    return {
+        ENTITY_ID_KEY: ent_id,
+        STATE_KEY: states,
+        LAST_UPDATED_KEY: last_updated,
+        ATTRIBUTES_KEY: attributes,
+    }
 
 
 def get_state(hass, utc_point_in_time, entity_id, run=None):
@@ -0,0 +1,215 @@
+"""Append-only journal for events the recorder queue cannot hold."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import json
+import logging
+import os
+import threading
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    Context,
+    Event,
+    EventOrigin,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.json import JSONEncoder
+import homeassistant.util.dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RecorderJournal:
+    """Spill events to an append-only file while the recorder queue is full.
+
+    Once the journal is in use every new event is appended to it, so the
+    events keep their order. The recorder replays the journal in chunks
+    when it has caught up and stops spilling when the journal is exhausted.
+
+    Events are appended from the executor, never from the event loop. The
+    read position is only kept in memory; events replayed before a crash
+    are replayed again on the next start.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, path: str, queue_replay: Callable[[], None]
+    ) -> None:
+        """Initialize the journal."""
+        self.hass = hass
+        self.path = path
+        self.spilling = False
+        self.failed = False
+        self._queue_replay = queue_replay
+        self._replay_queued = False
+        # Events waiting to be appended to the journal file
+        self._pending: list[Event] = []
+        self._flush_scheduled = False
+        self._pending_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._read_offset = 0
+        # Set when there are no spilled events left to replay
+        self.replayed = threading.Event()
+        self.replayed.set()
+
+    def load(self) -> None:
+        """Start spilling if the previous run left events in the journal."""
+        if os.path.exists(self.path) and os.path.getsize(self.path):
+            _LOGGER.warning("Replaying the events left in %s", self.path)
+            self.spilling = True
+            self.replayed.clear()
+            self._replay_queued = True
+            self._queue_replay()
+
+    @callback
+    def async_spill(self, event: Event) -> bool:
+        """Add an event to the journal, start spilling if needed.
+
+        Returns False if the journal cannot be written and the event
+        must be queued.
+        """
+        with self._pending_lock:
+            if self.failed:
+                return False
+            if not self.spilling:
+                _LOGGER.warning(
+                    "The recorder queue is full; events are written to %s "
+                    "until the database catches up",
+                    self.path,
+                )
+                self.spilling = True
+                self.replayed.clear()
+            self._pending.append(event)
+            if self._flush_scheduled:
+                return True
+            self._flush_scheduled = True
+        self.hass.async_add_executor_job(self.flush)
+        return True
+
+    def flush(self) -> None:
+        """Append the pending events to the journal file and queue a replay."""
+        with self._file_lock:
+            with self._pending_lock:
+                events = self._pending
+                self._pending = []
+                self._flush_scheduled = False
+            lines = []
+            for event in events:
+                try:
+                    lines.append(json.dumps(event.as_dict(), cls=JSONEncoder) + "\n")
+                except (TypeError, ValueError):
+                    _LOGGER.warning("Event is not JSON serializable: %s", event)
+            try:
+                with open(self.path, "a", encoding="utf8") as journal:
+                    journal.writelines(lines)
+            except OSError as err:
+                _LOGGER.error(
+                    "Error writing to %s; %s events were lost and events are "
+                    "no longer spilled: %s",
+                    self.path,
+                    len(lines),
+                    err,
+                )
+                with self._pending_lock:
+                    self.failed = True
+        with self._pending_lock:
+            if self._replay_queued:
+                return
+            self._replay_queued = True
+        self._queue_replay()
+
+    def read(self, max_events: int) -> list[Event]:
+        """Read the next events to replay from the journal file."""
+        events: list[Event] = []
+        with self._file_lock:
+            try:
+                with open(self.path, "rb") as journal:
+                    journal.seek(self._read_offset)
+                    while len(events) < max_events and (line := journal.readline()):
+                        self._read_offset += len(line)
+                        try:
+                            events.append(_event_from_dict(json.loads(line)))
+                        except (KeyError, TypeError, ValueError):
+                            _LOGGER.warning("Skipping invalid journal line: %s", line)
+            except FileNotFoundError:
+                pass
+            except OSError as err:
+                _LOGGER.error("Error reading %s: %s", self.path, err)
+        return events
+
+    def finish_replay(self) -> bool:
+        """Stop spilling if every event in the journal has been replayed.
+
+        Returns False if there are events left to replay, the caller
+        must queue the next replay.
+        """
+        with self._file_lock, self._pending_lock:
+            if self._unread_size():
+                return False
+            if self._pending:
+                # The replay is queued again once they are flushed
+                self._replay_queued = False
+                return True
+            self._remove()
+            self.spilling = False
+            self.failed = False
+            self._replay_queued = False
+            self.replayed.set()
+        _LOGGER.info("All events in %s have been replayed", self.path)
+        return True
+
+    def close(self) -> None:
+        """Keep the events which have not been replayed for the next run."""
+        if not self.spilling:
+            return
+        self.flush()
+        with self._file_lock:
+            if not self._read_offset:
+                return
+            try:
+                with open(self.path, "rb") as journal:
+                    journal.seek(self._read_offset)
+                    remaining = journal.read()
+                with open(self.path, "wb") as journal:
+                    journal.write(remaining)
+            except OSError as err:
+                _LOGGER.error("Error compacting %s: %s", self.path, err)
+            self._read_offset = 0
+
+    def _unread_size(self) -> int:
+        """Return the number of bytes in the journal file not read yet."""
+        try:
+            return os.path.getsize(self.path) - self._read_offset
+        except FileNotFoundError:
+            return 0
+
+    def _remove(self) -> None:
+        """Remove the journal file."""
+        self._read_offset = 0
+        try:
+            os.unlink(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            _LOGGER.error("Error removing %s: %s", self.path, err)
+
+
+def _event_from_dict(event_dict: dict[str, Any]) -> Event:
+    """Restore an event written to the journal."""
+    data = event_dict["data"]
+    if event_dict["event_type"] == EVENT_STATE_CHANGED:
+        data = {
+            **data,
+            "old_state": State.from_dict(data.get("old_state")),
+            "new_state": State.from_dict(data.get("new_state")),
+        }
+    return Event(
+        event_dict["event_type"],
+        data,
+        EventOrigin(event_dict["origin"]),
+        dt_util.parse_datetime(event_dict["time_fired"]),
+        Context(**event_dict["context"]),
+    )
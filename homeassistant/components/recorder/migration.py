@@ -3,6 +3,7 @@ import contextlib
 from datetime import timedelta
 import logging
 
+from lru import LRU  # pylint: disable=no-name-in-module
 import sqlalchemy
 from sqlalchemy import ForeignKeyConstraint, MetaData, Table, func, text
 from sqlalchemy.exc import (
@@ -14,11 +15,16 @@ from sqlalchemy.exc import (
 from sqlalchemy.schema import AddConstraint, DropConstraint
 from sqlalchemy.sql.expression import true
 
+from .const import MAX_ROWS_TO_PURGE
 from .models import (
     SCHEMA_VERSION,
     TABLE_STATES,
     Base,
+    EventData,
+    Events,
     SchemaChanges,
+    StateAttributes,
+    States,
     Statistics,
     StatisticsMeta,
     StatisticsRuns,
@@ -30,6 +36,10 @@ from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# The number of shared attributes and event data to remember while
+# moving existing rows to the state_attributes and event_data tables
+SHARED_ROWS_MIGRATION_CACHE_SIZE = 2048
+
 
 def raise_if_exception_missing_str(ex, match_substrs):
     """Raise an exception if the exception and cause do not contain the match substrs."""
@@ -604,10 +614,131 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
             "ix_statistics_short_term_statistic_id_start",
         )
 
+    elif new_version == 25:
+        # Attributes are now stored deduplicated in the state_attributes table
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+        _migrate_states_to_shared_attributes(session)
+    elif new_version == 26:
+        # Event data is now stored deduplicated in the event_data table
+        _add_columns(connection, "events", ["data_id INTEGER"])
+        _create_index(connection, "events", "ix_events_data_id")
+        _migrate_events_to_shared_data(session)
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
 
+def _migrate_states_to_shared_attributes(session):
+    """Move the attributes of existing states to the state_attributes table.
+
+    The states are processed in batches which are committed as they are
+    finished so the migration can resume where it left off if interrupted.
+    """
+    _LOGGER.warning(
+        "Moving state attributes to the state_attributes table. Note: this can "
+        "take several minutes on large databases and slow computers. Please "
+        "be patient!"
+    )
+    attributes_ids = LRU(SHARED_ROWS_MIGRATION_CACHE_SIZE)
+    migrated = 0
+    while states := (
+        session.query(States.state_id, States.attributes)
+        .filter(States.attributes_id.is_(None))
+        .filter(States.attributes.isnot(None))
+        .limit(MAX_ROWS_TO_PURGE)
+        .all()
+    ):
+        state_ids_by_attributes: dict[str, list[int]] = {}
+        for state_id, shared_attrs in states:
+            state_ids_by_attributes.setdefault(shared_attrs, []).append(state_id)
+
+        for shared_attrs, state_ids in state_ids_by_attributes.items():
+            if (attributes_id := attributes_ids.get(shared_attrs)) is None:
+                attributes_id = _get_or_create_shared_attributes_id(
+                    session, shared_attrs
+                )
+                attributes_ids[shared_attrs] = attributes_id
+            session.query(States).filter(States.state_id.in_(state_ids)).update(
+                {"attributes_id": attributes_id, "attributes": None},
+                synchronize_session=False,
+            )
+
+        session.commit()
+        migrated += len(states)
+        _LOGGER.debug("Moved the attributes of %s states", migrated)
+
+
+def _migrate_events_to_shared_data(session):
+    """Move the data of existing events to the event_data table.
+
+    Events without data, which includes all state_changed events,
+    are left as they are.
+    """
+    _LOGGER.warning(
+        "Moving event data to the event_data table. Note: this can "
+        "take several minutes on large databases and slow computers. Please "
+        "be patient!"
+    )
+    data_ids = LRU(SHARED_ROWS_MIGRATION_CACHE_SIZE)
+    migrated = 0
+    while events := (
+        session.query(Events.event_id, Events.event_data)
+        .filter(Events.data_id.is_(None))
+        .filter(Events.event_data.isnot(None))
+        .filter(Events.event_data != "{}")
+        .limit(MAX_ROWS_TO_PURGE)
+        .all()
+    ):
+        event_ids_by_data: dict[str, list[int]] = {}
+        for event_id, shared_data in events:
+            event_ids_by_data.setdefault(shared_data, []).append(event_id)
+
+        for shared_data, event_ids in event_ids_by_data.items():
+            if (data_id := data_ids.get(shared_data)) is None:
+                data_id = _get_or_create_shared_data_id(session, shared_data)
+                data_ids[shared_data] = data_id
+            session.query(Events).filter(Events.event_id.in_(event_ids)).update(
+                {"data_id": data_id, "event_data": None},
+                synchronize_session=False,
+            )
+
+        session.commit()
+        migrated += len(events)
+        _LOGGER.debug("Moved the data of %s events", migrated)
+
+
+def _get_or_create_shared_data_id(session, shared_data):
+    """Return the id of the event_data row matching shared_data."""
+    data_hash = EventData.hash_shared_data(shared_data)
+    if event_data := (
+        session.query(EventData.data_id)
+        .filter(EventData.hash == data_hash)
+        .filter(EventData.shared_data == shared_data)
+        .first()
+    ):
+        return event_data[0]
+    dbdata = EventData(hash=data_hash, shared_data=shared_data)
+    session.add(dbdata)
+    session.flush()
+    return dbdata.data_id
+
+
+def _get_or_create_shared_attributes_id(session, shared_attrs):
+    """Return the id of the state_attributes row matching shared_attrs."""
+    attributes_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+    if attributes := (
+        session.query(StateAttributes.attributes_id)
+        .filter(StateAttributes.hash == attributes_hash)
+        .filter(StateAttributes.shared_attrs == shared_attrs)
+        .first()
+    ):
+        return attributes[0]
+    dbattributes = StateAttributes(hash=attributes_hash, shared_attrs=shared_attrs)
+    session.add(dbattributes)
+    session.flush()
+    return dbattributes.attributes_id
+
+
 def _inspect_schema_version(engine, session):
     """Determine the schema version by inspecting the db structure.
 
@@ -4,9 +4,11 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 import json
 import logging
-from typing import TypedDict, overload
+from typing import TypedDict, cast, overload
 
+from fnvhash import fnv1a_32
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -21,7 +23,13 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects import mysql, oracle, postgresql
 from sqlalchemy.ext.declarative import declared_attr
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import (
+    Query,
+    declarative_base,
+    query_expression,
+    relationship,
+    with_expression,
+)
 from sqlalchemy.orm.session import Session
 
 from homeassistant.const import (
@@ -40,14 +48,16 @@ import homeassistant.util.dt as dt_util
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 24
+SCHEMA_VERSION = 26
 
 _LOGGER = logging.getLogger(__name__)
 
 DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
+TABLE_EVENT_DATA = "event_data"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
@@ -57,7 +67,9 @@ TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
 
 ALL_TABLES = [
     TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
     TABLE_EVENTS,
+    TABLE_EVENT_DATA,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
     TABLE_STATISTICS,
@@ -96,23 +108,31 @@ class Events(Base):  # type: ignore
     context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
     context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
     context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
+    data_id = Column(Integer, ForeignKey("event_data.data_id"), index=True)
+    event_data_rel = relationship("EventData")
+    # Selected by with_shared_data
+    shared_data = query_expression()
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
         return (
             f"<recorder.Events("
             f"id={self.event_id}, type='{self.event_type}', data='{self.event_data}', "
-            f"origin='{self.origin}', time_fired='{self.time_fired}'"
+            f"origin='{self.origin}', time_fired='{self.time_fired}', "
+            f"data_id={self.data_id}"
             f")>"
         )
 
     @staticmethod
-    def from_event(event, event_data=None):
-        """Create an event database object from a native event."""
+    def from_event(event):
+        """Create an event database object from a native event.
+
+        The event data is stored in the event_data table,
+        see EventData.from_event.
+        """
         return Events(
             event_type=event.event_type,
-            event_data=event_data
-            or json.dumps(event.data, cls=JSONEncoder, separators=(",", ":")),
+            event_data=None,
             origin=str(event.origin.value),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -127,10 +147,18 @@ class Events(Base):  # type: ignore
             user_id=self.context_user_id,
             parent_id=self.context_parent_id,
         )
+        event_data = self.event_data
+        if not event_data and self.data_id is not None:
+            # Events recorded after schema version 26 keep their data in
+            # the event_data table, queries should select it with
+            # with_shared_data instead of loading it one event at a time
+            event_data = self.shared_data
+            if event_data is None and self.event_data_rel:
+                event_data = self.event_data_rel.shared_data
         try:
             return Event(
                 self.event_type,
-                json.loads(self.event_data),
+                json.loads(event_data) if event_data else {},
                 EventOrigin(self.origin),
                 process_timestamp(self.time_fired),
                 context=context,
@@ -141,6 +169,53 @@ class Events(Base):  # type: ignore
             return None
 
 
+class EventData(Base):  # type: ignore
+    """Event data history."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_EVENT_DATA
+    data_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    # Note that this is not named event_data to avoid confusion with the events table
+    shared_data = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.EventData("
+            f"id={self.data_id}, hash='{self.hash}', data='{self.shared_data}'"
+            f")>"
+        )
+
+    @staticmethod
+    def from_event(event):
+        """Create object from an event."""
+        dbdata = EventData(shared_data=EventData.shared_data_from_event(event))
+        dbdata.hash = EventData.hash_shared_data(dbdata.shared_data)
+        return dbdata
+
+    @staticmethod
+    def shared_data_from_event(event) -> str:
+        """Return the json encoded shared data of an event."""
+        return json.dumps(event.data, cls=JSONEncoder, separators=(",", ":"))
+
+    @staticmethod
+    def hash_shared_data(shared_data: str) -> int:
+        """Return the hash of json encoded shared data."""
+        return cast(int, fnv1a_32(shared_data.encode("utf-8")))
+
+    def to_native(self):
+        """Convert to an event data dictionary."""
+        try:
+            return json.loads(self.shared_data)
+        except ValueError:
+            # When json.loads fails
+            _LOGGER.exception("Error converting row to event data: %s", self)
+            return {}
+
+
 class States(Base):  # type: ignore
     """State change history."""
 
@@ -163,8 +238,14 @@ class States(Base):  # type: ignore
     last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
     created = Column(DATETIME_TYPE, default=dt_util.utcnow)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
     event = relationship("Events", uselist=False)
     old_state = relationship("States", remote_side=[state_id])
+    state_attributes = relationship("StateAttributes")
+    # Selected by with_shared_attrs
+    shared_attrs = query_expression()
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -173,31 +254,31 @@ class States(Base):  # type: ignore
             f"id={self.state_id}, domain='{self.domain}', entity_id='{self.entity_id}', "
             f"state='{self.state}', event_id='{self.event_id}', "
             f"last_updated='{self.last_updated.isoformat(sep=' ', timespec='seconds')}', "
-            f"old_state_id={self.old_state_id}"
+            f"old_state_id={self.old_state_id}, attributes_id={self.attributes_id}"
             f")>"
         )
 
     @staticmethod
     def from_event(event):
-        """Create object from a state_changed event."""
+        """Create object from a state_changed event.
+
+        The attributes are stored in the state_attributes table,
+        see StateAttributes.from_event.
+        """
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
 
-        dbstate = States(entity_id=entity_id)
+        dbstate = States(entity_id=entity_id, attributes=None)
 
         # State got deleted
         if state is None:
             dbstate.state = ""
             dbstate.domain = split_entity_id(entity_id)[0]
-            dbstate.attributes = "{}"
             dbstate.last_changed = event.time_fired
             dbstate.last_updated = event.time_fired
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(
-                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
-            )
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -205,11 +286,20 @@ class States(Base):  # type: ignore
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        attributes = self.attributes
+        if not attributes and self.attributes_id is not None:
+            # States recorded after schema version 25 keep their
+            # attributes in the state_attributes table, queries should
+            # select them with with_shared_attrs instead of loading
+            # them one state at a time
+            attributes = self.shared_attrs
+            if attributes is None and self.state_attributes:
+                attributes = self.state_attributes.shared_attrs
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
+                json.loads(attributes) if attributes else {},
                 process_timestamp(self.last_changed),
                 process_timestamp(self.last_updated),
                 # Join the events table on event_id to get the context instead
@@ -223,6 +313,59 @@ class States(Base):  # type: ignore
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history."""
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    # Note that this is not named attributes to avoid confusion with the states table
+    shared_attrs = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StateAttributes("
+            f"id={self.attributes_id}, hash='{self.hash}', attributes='{self.shared_attrs}'"
+            f")>"
+        )
+
+    @staticmethod
+    def from_event(event):
+        """Create object from a state_changed event."""
+        dbstate = StateAttributes(
+            shared_attrs=StateAttributes.shared_attrs_from_event(event)
+        )
+        dbstate.hash = StateAttributes.hash_shared_attrs(dbstate.shared_attrs)
+        return dbstate
+
+    @staticmethod
+    def shared_attrs_from_event(event) -> str:
+        """Return the json encoded shared attributes of a state_changed event."""
+        if (state := event.data.get("new_state")) is None:
+            return "{}"
+        return json.dumps(
+            dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
+        )
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs: str) -> int:
+        """Return the hash of json encoded shared attributes."""
+        return cast(int, fnv1a_32(shared_attrs.encode("utf-8")))
+
+    def to_native(self):
+        """Convert to a state attributes dictionary."""
+        try:
+            return json.loads(self.shared_attrs)
+        except ValueError:
+            # When json.loads fails
+            _LOGGER.exception("Error converting row to state attributes: %s", self)
+            return {}
+
+
 class StatisticResult(TypedDict):
     """Statistic result data class.
 
@@ -468,6 +611,65 @@ def process_timestamp_to_utc_isoformat(ts: datetime | None) -> str | None:
     return ts.astimezone(dt_util.UTC).isoformat()
 
 
+@overload
+def process_timestamp_to_utc_timestamp(ts: None) -> None:
+    ...
+
+
+@overload
+def process_timestamp_to_utc_timestamp(ts: datetime) -> float:
+    ...
+
+
+def process_timestamp_to_utc_timestamp(ts: datetime | None) -> float | None:
+    """Process a timestamp into a UTC epoch timestamp."""
+    if ts is None:
+        return None
+    if ts.tzinfo is None:
+        return ts.replace(tzinfo=dt_util.UTC).timestamp()
+    return ts.timestamp()
+
+
+def with_shared_attrs(query: Query) -> Query:
+    """Select the shared attributes of the states of a query.
+
+    States.to_native uses them instead of loading the state_attributes
+    relationship of each state.
+    """
+    return query.outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    ).options(with_expression(States.shared_attrs, StateAttributes.shared_attrs))
+
+
+def with_shared_data(query: Query) -> Query:
+    """Select the shared data of the events of a query.
+
+    Events.to_native uses it instead of loading the event_data
+    relationship of each event.
+    """
+    return query.outerjoin(EventData, Events.data_id == EventData.data_id).options(
+        with_expression(Events.shared_data, EventData.shared_data)
+    )
+
+
+def decode_event_data_from_row(row) -> str:
+    """Return the json encoded data of a row joined with event_data.
+
+    Events recorded before schema version 26 which have not been migrated
+    yet still carry the data in the events table.
+    """
+    return getattr(row, "shared_data", None) or row.event_data or "{}"
+
+
+def decode_attributes_from_row(row) -> str:
+    """Return the json encoded attributes of a row joined with state_attributes.
+
+    States recorded before schema version 25 which have not been migrated
+    yet still carry the attributes in the states table.
+    """
+    return getattr(row, "shared_attrs", None) or row.attributes or "{}"
+
+
 class LazyState(State):
     """A lazy version of core State."""
 
@@ -490,13 +692,14 @@ class LazyState(State):
         self._last_changed = None
         self._last_updated = None
         self._context = None
+        self._as_dict_json = None
 
     @property  # type: ignore
     def attributes(self):
         """State attributes."""
         if not self._attributes:
             try:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(decode_attributes_from_row(self._row))
             except ValueError:
                 # When json.loads fails
                 _LOGGER.exception("Error converting row to state: %s", self._row)
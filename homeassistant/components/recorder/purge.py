@@ -2,16 +2,30 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 import logging
 from typing import TYPE_CHECKING
 
 from sqlalchemy import func
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
-from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States, StatisticsRuns, StatisticsShortTerm
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN, MAX_ROWS_TO_PURGE
+from .models import (
+    EventData,
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+    StatisticsMeta,
+    StatisticsRuns,
+    StatisticsShortTerm,
+    process_timestamp,
+)
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -21,6 +35,19 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class RetentionPolicy:
+    """Keep the raw states of matching entities for fewer days.
+
+    Older states are only purged once they are covered by the 5 minute
+    statistics, which are kept for purge_keep_days, and the hourly
+    statistics, which are kept forever.
+    """
+
+    entity_filter: Callable[[str], bool]
+    keep_days: int
+
+
 @retryable_database_job("purge")
 def purge_old_data(
     instance: Recorder, purge_before: datetime, repack: bool, apply_filter: bool = False
@@ -33,11 +60,14 @@ def purge_old_data(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    _commit_pending_events_and_states(instance)
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
         # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-        event_ids = _select_event_ids_to_purge(session, purge_before)
-        state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
+        event_ids, data_ids = _select_event_and_data_ids_to_purge(session, purge_before)
+        state_ids, attributes_ids = _select_state_and_attributes_ids_to_purge(
+            session, purge_before, event_ids
+        )
         statistics_runs = _select_statistics_runs_to_purge(session, purge_before)
         short_term_statistics = _select_short_term_statistics_to_purge(
             session, purge_before
@@ -45,9 +75,11 @@ def purge_old_data(
 
         if state_ids:
             _purge_state_ids(instance, session, state_ids)
+            _purge_unused_attributes_ids(instance, session, attributes_ids)
 
         if event_ids:
             _purge_event_ids(session, event_ids)
+            _purge_unused_data_ids(instance, session, data_ids)
 
         if statistics_runs:
             _purge_statistics_runs(session, statistics_runs)
@@ -60,6 +92,13 @@ def purge_old_data(
             _LOGGER.debug("Purging hasn't fully completed yet")
             return False
 
+        if (
+            instance.retention_policies
+            and _purge_downsampled_states(instance, session) is False
+        ):
+            _LOGGER.debug("Purging downsampled states hasn't fully completed yet")
+            return False
+
         if apply_filter and _purge_filtered_data(instance, session) is False:
             _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
             return False
@@ -70,32 +109,74 @@ def purge_old_data(
     return True
 
 
-def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list[int]:
-    """Return a list of event ids to purge."""
+def _commit_pending_events_and_states(instance: Recorder) -> None:
+    """Commit the states and events pending in the event session.
+
+    Pending rows may refer to cached state_attributes and event_data rows,
+    they must be visible before unused shared rows can be selected for removal.
+    """
+    instance._commit_event_session_or_retry()  # pylint: disable=protected-access
+
+
+def _select_event_and_data_ids_to_purge(
+    session: Session, purge_before: datetime
+) -> tuple[list[int], set[int]]:
+    """Return a list of event ids to purge and the data ids they refer to."""
     events = (
-        session.query(Events.event_id)
+        session.query(Events.event_id, Events.data_id)
         .filter(Events.time_fired < purge_before)
         .limit(MAX_ROWS_TO_PURGE)
         .all()
     )
     _LOGGER.debug("Selected %s event ids to remove", len(events))
-    return [event.event_id for event in events]
+    event_ids = []
+    data_ids = set()
+    for event in events:
+        event_ids.append(event.event_id)
+        if event.data_id:
+            data_ids.add(event.data_id)
+    return event_ids, data_ids
 
 
-def _select_state_ids_to_purge(
+def _select_state_and_attributes_ids_to_purge(
     session: Session, purge_before: datetime, event_ids: list[int]
-) -> set[int]:
-    """Return a list of state ids to purge."""
+) -> tuple[set[int], set[int]]:
+    """Return a list of state ids and the attributes ids they refer to."""
     if not event_ids:
-        return set()
+        return set(), set()
     states = (
-        session.query(States.state_id)
+        session.query(States.state_id, States.attributes_id)
         .filter(States.last_updated < purge_before)
         .filter(States.event_id.in_(event_ids))
         .all()
     )
     _LOGGER.debug("Selected %s state ids to remove", len(states))
-    return {state.state_id for state in states}
+    state_ids = set()
+    attributes_ids = set()
+    for state in states:
+        state_ids.add(state.state_id)
+        if state.attributes_id:
+            attributes_ids.add(state.attributes_id)
+    return state_ids, attributes_ids
+
+
+def _select_unused_attributes_ids(
+    session: Session, attributes_ids: set[int]
+) -> set[int]:
+    """Return the attributes ids which are no longer referenced by any state."""
+    if not attributes_ids:
+        return set()
+    seen_ids = {
+        state.attributes_id
+        for state in session.query(
+            distinct(States.attributes_id).label("attributes_id")
+        )
+        .filter(States.attributes_id.in_(attributes_ids))
+        .all()
+    }
+    unused_ids = attributes_ids - seen_ids
+    _LOGGER.debug("Selected %s shared attributes to remove", len(unused_ids))
+    return unused_ids
 
 
 def _select_statistics_runs_to_purge(
@@ -174,6 +255,93 @@ def _evict_purged_states_from_old_states_cache(
     for purged_state_id in purged_state_ids.intersection(old_state_reversed):
         old_states.pop(old_state_reversed[purged_state_id], None)
 
+    if bulk_inserter := instance._bulk_inserter:  # pylint: disable=protected-access
+        bulk_inserter.evict_purged_states(purged_state_ids)
+
+
+def _select_unused_data_ids(session: Session, data_ids: set[int]) -> set[int]:
+    """Return the data ids which are no longer referenced by any event."""
+    if not data_ids:
+        return set()
+    seen_ids = {
+        event.data_id
+        for event in session.query(distinct(Events.data_id).label("data_id"))
+        .filter(Events.data_id.in_(data_ids))
+        .all()
+    }
+    unused_ids = data_ids - seen_ids
+    _LOGGER.debug("Selected %s shared event data to remove", len(unused_ids))
+    return unused_ids
+
+
+def _purge_unused_data_ids(
+    instance: Recorder, session: Session, data_ids: set[int]
+) -> None:
+    """Delete the data ids which are no longer referenced by any event."""
+    if not (unused_ids := _select_unused_data_ids(session, data_ids)):
+        return
+    deleted_rows = (
+        session.query(EventData)
+        .filter(EventData.data_id.in_(unused_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s data events", deleted_rows)
+
+    # Evict any entries in the event_data_ids cache referring to a purged event
+    _evict_purged_data_from_data_cache(instance, unused_ids)
+
+
+def _evict_purged_data_from_data_cache(
+    instance: Recorder, purged_data_ids: set[int]
+) -> None:
+    """Evict purged data ids from the data ids cache."""
+    # Make a map from data_id to shared_data
+    event_data_ids = instance._event_data_ids  # pylint: disable=protected-access
+    event_data_ids_reversed = {
+        data_id: shared_data for shared_data, data_id in event_data_ids.items()
+    }
+
+    # Evict any purged data from the data ids cache
+    for purged_data_id in purged_data_ids.intersection(event_data_ids_reversed):
+        event_data_ids.pop(event_data_ids_reversed[purged_data_id])
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete the attributes ids which are no longer referenced by any state."""
+    if not (unused_ids := _select_unused_attributes_ids(session, attributes_ids)):
+        return
+    deleted_rows = (
+        session.query(StateAttributes)
+        .filter(StateAttributes.attributes_id.in_(unused_ids))
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Evict any entries in the state_attributes_ids cache referring to a purged state
+    _evict_purged_attributes_from_attributes_cache(instance, unused_ids)
+
+
+def _evict_purged_attributes_from_attributes_cache(
+    instance: Recorder, purged_attributes_ids: set[int]
+) -> None:
+    """Evict purged attribute ids from the attribute ids cache."""
+    # Make a map from attributes_id to shared_attrs
+    state_attributes_ids = (
+        instance._state_attributes_ids  # pylint: disable=protected-access
+    )
+    state_attributes_ids_reversed = {
+        attributes_id: shared_attrs
+        for shared_attrs, attributes_id in state_attributes_ids.items()
+    }
+
+    # Evict any purged attributes from the attribute ids cache
+    for purged_attribute_id in purged_attributes_ids.intersection(
+        state_attributes_ids_reversed
+    ):
+        state_attributes_ids.pop(state_attributes_ids_reversed[purged_attribute_id])
+
 
 def _purge_statistics_runs(session: Session, statistics_runs: list[int]) -> None:
     """Delete by run_id."""
@@ -221,6 +389,74 @@ def _purge_old_recorder_runs(
     _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
 
+def _select_downsampled_state_ids_to_purge(
+    instance: Recorder, session: Session
+) -> tuple[set[int], list[int], set[int]]:
+    """Return states covered by statistics which are past their retention policy.
+
+    Only states which have been replaced by a newer state before the
+    cutoff are selected, the statistics of the next periods are compiled
+    from the last state of each entity.
+    """
+    now = dt_util.utcnow()
+    newer_states = aliased(States)
+    state_ids: set[int] = set()
+    event_ids: list[int] = []
+    attributes_ids: set[int] = set()
+    for entity_id, last_start in (
+        session.query(StatisticsMeta.statistic_id, func.max(StatisticsShortTerm.start))
+        .join(StatisticsShortTerm, StatisticsShortTerm.metadata_id == StatisticsMeta.id)
+        .filter(StatisticsMeta.source == DOMAIN)
+        .group_by(StatisticsMeta.statistic_id)
+        .all()
+    ):
+        keep_days = min(
+            (
+                policy.keep_days
+                for policy in instance.retention_policies
+                if policy.entity_filter(entity_id)
+            ),
+            default=None,
+        )
+        if keep_days is None:
+            continue
+        purge_before = min(
+            now - timedelta(days=keep_days),
+            process_timestamp(last_start) + StatisticsShortTerm.duration,
+        )
+        states = (
+            session.query(States.state_id, States.event_id, States.attributes_id)
+            .join(newer_states, newer_states.old_state_id == States.state_id)
+            .filter(States.entity_id == entity_id)
+            .filter(newer_states.last_updated < purge_before)
+            .limit(MAX_ROWS_TO_PURGE - len(state_ids))
+            .all()
+        )
+        for state in states:
+            state_ids.add(state.state_id)
+            if state.event_id:
+                event_ids.append(state.event_id)
+            if state.attributes_id:
+                attributes_ids.add(state.attributes_id)
+        if len(state_ids) >= MAX_ROWS_TO_PURGE:
+            break
+    _LOGGER.debug("Selected %s downsampled state ids to remove", len(state_ids))
+    return state_ids, event_ids, attributes_ids
+
+
+def _purge_downsampled_states(instance: Recorder, session: Session) -> bool:
+    """Remove raw states past their retention policy."""
+    state_ids, event_ids, attributes_ids = _select_downsampled_state_ids_to_purge(
+        instance, session
+    )
+    if not state_ids:
+        return True
+    _purge_state_ids(instance, session, state_ids)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
+    _purge_event_ids(session, event_ids)
+    return False
+
+
 def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     """Remove filtered states and events that shouldn't be in the database."""
     _LOGGER.debug("Cleanup filtered data")
@@ -254,9 +490,10 @@ def _purge_filtered_states(
     """Remove filtered states and linked events."""
     state_ids: list[int]
     event_ids: list[int | None]
-    state_ids, event_ids = zip(
+    attributes_ids: list[int | None]
+    state_ids, event_ids, attributes_ids = zip(
         *(
-            session.query(States.state_id, States.event_id)
+            session.query(States.state_id, States.event_id, States.attributes_id)
             .filter(States.entity_id.in_(excluded_entity_ids))
             .limit(MAX_ROWS_TO_PURGE)
             .all()
@@ -267,6 +504,9 @@ def _purge_filtered_states(
         "Selected %s state_ids to remove that should be filtered", len(state_ids)
     )
     _purge_state_ids(instance, session, set(state_ids))
+    _purge_unused_attributes_ids(
+        instance, session, {id_ for id_ in attributes_ids if id_ is not None}
+    )
     _purge_event_ids(session, event_ids)  # type: ignore  # type of event_ids already narrowed to 'list[int]'
 
 
@@ -275,26 +515,36 @@ def _purge_filtered_events(
 ) -> None:
     """Remove filtered events and linked states."""
     events: list[Events] = (
-        session.query(Events.event_id)
+        session.query(Events.event_id, Events.data_id)
         .filter(Events.event_type.in_(excluded_event_types))
         .limit(MAX_ROWS_TO_PURGE)
         .all()
     )
     event_ids: list[int] = [event.event_id for event in events]
+    data_ids: set[int] = {event.data_id for event in events if event.data_id}
     _LOGGER.debug(
         "Selected %s event_ids to remove that should be filtered", len(event_ids)
     )
     states: list[States] = (
-        session.query(States.state_id).filter(States.event_id.in_(event_ids)).all()
+        session.query(States.state_id, States.attributes_id)
+        .filter(States.event_id.in_(event_ids))
+        .all()
     )
     state_ids: set[int] = {state.state_id for state in states}
+    attributes_ids: set[int] = {
+        state.attributes_id for state in states if state.attributes_id
+    }
     _purge_state_ids(instance, session, state_ids)
+    _purge_unused_attributes_ids(instance, session, attributes_ids)
     _purge_event_ids(session, event_ids)
+    _purge_unused_data_ids(instance, session, data_ids)
 
 
 @retryable_database_job("purge")
 def purge_entity_data(instance: Recorder, entity_filter: Callable[[str], bool]) -> bool:
     """Purge states and events of specified entities."""
+    _commit_pending_events_and_states(instance)
+
     with session_scope(session=instance.get_session()) as session:  # type: ignore
         selected_entity_ids: list[str] = [
             entity_id
@@ -102,12 +102,18 @@ def ws_info(
     migration_in_progress = async_migration_in_progress(hass)
     recording = instance.recording if instance else False
     thread_alive = instance.is_alive() if instance else False
+    bulk_insert = instance.using_bulk_insert if instance else False
+    rows_per_second = instance.rows_per_second if instance else None
+    if rows_per_second is not None:
+        rows_per_second = round(rows_per_second, 1)
 
     recorder_info = {
         "backlog": backlog,
+        "bulk_insert": bulk_insert,
         "max_backlog": MAX_QUEUE_BACKLOG,
         "migration_in_progress": migration_in_progress,
         "recording": recording,
+        "rows_per_second": rows_per_second,
         "thread_running": thread_alive,
     }
     connection.send_result(msg["id"], recorder_info)
@@ -12,7 +12,7 @@ from typing import Any, Literal, cast
 import voluptuous as vol
 
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.models import States, with_shared_attrs
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.components.sensor import (
     PLATFORM_SCHEMA,
@@ -464,7 +464,7 @@ class StatisticsSensor(SensorEntity):
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
         with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
+            query = with_shared_attrs(session.query(States)).filter(
                 States.entity_id == self._source_entity_id.lower()
             )
 
@@ -0,0 +1,107 @@
+"""Forward events to the event subscriptions of all websocket connections."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+from . import messages
+from .const import DATA_EVENT_BROADCASTER
+
+if TYPE_CHECKING:
+    from .connection import ActiveConnection
+
+MessageFactory = Callable[[int, Event], str]
+
+
+class EventBroadcaster:
+    """Forward events to the subscriptions of all connections.
+
+    There is a single bus listener per event type, whatever the number of
+    connections. Every subscription gets a message made by its message
+    factory, which serializes each event once. The permissions of the
+    connections are checked once per permission profile for each
+    state_changed event.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the broadcaster."""
+        self.hass = hass
+        self._subscriptions: dict[
+            str, list[tuple[ActiveConnection, int, MessageFactory]]
+        ] = {}
+        self._unsub_listeners: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_subscribe(
+        self,
+        event_type: str,
+        connection: ActiveConnection,
+        msg_id: int,
+        message_factory: MessageFactory = messages.cached_event_message,
+    ) -> CALLBACK_TYPE:
+        """Subscribe a connection to events of a type."""
+        subscription = (connection, msg_id, message_factory)
+
+        if (subscriptions := self._subscriptions.get(event_type)) is None:
+            subscriptions = self._subscriptions[event_type] = []
+
+            @callback
+            def _async_forward(event: Event) -> None:
+                """Forward an event to the subscriptions."""
+                self._async_forward(event_type, subscriptions, event)
+
+            self._unsub_listeners[event_type] = self.hass.bus.async_listen(
+                event_type, _async_forward
+            )
+
+        subscriptions.append(subscription)
+
+        @callback
+        def unsubscribe() -> None:
+            """Remove the subscription."""
+            subscriptions.remove(subscription)
+            if subscriptions:
+                return
+            del self._subscriptions[event_type]
+            self._unsub_listeners.pop(event_type)()
+
+        return unsubscribe
+
+    @callback
+    def _async_forward(
+        self,
+        event_type: str,
+        subscriptions: list[tuple[ActiveConnection, int, MessageFactory]],
+        event: Event,
+    ) -> None:
+        """Forward an event to the subscriptions of an event type."""
+        if event_type != EVENT_STATE_CHANGED:
+            if event.event_type == EVENT_TIME_CHANGED:
+                return
+            for connection, msg_id, message_factory in subscriptions:
+                connection.send_message(message_factory(msg_id, event))
+            return
+
+        entity_id = event.data["entity_id"]
+        # Connections of the same user share their permissions
+        allowed: dict[int, bool] = {}
+        for connection, msg_id, message_factory in subscriptions:
+            permissions = connection.user.permissions
+            if (permitted := allowed.get(id(permissions))) is None:
+                permitted = allowed[id(permissions)] = permissions.check_entity(
+                    entity_id, POLICY_READ
+                )
+            if permitted:
+                connection.send_message(message_factory(msg_id, event))
+
+
+@callback
+def async_get_event_broadcaster(hass: HomeAssistant) -> EventBroadcaster:
+    """Return the event broadcaster."""
+    if (broadcaster := hass.data.get(DATA_EVENT_BROADCASTER)) is None:
+        broadcaster = hass.data[DATA_EVENT_BROADCASTER] = EventBroadcaster(hass)
+    return broadcaster
@@ -10,7 +10,7 @@ import voluptuous as vol
 
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
-from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 from homeassistant.core import Context, Event, HomeAssistant, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
@@ -18,19 +18,31 @@ from homeassistant.exceptions import (
     TemplateError,
     Unauthorized,
 )
-from homeassistant.helpers import config_validation as cv, entity, template
+from homeassistant.helpers import (
+    config_validation as cv,
+    entity,
+    startup_report,
+    template,
+)
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_get_point_in_time_scheduler,
+    async_track_state_change_event,
     async_track_template_result,
 )
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.service import async_get_all_descriptions
-from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.loader import (
+    DATA_IMPORT_TIME,
+    IntegrationNotFound,
+    async_get_integration,
+)
 from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 
 from . import const, decorators, messages
+from .broadcast import async_get_event_broadcaster
 from .connection import ActiveConnection
 from .const import ERR_NOT_FOUND
 
@@ -49,12 +61,17 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_import_info)
+    async_reg(hass, handle_integration_startup_reports)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_scheduler_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
+    async_reg(hass, handle_supported_features)
     async_reg(hass, handle_test_condition)
     async_reg(hass, handle_unsubscribe_events)
 
@@ -84,31 +101,9 @@ def handle_subscribe_events(
     if event_type not in SUBSCRIBE_ALLOWLIST and not connection.user.is_admin:
         raise Unauthorized
 
-    if event_type == EVENT_STATE_CHANGED:
-
-        @callback
-        def forward_events(event: Event) -> None:
-            """Forward state changed events to websocket."""
-            if not connection.user.permissions.check_entity(
-                event.data["entity_id"], POLICY_READ
-            ):
-                return
-
-            connection.send_message(messages.cached_event_message(msg["id"], event))
-
-    else:
-
-        @callback
-        def forward_events(event: Event) -> None:
-            """Forward events to websocket."""
-            if event.event_type == EVENT_TIME_CHANGED:
-                return
-
-            connection.send_message(messages.cached_event_message(msg["id"], event))
-
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        event_type, forward_events
-    )
+    connection.subscriptions[msg["id"]] = async_get_event_broadcaster(
+        hass
+    ).async_subscribe(event_type, connection, msg["id"])
 
     connection.send_message(messages.result_message(msg["id"]))
 
@@ -238,7 +233,83 @@ def handle_get_states(
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    # Splice in the JSON of the states, which is encoded once per state
+    try:
+        states_json = f'[{",".join(state.as_dict_json for state in states)}]'
+    except (ValueError, TypeError):
+        # Logs the bad data and sends an error message
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+
+    connection.send_message(messages.construct_result_message(msg["id"], states_json))
+
+
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends the compact states of the entities and then the changes of
+    their states, which are serialized once for all connections.
+    """
+    entity_ids = msg.get("entity_ids")
+    entity_perm = connection.user.permissions.check_entity
+
+    # We must never await between collecting the states and listening for
+    # state changed events or we will miss changes
+    if entity_ids:
+
+        @callback
+        def forward_entity_changes(event: Event) -> None:
+            """Forward entity state changed events to websocket."""
+            if not connection.user.permissions.check_entity(
+                event.data["entity_id"], POLICY_READ
+            ):
+                return
+
+            connection.send_message(
+                messages.cached_state_diff_message(msg["id"], event)
+            )
+
+        states = [
+            state
+            for entity_id in entity_ids
+            if (state := hass.states.get(entity_id)) is not None
+        ]
+        connection.subscriptions[msg["id"]] = async_track_state_change_event(
+            hass, entity_ids, forward_entity_changes
+        )
+    else:
+        states = hass.states.async_all()
+        connection.subscriptions[msg["id"]] = async_get_event_broadcaster(
+            hass
+        ).async_subscribe(
+            EVENT_STATE_CHANGED,
+            connection,
+            msg["id"],
+            messages.cached_state_diff_message,
+        )
+
+    connection.send_message(messages.result_message(msg["id"]))
+    connection.send_message(
+        messages.event_message(
+            msg["id"],
+            {
+                messages.ENTITY_EVENT_ADD: {
+                    state.entity_id: messages.compressed_state_dict(state)
+                    for state in states
+                    if entity_perm(state.entity_id, POLICY_READ)
+                }
+            },
+        )
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -305,6 +376,56 @@ async def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_info"})
+def handle_integration_import_info(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle import info command."""
+    connection.send_result(
+        msg["id"],
+        [
+            {"module": module, "seconds": seconds}
+            for module, seconds in hass.data.get(DATA_IMPORT_TIME, {}).items()
+        ],
+    )
+
+
+@decorators.websocket_command({vol.Required("type"): "integration/startup_reports"})
+@decorators.async_response
+async def handle_integration_startup_reports(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle startup reports command."""
+    connection.send_result(msg["id"], await startup_report.async_get_reports(hass))
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "scheduler/stats"})
+def handle_scheduler_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle point in time scheduler stats command."""
+    connection.send_result(
+        msg["id"], async_get_point_in_time_scheduler(hass).async_stats()
+    )
+
+
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "supported_features",
+        vol.Required("features"): {str: int},
+    }
+)
+def handle_supported_features(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle setting the features supported by the client."""
+    connection.supported_features = msg["features"]
+    connection.send_result(msg["id"])
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
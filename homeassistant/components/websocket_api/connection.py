@@ -35,7 +35,10 @@ class ActiveConnection:
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
+        self.supported_features: dict[str, int] = {}
         self.last_id = 0
+        # Set by the websocket handler while few messages are pending
+        self.writable: asyncio.Event | None = None
 
     def context(self, msg: dict[str, Any]) -> Context:
         """Return a context."""
@@ -53,6 +56,15 @@ class ActiveConnection:
         )
         self.send_message(content)
 
+    async def async_wait_writable(self) -> None:
+        """Wait until the client has read most of the pending messages.
+
+        Lets commands sending many messages keep pace with the client
+        instead of exceeding the maximum of pending messages.
+        """
+        if self.writable is not None:
+            await self.writable.wait()
+
     @callback
     def send_error(self, msg_id: int, code: str, message: str) -> None:
         """Send a error message."""
@@ -5,24 +5,31 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import datetime as dt
+from ipaddress import ip_address
 import logging
 from typing import Any, Final
 
 from aiohttp import WSMsgType, web
+from aiohttp.hdrs import X_FORWARDED_FOR
 import async_timeout
 
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.util.json import json_loads
+from homeassistant.util.network import is_local
 
 from .auth import AuthPhase, auth_required_message
+from .connection import ActiveConnection
 from .const import (
     CANCELLATION_ERRORS,
     DATA_CONNECTIONS,
+    FEATURE_COALESCE_MESSAGES,
     MAX_PENDING_MSG,
     PENDING_MSG_PEAK,
     PENDING_MSG_PEAK_TIME,
+    PENDING_MSG_WRITABLE,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
     URL,
@@ -54,6 +61,38 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+def _is_local_request(hass: HomeAssistant, request: web.Request) -> bool:
+    """Return if the client of the request is on the local network.
+
+    The forwarded middleware of the http integration resolves request.remote
+    to the client address in X-Forwarded-For. Clients of the Remote UI of
+    Home Assistant Cloud, or behind a trusted proxy which did not send the
+    header, are at an unknown address.
+    """
+    if "cloud" in hass.config.components:
+        # pylint: disable=import-outside-toplevel
+        from hass_nabucasa import remote
+
+        if remote.is_cloud_request.get():
+            return False
+
+    if request.remote is None:
+        return False
+    try:
+        client_ip = ip_address(request.remote)
+    except ValueError:
+        return False
+
+    if (
+        hass.http is not None
+        and X_FORWARDED_FOR not in request.headers
+        and any(client_ip in proxy for proxy in hass.http.trusted_proxies)
+    ):
+        return False
+
+    return is_local(client_ip)
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -61,28 +100,71 @@ class WebSocketHandler:
         """Initialize an active connection."""
         self.hass = hass
         self.request = request
-        self.wsock = web.WebSocketResponse(heartbeat=55)
+        # Compressing costs more CPU than it saves on the local network
+        self.wsock = web.WebSocketResponse(
+            heartbeat=55, compress=not _is_local_request(hass, request)
+        )
         self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
+        self._writable = asyncio.Event()
+        self._writable.set()
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
+        self._connection: ActiveConnection | None = None
 
     async def _writer(self) -> None:
-        """Write outgoing messages."""
+        """Write outgoing messages.
+
+        When the client supports it, all queued messages are
+        written as a single JSON array.
+        """
+        to_write = self._to_write
         # Exceptions if Socket disconnected or cancelled by connection handler
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
-                if (message := await self._to_write.get()) is None:
+                if (message := await to_write.get()) is None:
                     break
 
-                self._logger.debug("Sending %s", message)
-                await self.wsock.send_str(message)
+                if (
+                    to_write.empty()
+                    or self._connection is None
+                    or not self._connection.supported_features.get(
+                        FEATURE_COALESCE_MESSAGES
+                    )
+                ):
+                    self._logger.debug("Sending %s", message)
+                    await self.wsock.send_str(message)
+                    self._async_check_writable()
+                    continue
+
+                messages = [message]
+                closing = False
+                while not to_write.empty():
+                    if (message := to_write.get_nowait()) is None:
+                        closing = True
+                        break
+                    messages.append(message)
+
+                coalesced = "[" + ",".join(messages) + "]"
+                self._logger.debug("Sending %s", coalesced)
+                await self.wsock.send_str(coalesced)
+                self._async_check_writable()
+                if closing:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub is not None:
             self._peak_checker_unsub()
             self._peak_checker_unsub = None
+        # Nothing will be written anymore, release the waiting senders
+        self._writable.set()
+
+    @callback
+    def _async_check_writable(self) -> None:
+        """Release the senders waiting for the pending messages to be read."""
+        if self._to_write.qsize() < PENDING_MSG_WRITABLE:
+            self._writable.set()
 
     @callback
     def _send_message(self, message: str | dict[str, Any]) -> None:
@@ -97,6 +179,8 @@ class WebSocketHandler:
 
         try:
             self._to_write.put_nowait(message)
+            if self._to_write.qsize() >= PENDING_MSG_WRITABLE:
+                self._writable.clear()
         except asyncio.QueueFull:
             self._logger.error(
                 "Client exceeded max pending messages [2]: %s", MAX_PENDING_MSG
@@ -190,13 +274,14 @@ class WebSocketHandler:
                 raise Disconnect
 
             try:
-                msg_data = msg.json()
+                msg_data = msg.json(loads=json_loads)
             except ValueError as err:
                 disconnect_warn = "Received invalid JSON."
                 raise Disconnect from err
 
             self._logger.debug("Received %s", msg_data)
-            connection = await auth.async_handle(msg_data)
+            connection = self._connection = await auth.async_handle(msg_data)
+            connection.writable = self._writable
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
@@ -216,7 +301,7 @@ class WebSocketHandler:
                     break
 
                 try:
-                    msg_data = msg.json()
+                    msg_data = msg.json(loads=json_loads)
                 except ValueError:
                     disconnect_warn = "Received invalid JSON."
                     break
@@ -238,6 +323,7 @@ class WebSocketHandler:
 
             if connection is not None:
                 connection.async_handle_close()
+            self._writable.set()
 
             try:
                 self._to_write.put_nowait(None)
@@ -24,6 +24,11 @@ from homeassistant.exceptions import (
 from homeassistant.helpers import device_registry, entity_registry
 from homeassistant.helpers.event import Event
 from homeassistant.helpers.frame import report
+from homeassistant.helpers.startup_report import (
+    CATEGORY_CONFIG_ENTRIES,
+    async_get_report,
+    async_measure,
+)
 from homeassistant.helpers.typing import (
     UNDEFINED,
     ConfigType,
@@ -329,8 +334,20 @@ class ConfigEntry:
 
         error_reason = None
 
+        if (
+            self.domain == integration.domain
+            and (startup_report := async_get_report(hass)) is not None
+        ):
+            startup_report.async_set(
+                CATEGORY_CONFIG_ENTRIES, self.entry_id, "domain", self.domain
+            )
+            startup_report.async_set(
+                CATEGORY_CONFIG_ENTRIES, self.entry_id, "title", self.title
+            )
+
         try:
-            result = await component.async_setup_entry(hass, self)  # type: ignore
+            with async_measure(hass, CATEGORY_CONFIG_ENTRIES, self.entry_id, "setup"):
+                result = await component.async_setup_entry(hass, self)  # type: ignore
 
             if not isinstance(result, bool):
                 _LOGGER.error(
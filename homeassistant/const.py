@@ -265,6 +265,7 @@ EVENT_LOGBOOK_ENTRY: Final = "logbook_entry"
 EVENT_SERVICE_REGISTERED: Final = "service_registered"
 EVENT_SERVICE_REMOVED: Final = "service_removed"
 EVENT_STATE_CHANGED: Final = "state_changed"
+EVENT_STATE_CHANGED_BATCH: Final = "state_changed_batch"
 EVENT_THEMES_UPDATED: Final = "themes_updated"
 EVENT_TIMER_OUT_OF_SYNC: Final = "timer_out_of_sync"
 EVENT_TIME_CHANGED: Final = "time_changed"
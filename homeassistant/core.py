@@ -7,7 +7,14 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Collection, Coroutine, Iterable, Mapping
+from collections.abc import (
+    Awaitable,
+    Collection,
+    Coroutine,
+    Hashable,
+    Iterable,
+    Mapping,
+)
 import datetime
 import enum
 import functools
@@ -45,6 +52,7 @@ from homeassistant.const import (
     EVENT_SERVICE_REGISTERED,
     EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
     EVENT_TIME_CHANGED,
     EVENT_TIMER_OUT_OF_SYNC,
     LENGTH_METERS,
@@ -68,6 +76,7 @@ from homeassistant.util.async_ import (
     shutdown_run_callback_threadsafe,
 )
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_dumps
 from homeassistant.util.timeout import TimeoutManager
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM, UnitSystem
 import homeassistant.util.uuid as uuid_util
@@ -620,7 +629,14 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ["event_type", "data", "origin", "time_fired", "context"]
+    __slots__ = [
+        "event_type",
+        "data",
+        "origin",
+        "time_fired",
+        "context",
+        "_as_dict_json",
+    ]
 
     def __init__(
         self,
@@ -636,6 +652,7 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         self.context: Context = context or Context()
+        self._as_dict_json: str | None = None
 
     def __hash__(self) -> int:
         """Make hashable."""
@@ -655,6 +672,37 @@ class Event:
             "context": self.context.as_dict(),
         }
 
+    @property
+    def as_dict_json(self) -> str:
+        """Return the JSON of the dict representation of this Event.
+
+        The JSON is encoded once. The states of state_changed events are
+        spliced in from their own encoded JSON.
+
+        Async friendly.
+        """
+        if self._as_dict_json is None:
+            if self.event_type == EVENT_STATE_CHANGED and self.data.keys() == {
+                "entity_id",
+                "old_state",
+                "new_state",
+            }:
+                data_json = (
+                    f'{{"entity_id":{json_dumps(self.data["entity_id"])},'
+                    f'"old_state":{_state_json(self.data["old_state"])},'
+                    f'"new_state":{_state_json(self.data["new_state"])}}}'
+                )
+                self._as_dict_json = (
+                    f'{{"event_type":"{EVENT_STATE_CHANGED}",'
+                    f'"data":{data_json},'
+                    f'"origin":"{self.origin.value}",'
+                    f'"time_fired":"{self.time_fired.isoformat()}",'
+                    f'"context":{json_dumps(self.context.as_dict())}}}'
+                )
+            else:
+                self._as_dict_json = json_dumps(self.as_dict())
+        return self._as_dict_json
+
     def __repr__(self) -> str:
         """Return the representation."""
         if self.data:
@@ -674,12 +722,26 @@ class Event:
         )
 
 
+def _state_json(state: Any) -> str:
+    """Return the JSON of a state of a state_changed event."""
+    if isinstance(state, State):
+        return state.as_dict_json
+    return json_dumps(state)
+
+
+# Event types which are not sent to the listeners of all events
+_NOT_MATCH_ALL_EVENT_TYPES = {EVENT_HOMEASSISTANT_CLOSE, EVENT_STATE_CHANGED_BATCH}
+
+
 class EventBus:
     """Allow the firing of and listening for events."""
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        # Listeners of events with a specific value in their data, indexed
+        # by event type, data key and value
+        self._keyed_listeners: dict[str, dict[str, dict[Hashable, list[HassJob]]]] = {}
         self._hass = hass
 
     @callback
@@ -688,7 +750,14 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + sum(
+                len(jobs)
+                for value_jobs in keyed_listeners.values()
+                for jobs in value_jobs.values()
+            )
+        return counts
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -725,30 +794,63 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
+        self._async_fire_events(
+            event_type, (Event(event_type, event_data, origin, time_fired, context),)
+        )
+
+    @callback
+    def _async_fire_events(self, event_type: str, events: Iterable[Event]) -> None:
+        """Fire events of the same type.
+
+        The listeners are looked up once for all the events.
+        """
         listeners = self._listeners.get(event_type, [])
 
-        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
+        # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners and
+        # EVENT_STATE_CHANGED_BATCH repeats state_changed events they receive
         match_all_listeners = self._listeners.get(MATCH_ALL)
-        if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
+        if (
+            match_all_listeners is not None
+            and event_type not in _NOT_MATCH_ALL_EVENT_TYPES
+        ):
             listeners = match_all_listeners + listeners
 
-        event = Event(event_type, event_data, origin, time_fired, context)
+        keyed_listeners = self._keyed_listeners.get(event_type)
 
-        if event_type != EVENT_TIME_CHANGED:
-            _LOGGER.debug("Bus:Handling %s", event)
+        for event in events:
+            if event_type != EVENT_TIME_CHANGED:
+                _LOGGER.debug("Bus:Handling %s", event)
 
-        if not listeners:
-            return
+            for job, event_filter in listeners:
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event):
+                            continue
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception("Error in event filter")
+                        continue
+                self._hass.async_add_hass_job(job, event)
+
+            if keyed_listeners is not None and any(
+                _keyed_jobs(keyed_listeners, event.data)
+            ):
+                self._hass.loop.call_soon(self._async_dispatch_keyed, event)
 
-        for job, event_filter in listeners:
-            if event_filter is not None:
+    @callback
+    def _async_dispatch_keyed(self, event: Event) -> None:
+        """Run the keyed listeners of an event.
+
+        The listeners are looked up again, so listeners added by an earlier
+        listener for the same event run as well.
+        """
+        if (keyed_listeners := self._keyed_listeners.get(event.event_type)) is None:
+            return
+        for jobs in list(_keyed_jobs(keyed_listeners, event.data)):
+            for job in jobs[:]:
                 try:
-                    if not event_filter(event):
-                        continue
+                    self._hass.async_run_hass_job(job, event)
                 except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception("Error in event filter")
-                    continue
-            self._hass.async_add_hass_job(job, event)
+                    _LOGGER.exception("Error running keyed listener for %s", event)
 
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
@@ -802,6 +904,60 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        data_key: str,
+        value: Hashable,
+        listener: Callable,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with a value in their data.
+
+        The listener only runs for events where ``event.data[data_key]``
+        equals value. Unlike a listener with an event_filter, the listener
+        is found with a dict lookup so the cost of firing an event does
+        not grow with the number of keyed listeners.
+
+        This method must be run in the event loop.
+        """
+        job = HassJob(listener)
+        self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        ).setdefault(value, []).append(job)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(event_type, data_key, value, job)
+
+        return remove_listener
+
+    @callback
+    def _async_remove_keyed_listener(
+        self, event_type: str, data_key: str, value: Hashable, job: HassJob
+    ) -> None:
+        """Remove a keyed listener and prune the emptied indexes.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            value_jobs = keyed_listeners[data_key]
+            jobs = value_jobs[value]
+            jobs.remove(job)
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown keyed listener %s", job)
+            return
+        if jobs:
+            return
+        del value_jobs[value]
+        if value_jobs:
+            return
+        del keyed_listeners[data_key]
+        if not keyed_listeners:
+            del self._keyed_listeners[event_type]
+
     def listen_once(
         self, event_type: str, listener: Callable[[Event], None]
     ) -> CALLBACK_TYPE:
@@ -881,6 +1037,20 @@ class EventBus:
             )
 
 
+def _keyed_jobs(
+    keyed_listeners: dict[str, dict[Hashable, list[HassJob]]], data: dict[str, Any]
+) -> Iterable[list[HassJob]]:
+    """Yield the jobs of the keyed listeners matching the event data."""
+    for data_key, value_jobs in keyed_listeners.items():
+        try:
+            jobs = value_jobs.get(data.get(data_key))
+        except TypeError:
+            # The value is not hashable, no listener can match it
+            continue
+        if jobs:
+            yield jobs
+
+
 class State:
     """Object to represent a state within the state machine.
 
@@ -904,6 +1074,7 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_dict_json",
     ]
 
     def __init__(
@@ -939,6 +1110,7 @@ class State:
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_dict_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -971,6 +1143,19 @@ class State:
             }
         return self._as_dict
 
+    @property
+    def as_dict_json(self) -> str:
+        """Return the JSON of the dict representation of the State.
+
+        The JSON is encoded once, so it can be spliced into every message
+        which contains the State.
+
+        Async friendly.
+        """
+        if self._as_dict_json is None:
+            self._as_dict_json = json_dumps(self.as_dict())
+        return self._as_dict_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
@@ -1254,6 +1439,87 @@ class StateMachine:
             time_fired=now,
         )
 
+    @callback
+    def async_set_many(
+        self,
+        new_states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the states of many entities at once.
+
+        new_states holds the entity_id, state and attributes of each entity.
+        The batch is applied atomically: if a state is invalid, no state is
+        set. All states share the time they were updated, a state_changed
+        event is fired for each of them, followed by a state_changed_batch
+        event holding all these events.
+
+        This method must be run in the event loop.
+        """
+        if context is None:
+            context = Context()
+
+        now = dt_util.utcnow()
+        changed: dict[str, State] = {}
+        events: list[Event] = []
+
+        for entity_id, new_state, attributes in new_states:
+            entity_id = entity_id.lower()
+            new_state = str(new_state)
+            attributes = attributes or {}
+            if (old_state := changed.get(entity_id)) is None:
+                old_state = self._states.get(entity_id)
+            if old_state is None:
+                same_state = False
+                same_attr = False
+                last_changed = None
+            else:
+                same_state = old_state.state == new_state and not force_update
+                same_attr = old_state.attributes == MappingProxyType(attributes)
+                last_changed = old_state.last_changed if same_state else None
+
+            if same_state and same_attr:
+                continue
+
+            state = State(
+                entity_id,
+                new_state,
+                attributes,
+                last_changed,
+                now,
+                context,
+                old_state is None,
+            )
+            changed[entity_id] = state
+            events.append(
+                Event(
+                    EVENT_STATE_CHANGED,
+                    {
+                        "entity_id": entity_id,
+                        "old_state": old_state,
+                        "new_state": state,
+                    },
+                    EventOrigin.local,
+                    now,
+                    context,
+                )
+            )
+
+        if not events:
+            return
+
+        self._states.update(changed)
+        self._bus._async_fire_events(  # pylint: disable=protected-access
+            EVENT_STATE_CHANGED, events
+        )
+        self._bus.async_fire(
+            EVENT_STATE_CHANGED_BATCH,
+            {"events": events},
+            EventOrigin.local,
+            context,
+            time_fired=now,
+        )
+
 
 class Service:
     """Representation of a callable service."""
@@ -54,7 +54,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers import config_validation as cv, entity_registry as er
 from homeassistant.helpers.sun import get_astral_event_date
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.template import RenderInfo, Template
 from homeassistant.helpers.typing import ConfigType, TemplateVarsType
 from homeassistant.util.async_ import run_callback_threadsafe
 import homeassistant.util.dt as dt_util
@@ -666,8 +666,13 @@ def async_template(
     trace_result: bool = True,
 ) -> bool:
     """Test if template condition matches."""
+    info = value_template.async_render_to_info(variables, parse_result=False)
+    return _async_template_info_result(info, trace_result)
+
+
+def _async_template_info_result(info: RenderInfo, trace_result: bool) -> bool:
+    """Return the result of a template condition from its render info."""
     try:
-        info = value_template.async_render_to_info(variables, parse_result=False)
         value = info.result()
     except TemplateError as ex:
         raise ConditionErrorMessage("template", str(ex)) from ex
@@ -681,13 +686,29 @@ def async_template(
 def async_template_from_config(config: ConfigType) -> ConditionCheckerType:
     """Wrap action method with state based condition."""
     value_template = cast(Template, config.get(CONF_VALUE_TEMPLATE))
+    last_render: tuple[dict[str, Any] | None, RenderInfo] | None = None
 
     @trace_condition_function
     def template_if(hass: HomeAssistant, variables: TemplateVarsType = None) -> bool:
         """Validate template based if-condition."""
+        nonlocal last_render
         value_template.hass = hass
 
-        return async_template(hass, value_template, variables)
+        # Skip rendering when the variables and the states read by the
+        # last render did not change
+        if variables is not None:
+            variables = dict(variables)
+        if (
+            last_render is not None
+            and last_render[0] == variables
+            and last_render[1].async_inputs_unchanged(hass)
+        ):
+            info = last_render[1]
+        else:
+            info = value_template.async_render_to_info(variables, parse_result=False)
+            last_render = (variables, info)
+
+        return _async_template_info_result(info, True)
 
     return template_if
 
@@ -44,6 +44,7 @@ from . import (
 from .device_registry import DeviceRegistry
 from .entity_registry import EntityRegistry, RegistryEntryDisabler
 from .event import async_call_later, async_track_time_interval
+from .startup_report import CATEGORY_PLATFORMS, async_get_report, async_measure
 from .typing import ConfigType, DiscoveryInfoType
 
 if TYPE_CHECKING:
@@ -245,16 +246,25 @@ class EntityPlatform:
             try:
                 task = async_create_setup_task()
 
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, self.domain):
-                    await asyncio.shield(task)
+                with async_measure(hass, CATEGORY_PLATFORMS, full_name, "setup"):
+                    async with hass.timeout.async_timeout(
+                        SLOW_SETUP_MAX_WAIT, self.domain
+                    ):
+                        await asyncio.shield(task)
 
                 # Block till all entities are done
-                while self._tasks:
-                    pending = [task for task in self._tasks if not task.done()]
-                    self._tasks.clear()
+                with async_measure(hass, CATEGORY_PLATFORMS, full_name, "add_entities"):
+                    while self._tasks:
+                        pending = [task for task in self._tasks if not task.done()]
+                        self._tasks.clear()
 
-                    if pending:
-                        await asyncio.gather(*pending)
+                        if pending:
+                            await asyncio.gather(*pending)
+
+                if (startup_report := async_get_report(hass)) is not None:
+                    startup_report.async_add(
+                        CATEGORY_PLATFORMS, full_name, "entities", len(self.entities)
+                    )
 
                 hass.config.components.add(full_name)
                 self._setup_complete = True
@@ -7,6 +7,7 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
 import logging
 import time
 from typing import Any, Callable, List, cast
@@ -42,17 +43,13 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
-
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 
 TRACK_STATE_REMOVED_DOMAIN_CALLBACKS = "track_state_removed_domain_callbacks"
 TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 
-TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
-TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
+DATA_POINT_IN_TIME_SCHEDULER = "point_in_time_scheduler"
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -240,59 +237,27 @@ def async_track_state_change_event(
 
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    for each one, the listeners are keyed by entity_id
+    on the event bus so events are routed with a fast
+    dict lookup.
     """
     if not (entity_ids := _async_string_to_lower_list(entity_ids)):
         return _remove_empty_listener
 
-    entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
-
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
-
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
+    removes = [
+        hass.bus.async_listen_keyed(
             EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
+            ATTR_ENTITY_ID,
+            entity_id,
+            action,
         )
-
-    job = HassJob(action)
-
-    for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
+        for entity_id in entity_ids
+    ]
 
     @callback
     def remove_listener() -> None:
         """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            job,
-        )
+        _async_remove_listeners(removes)
 
     return remove_listener
 
@@ -323,6 +288,13 @@ def _async_remove_indexed_listeners(
         del hass.data[listener_key]
 
 
+@callback
+def _async_remove_listeners(removes: list[CALLBACK_TYPE]) -> None:
+    """Remove keyed listeners."""
+    for remove in removes:
+        remove()
+
+
 @bind_hass
 def async_track_entity_registry_updated_event(
     hass: HomeAssistant,
@@ -331,59 +303,43 @@ def async_track_entity_registry_updated_event(
 ) -> Callable[[], None]:
     """Track specific entity registry updated events indexed by entity_id.
 
-    Similar to async_track_state_change_event.
+    Similar to async_track_state_change_event. An entity which was renamed
+    is tracked by its old entity_id.
     """
     if not (entity_ids := _async_string_to_lower_list(entity_ids)):
         return _remove_empty_listener
 
-    entity_callbacks = hass.data.setdefault(TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS, {})
-
-    if TRACK_ENTITY_REGISTRY_UPDATED_LISTENER not in hass.data:
-
-        @callback
-        def _async_entity_registry_updated_filter(event: Event) -> bool:
-            """Filter entity registry updates by entity_id."""
-            entity_id = event.data.get("old_entity_id", event.data["entity_id"])
-            return entity_id in entity_callbacks
-
-        @callback
-        def _async_entity_registry_updated_dispatcher(event: Event) -> None:
-            """Dispatch entity registry updates by entity_id."""
-            entity_id = event.data.get("old_entity_id", event.data["entity_id"])
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing entity registry update for %s",
-                        entity_id,
-                    )
-
-        hass.data[TRACK_ENTITY_REGISTRY_UPDATED_LISTENER] = hass.bus.async_listen(
-            EVENT_ENTITY_REGISTRY_UPDATED,
-            _async_entity_registry_updated_dispatcher,
-            event_filter=_async_entity_registry_updated_filter,
-        )
-
     job = HassJob(action)
 
+    @callback
+    def _async_entity_registry_updated_dispatcher(event: Event) -> None:
+        """Dispatch entity registry updates of entities which were not renamed."""
+        if "old_entity_id" not in event.data:
+            hass.async_run_hass_job(job, event)
+
+    removes = []
     for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
+        removes.append(
+            hass.bus.async_listen_keyed(
+                EVENT_ENTITY_REGISTRY_UPDATED,
+                "old_entity_id",
+                entity_id,
+                action,
+            )
+        )
+        removes.append(
+            hass.bus.async_listen_keyed(
+                EVENT_ENTITY_REGISTRY_UPDATED,
+                ATTR_ENTITY_ID,
+                entity_id,
+                _async_entity_registry_updated_dispatcher,
+            )
+        )
 
     @callback
     def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS,
-            TRACK_ENTITY_REGISTRY_UPDATED_LISTENER,
-            entity_ids,
-            job,
-        )
+        """Remove entity registry update listener."""
+        _async_remove_listeners(removes)
 
     return remove_listener
 
@@ -784,6 +740,8 @@ class _TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        # Equal templates share their info, keep the last render of each
+        self._last_info: dict[int, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable] = {}
 
@@ -799,6 +757,7 @@ class _TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict
             )
+            self._last_info[id(super_template)] = info
 
             # If the super template did not render to True, don't update other templates
             try:
@@ -820,6 +779,7 @@ class _TrackTemplateResultInfo:
             self._info[template] = info = template.async_render_to_info(
                 variables, strict=strict
             )
+            self._last_info[id(track_template_)] = info
 
             if info.exception:
                 if raise_on_template_error:
@@ -918,6 +878,11 @@ class _TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            last_info = self._last_info.get(id(track_template_))
+            if last_info is not None and last_info.async_inputs_unchanged(self.hass):
+                # The states read by the last render did not change
+                return False
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -941,6 +906,7 @@ class _TrackTemplateResultInfo:
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
+        self._last_info[id(track_template_)] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -1237,52 +1203,165 @@ def async_track_point_in_time(
 track_point_in_time = threaded_listener_factory(async_track_point_in_time)
 
 
-@callback
-@bind_hass
-def async_track_point_in_utc_time(
-    hass: HomeAssistant,
-    action: HassJob | Callable[..., Awaitable[None] | None],
-    point_in_time: datetime,
-) -> CALLBACK_TYPE:
-    """Add a listener that fires once after a specific point in UTC time."""
-    # Ensure point_in_time is UTC
-    utc_point_in_time = dt_util.as_utc(point_in_time)
+# For targeted patching in tests
+time_tracker_utcnow = dt_util.utcnow
 
-    # Since this is called once, we accept a HassJob so we can avoid
-    # having to figure out how to call the action every time its called.
-    cancel_callback: asyncio.TimerHandle | None = None
+
+class _ScheduledJob:
+    """A job scheduled to run at a point in time."""
+
+    __slots__ = ("job", "point_in_time", "cancelled")
+
+    def __init__(self, job: HassJob, point_in_time: datetime) -> None:
+        """Initialize the scheduled job."""
+        self.job = job
+        self.point_in_time = point_in_time
+        self.cancelled = False
+
+
+class PointInTimeScheduler:
+    """Run the point in time listeners of Home Assistant from one timer.
+
+    Listeners are grouped in ticks by the moment they are due and the ticks
+    are kept in a heap. A single loop timer is armed for the earliest tick
+    and, when it fires, runs every listener that is due. Time patterns and
+    update coordinators schedule whole seconds, like the time_changed timer,
+    so all of them that are due in the same second run in one batch.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._ticks: dict[float, list[_ScheduledJob]] = {}
+        self._heap: list[float] = []
+        self._handle: asyncio.TimerHandle | None = None
+        self.ticks_run = 0
+        self.jobs_run = 0
 
     @callback
-    def run_action(job: HassJob) -> None:
-        """Call the action."""
-        nonlocal cancel_callback
+    def async_schedule(self, job: HassJob, point_in_time: datetime) -> CALLBACK_TYPE:
+        """Schedule a job to run at a point in UTC time."""
+        timestamp = point_in_time.timestamp()
+        scheduled = _ScheduledJob(job, point_in_time)
+
+        if (tick := self._ticks.get(timestamp)) is None:
+            tick = self._ticks[timestamp] = []
+            heapq.heappush(self._heap, timestamp)
+            if len(self._heap) > 2 * len(self._ticks) + 64:
+                # Drop the timestamps of cancelled ticks
+                self._heap = list(self._ticks)
+                heapq.heapify(self._heap)
+            self._async_arm(time.time())
+        tick.append(scheduled)
 
-        now = time_tracker_utcnow()
+        @callback
+        def cancel() -> None:
+            """Cancel the scheduled job."""
+            if scheduled.cancelled:
+                return
+            scheduled.cancelled = True
+            if (tick := self._ticks.get(timestamp)) is None:
+                return
+            tick.remove(scheduled)
+            if not tick:
+                del self._ticks[timestamp]
+
+        return cancel
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return statistics about the scheduled jobs."""
+        return {
+            "scheduled_jobs": sum(len(tick) for tick in self._ticks.values()),
+            "scheduled_ticks": len(self._ticks),
+            "next_tick": (
+                dt_util.utc_from_timestamp(min(self._ticks)) if self._ticks else None
+            ),
+            "ticks_run": self.ticks_run,
+            "jobs_run": self.jobs_run,
+        }
+
+    @callback
+    def _async_arm(self, now: float) -> None:
+        """Arm the loop timer for the earliest tick."""
+        heap = self._heap
+        while heap and heap[0] not in self._ticks:
+            heapq.heappop(heap)
+        if not heap:
+            return
+        if (delay := heap[0] - now) <= 0:
+            # A job was scheduled for the past while running the due jobs
+            delay = heap[0] - time.time()
+        when = self.hass.loop.time() + delay
+        if self._handle is not None:
+            if self._handle.when() <= when:
+                return
+            self._handle.cancel()
+        self._handle = self.hass.loop.call_at(when, self._async_run)
+
+    @callback
+    def _async_run(self) -> None:
+        """Run the jobs that are due."""
+        self._handle = None
+        now = time_tracker_utcnow().timestamp()
 
         # Depending on the available clock support (including timer hardware
         # and the OS kernel) it can happen that we fire a little bit too early
         # as measured by utcnow(). That is bad when callbacks have assumptions
         # about the current time. Thus, we rearm the timer for the remaining
         # time.
-        if (delta := (utc_point_in_time - now).total_seconds()) > 0:
-            _LOGGER.debug("Called %f seconds too early, rearming", delta)
+        due = []
+        heap = self._heap
+        while heap and heap[0] <= now:
+            if (tick := self._ticks.pop(heapq.heappop(heap), None)) is not None:
+                due.append(tick)
+
+        if not due and heap:
+            _LOGGER.debug("Called %f seconds too early, rearming", heap[0] - now)
+
+        # Jobs scheduled by the jobs that run wait for the next tick
+        for tick in due:
+            self.ticks_run += 1
+            for scheduled in tick:
+                if scheduled.cancelled:
+                    continue
+                scheduled.cancelled = True
+                self.jobs_run += 1
+                try:
+                    self.hass.async_run_hass_job(scheduled.job, scheduled.point_in_time)
+                except Exception:  # pylint: disable=broad-except
+                    _LOGGER.exception(
+                        "Error running point in time job %s", scheduled.job
+                    )
 
-            cancel_callback = hass.loop.call_later(delta, run_action, job)
-            return
+        self._async_arm(now)
 
-        hass.async_run_hass_job(job, utc_point_in_time)
 
-    job = action if isinstance(action, HassJob) else HassJob(action)
-    delta = utc_point_in_time.timestamp() - time.time()
-    cancel_callback = hass.loop.call_later(delta, run_action, job)
+@callback
+def async_get_point_in_time_scheduler(hass: HomeAssistant) -> PointInTimeScheduler:
+    """Return the point in time scheduler of Home Assistant."""
+    if (scheduler := hass.data.get(DATA_POINT_IN_TIME_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_POINT_IN_TIME_SCHEDULER] = PointInTimeScheduler(hass)
+    return cast(PointInTimeScheduler, scheduler)
 
-    @callback
-    def unsub_point_in_time_listener() -> None:
-        """Cancel the call_later."""
-        assert cancel_callback is not None
-        cancel_callback.cancel()
 
-    return unsub_point_in_time_listener
+@callback
+@bind_hass
+def async_track_point_in_utc_time(
+    hass: HomeAssistant,
+    action: HassJob | Callable[..., Awaitable[None] | None],
+    point_in_time: datetime,
+) -> CALLBACK_TYPE:
+    """Add a listener that fires once after a specific point in UTC time."""
+    # Ensure point_in_time is UTC
+    utc_point_in_time = dt_util.as_utc(point_in_time)
+
+    # Since this is called once, we accept a HassJob so we can avoid
+    # having to figure out how to call the action every time its called.
+    job = action if isinstance(action, HassJob) else HassJob(action)
+    return async_get_point_in_time_scheduler(hass).async_schedule(
+        job, utc_point_in_time
+    )
 
 
 track_point_in_utc_time = threaded_listener_factory(async_track_point_in_utc_time)
@@ -1432,9 +1511,6 @@ def async_track_sunset(
 
 track_sunset = threaded_listener_factory(async_track_sunset)
 
-# For targeted patching in tests
-time_tracker_utcnow = dt_util.utcnow
-
 
 @callback
 @bind_hass
@@ -0,0 +1,115 @@
+"""Profile the startup of Home Assistant."""
+from __future__ import annotations
+
+from collections.abc import Generator
+import contextlib
+from timeit import default_timer as timer
+from typing import Any
+
+from homeassistant.const import __version__
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.loader import DATA_IMPORT_TIME
+import homeassistant.util.dt as dt_util
+
+from .storage import Store
+
+DATA_STARTUP_REPORT = "startup_report"
+
+STORAGE_KEY = "core.startup_reports"
+STORAGE_VERSION = 1
+
+MAX_REPORTS = 5
+
+CATEGORY_CONFIG_ENTRIES = "config_entries"
+CATEGORY_INTEGRATIONS = "integrations"
+CATEGORY_PLATFORMS = "platforms"
+CATEGORY_STAGES = "stages"
+
+
+class StartupReport:
+    """Time spent in each step of the startup.
+
+    Times are kept by category, then by integration, config entry, platform
+    or bootstrap stage, then by step. A step that runs more than once adds up.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the startup report."""
+        self.started = dt_util.utcnow()
+        self.start = timer()
+        self.categories: dict[str, dict[str, dict[str, Any]]] = {
+            CATEGORY_CONFIG_ENTRIES: {},
+            CATEGORY_INTEGRATIONS: {},
+            CATEGORY_PLATFORMS: {},
+            CATEGORY_STAGES: {},
+        }
+
+    @callback
+    def async_add(self, category: str, key: str, step: str, value: float) -> None:
+        """Add to the value of a step."""
+        steps = self.categories[category].setdefault(key, {})
+        steps[step] = steps.get(step, 0) + value
+
+    @callback
+    def async_set(self, category: str, key: str, name: str, value: Any) -> None:
+        """Set information about an item of the report."""
+        self.categories[category].setdefault(key, {})[name] = value
+
+    @callback
+    def async_as_dict(self, hass: HomeAssistant) -> dict[str, Any]:
+        """Return the report as a dictionary."""
+        return {
+            "version": __version__,
+            "started": self.started.isoformat(),
+            "seconds": timer() - self.start,
+            **self.categories,
+            "modules": dict(hass.data.get(DATA_IMPORT_TIME, {})),
+        }
+
+
+@callback
+def async_start_report(hass: HomeAssistant) -> None:
+    """Start profiling the startup."""
+    hass.data[DATA_STARTUP_REPORT] = StartupReport()
+
+
+@callback
+def async_get_report(hass: HomeAssistant) -> StartupReport | None:
+    """Return the report of the ongoing startup."""
+    return hass.data.get(DATA_STARTUP_REPORT)
+
+
+@contextlib.contextmanager
+def async_measure(
+    hass: HomeAssistant, category: str, key: str, step: str
+) -> Generator[None, None, None]:
+    """Measure the time a step takes while starting up."""
+    if (report := hass.data.get(DATA_STARTUP_REPORT)) is None:
+        yield
+        return
+
+    start = timer()
+    try:
+        yield
+    finally:
+        report.async_add(category, key, step, timer() - start)
+
+
+async def async_save_report(hass: HomeAssistant) -> None:
+    """Stop profiling the startup and store the report."""
+    report: StartupReport = hass.data.pop(DATA_STARTUP_REPORT)
+    store = Store(hass, STORAGE_VERSION, STORAGE_KEY, private=True)
+    reports = await async_get_reports(hass, store)
+    reports.append(report.async_as_dict(hass))
+    await store.async_save({"reports": reports[-MAX_REPORTS:]})
+
+
+async def async_get_reports(
+    hass: HomeAssistant, store: Store | None = None
+) -> list[dict[str, Any]]:
+    """Return the reports of the last startups, the latest last."""
+    if store is None:
+        store = Store(hass, STORAGE_VERSION, STORAGE_KEY, private=True)
+    if (data := await store.async_load()) is None:
+        return []
+    return data["reports"]  # type: ignore[no-any-return]
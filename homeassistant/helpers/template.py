@@ -9,22 +9,24 @@ from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 import json
 import logging
 import math
+import operator
 from operator import attrgetter
 import random
 import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
+from types import CodeType
 from typing import Any, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
-from jinja2 import pass_context
+from jinja2 import nodes, pass_context
 from jinja2.sandbox import ImmutableSandboxedEnvironment
 from jinja2.utils import Namespace
 import voluptuous as vol
@@ -81,6 +83,34 @@ _RESERVED_NAMES = {"contextfunction", "evalcontextfunction", "environmentfunctio
 
 _GROUP_DOMAIN_PREFIX = "group."
 
+# Functions with results that can change while the states they read do not
+_UNTRACKED_GLOBALS = (
+    "area_devices",
+    "area_entities",
+    "area_id",
+    "area_name",
+    "device_attr",
+    "device_entities",
+    "device_id",
+    "integration_entities",
+    "is_device_attr",
+    "lipsum",
+    "relative_time",
+    "today_at",
+)
+_UNTRACKED_FILTERS = (
+    "area_devices",
+    "area_entities",
+    "area_id",
+    "area_name",
+    "device_entities",
+    "device_id",
+    "integration_entities",
+    "random",
+    "relative_time",
+    "today_at",
+)
+
 _COLLECTABLE_STATE_ATTRIBUTES = {
     "state",
     "attributes",
@@ -92,6 +122,9 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
     "name",
 }
 
+# Number of compiled templates kept by the process wide cache
+COMPILED_CODE_CACHE_SIZE = 4096
+
 ALL_STATES_RATE_LIMIT = timedelta(minutes=1)
 DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
 
@@ -242,6 +275,12 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
+        # Set when the result depends on more than the states that were read
+        self.has_untracked_inputs = False
+        # The state each entity had when read and which of its properties
+        # were read, None if the result may depend on the whole state
+        self.state_reads: dict[str, tuple[State | None, set[Any] | None]] = {}
+        self.memoizable = False
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -261,6 +300,42 @@ class RenderInfo:
         """Template should re-render if the entity is added or removed with domains watched."""
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def _collect_read(
+        self, entity_id: str, state: State | None, prop: Any | None
+    ) -> None:
+        """Record a property of a state read by the template."""
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        if (read := self.state_reads.get(entity_id)) is None:
+            self.state_reads[entity_id] = (state, None if prop is None else {prop})
+        elif prop is None:
+            self.state_reads[entity_id] = (read[0], None)
+        elif read[1] is not None:
+            read[1].add(prop)
+
+    def async_inputs_unchanged(self, hass: HomeAssistant) -> bool:
+        """Return if rendering again would read the same states.
+
+        The result would then be unchanged as well.
+        """
+        if not self.memoizable:
+            return False
+        for entity_id, (old_state, props) in self.state_reads.items():
+            new_state = hass.states.get(entity_id)
+            if new_state is old_state:
+                continue
+            if props is None or new_state is None or old_state is None:
+                return False
+            for prop in props:
+                if isinstance(prop, tuple):
+                    # A single attribute
+                    if old_state.attributes.get(prop[1]) != new_state.attributes.get(
+                        prop[1]
+                    ):
+                        return False
+                elif getattr(old_state, prop) != getattr(new_state, prop):
+                    return False
+        return True
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -289,6 +364,16 @@ class RenderInfo:
         if self.exception:
             return
 
+        self.memoizable = not (
+            self.all_states
+            or self.all_states_lifecycle
+            or self.domains
+            or self.domains_lifecycle
+            or self.has_time
+            or self.has_untracked_inputs
+            or self.entities != self.state_reads.keys()
+        )
+
         if not self.all_states_lifecycle:
             if self.domains_lifecycle:
                 self.filter_lifecycle = self._filter_lifecycle_domains
@@ -407,8 +492,17 @@ class Template:
         if variables is not None:
             kwargs.update(variables)
 
+        native = (
+            _native_template(self.template)
+            if not self._limited and self.hass is not None
+            else None
+        )
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if native is not None and not native.names & kwargs.keys():
+                with set_template(self.template, "rendering"):
+                    render_result = native.render(self.hass)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -734,9 +828,11 @@ class TemplateState(State):
         self._state = state
         self._collect = collect
 
-    def _collect_state(self) -> None:
+    def _collect_state(self, prop: Any | None = None) -> None:
         if self._collect and _RENDER_INFO in self._hass.data:
-            self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+            self._hass.data[_RENDER_INFO]._collect_read(
+                self._state.entity_id, self._state, prop
+            )
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -745,7 +841,9 @@ class TemplateState(State):
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and _RENDER_INFO in self._hass.data:
-                self._hass.data[_RENDER_INFO].entities.add(self._state.entity_id)
+                self._hass.data[_RENDER_INFO]._collect_read(
+                    self._state.entity_id, self._state, item
+                )
             return getattr(self._state, item)
         if item == "entity_id":
             return self._state.entity_id
@@ -764,55 +862,56 @@ class TemplateState(State):
     @property
     def state(self):
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state("state")
         return self._state.state
 
     @property
     def attributes(self):
         """Wrap State.attributes."""
-        self._collect_state()
+        self._collect_state("attributes")
         return self._state.attributes
 
     @property
     def last_changed(self):
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state("last_changed")
         return self._state.last_changed
 
     @property
     def last_updated(self):
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state("last_updated")
         return self._state.last_updated
 
     @property
     def context(self):
         """Wrap State.context."""
-        self._collect_state()
+        self._collect_state("context")
         return self._state.context
 
     @property
     def domain(self):
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state("domain")
         return self._state.domain
 
     @property
     def object_id(self):
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state("object_id")
         return self._state.object_id
 
     @property
     def name(self):
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state("name")
         return self._state.name
 
     @property
     def state_with_unit(self) -> str:
         """Return the state concatenated with the unit if available."""
-        self._collect_state()
+        self._collect_state("state")
+        self._collect_state(("attributes", ATTR_UNIT_OF_MEASUREMENT))
         unit = self._state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return f"{self._state.state} {unit}" if unit else self._state.state
 
@@ -828,7 +927,9 @@ class TemplateState(State):
 
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := hass.data.get(_RENDER_INFO)) is not None:
-        entity_collect.entities.add(entity_id)
+        entity_collect._collect_read(  # pylint: disable=protected-access
+            entity_id, hass.states.get(entity_id), None
+        )
 
 
 def _state_generator(hass: HomeAssistant, domain: str | None) -> Generator:
@@ -1270,7 +1371,9 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        # pylint: disable=protected-access
+        state_obj._collect_state(("attributes", name))
+        return state_obj._state.attributes.get(name)
     return None
 
 
@@ -1833,7 +1936,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        # Environments of the same kind compile a source to the same code,
+        # whichever Home Assistant instance they belong to
+        self.compile_cache_key = (hass is None, limited, strict)
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1925,6 +2030,17 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
             return pass_context(wrapper)
 
+        def untracked(func):
+            """Wrap function that depends on more than the states it reads."""
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if (render_info := hass.data.get(_RENDER_INFO)) is not None:
+                    render_info.has_untracked_inputs = True
+                return func(*args, **kwargs)
+
+            return wrapper
+
         self.globals["device_entities"] = hassfunction(device_entities)
         self.filters["device_entities"] = pass_context(self.globals["device_entities"])
 
@@ -1951,6 +2067,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             self.globals["integration_entities"]
         )
 
+        for glob in _UNTRACKED_GLOBALS:
+            self.globals[glob] = untracked(self.globals[glob])
+        for filt in _UNTRACKED_FILTERS:
+            self.filters[filt] = untracked(self.filters[filt])
+
         if limited:
             # Only device_entities is available to limited templates, mark other
             # functions and filters as unsupported.
@@ -1987,9 +2108,9 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         self.globals["expand"] = hassfunction(expand)
         self.filters["expand"] = pass_context(self.globals["expand"])
-        self.globals["closest"] = hassfunction(closest)
-        self.filters["closest"] = pass_context(hassfunction(closest_filter))
-        self.globals["distance"] = hassfunction(distance)
+        self.globals["closest"] = untracked(hassfunction(closest))
+        self.filters["closest"] = untracked(pass_context(hassfunction(closest_filter)))
+        self.globals["distance"] = untracked(hassfunction(distance))
         self.globals["is_state"] = hassfunction(is_state)
         self.globals["is_state_attr"] = hassfunction(is_state_attr)
         self.globals["state_attr"] = hassfunction(state_attr)
@@ -2024,10 +2145,211 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+        key = (self.compile_cache_key, source)
+        if (cached := _COMPILED_CODE_CACHE.get(key)) is None:
+            cached = _COMPILED_CODE_CACHE.set(key, super().compile(source))
 
         return cached
 
 
+class CompiledCodeCache:
+    """Least recently used cache of compiled template code.
+
+    It is shared by all template environments, so the same template text
+    in many automations or scripts is only compiled once, and its code
+    outlives the templates using it for the next reload.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self.maxsize = maxsize
+        self._cache: dict[tuple[tuple[bool, bool, bool], str], CodeType] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[tuple[bool, bool, bool], str]) -> CodeType | None:
+        """Return the cached code of a template and mark it as recently used."""
+        with self._lock:
+            if (code := self._cache.pop(key, None)) is not None:
+                self._cache[key] = code
+            return code
+
+    def set(self, key: tuple[tuple[bool, bool, bool], str], code: CodeType) -> CodeType:
+        """Cache the code of a template, evicting the least recently used."""
+        with self._lock:
+            self._cache[key] = code
+            if len(self._cache) > self.maxsize:
+                del self._cache[next(iter(self._cache))]
+        return code
+
+    def __contains__(self, key: tuple[tuple[bool, bool, bool], str]) -> bool:
+        """Return if the code of a template is cached."""
+        return key in self._cache
+
+    def __len__(self) -> int:
+        """Return the number of cached templates."""
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._cache.clear()
+
+
+_COMPILED_CODE_CACHE = CompiledCodeCache(COMPILED_CODE_CACHE_SIZE)
+
+
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
+
+
+class _UnsupportedTemplate(Exception):
+    """Template is outside of the subset rendered without Jinja."""
+
+
+class NativeTemplate:
+    """A simple template rendered by Python functions instead of Jinja.
+
+    Only templates made of literals, the states, is_state, state_attr and
+    is_state_attr functions, the float, int and round filters, arithmetic,
+    comparisons and boolean operators are supported. They call the same
+    functions as the Jinja environment, so they collect the same render
+    info and render to the same text.
+    """
+
+    def __init__(
+        self, parts: list[Callable[[HomeAssistant], Any]], names: set[str]
+    ) -> None:
+        """Initialize the native template."""
+        self._parts = parts
+        # Global names which variables of the same name would shadow
+        self.names = names
+
+    def render(self, hass: HomeAssistant) -> str:
+        """Render the template."""
+        return "".join([str(part(hass)) for part in self._parts])
+
+
+_NATIVE_FUNCTIONS: dict[str, tuple[int, Callable[..., Any]]] = {
+    "states": (1, lambda hass, entity_id: AllStates(hass)(entity_id)),
+    "is_state": (2, is_state),
+    "state_attr": (2, state_attr),
+    "is_state_attr": (3, is_state_attr),
+}
+_NATIVE_FILTERS: dict[str, tuple[int, Callable[..., Any]]] = {
+    "float": (1, forgiving_float_filter),
+    "int": (2, forgiving_int_filter),
+    "round": (3, forgiving_round),
+}
+_NATIVE_BINARY_OPERATORS: dict[type[nodes.BinExpr], Callable[[Any, Any], Any]] = {
+    nodes.Add: operator.add,
+    nodes.Sub: operator.sub,
+    nodes.Mul: operator.mul,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+}
+_NATIVE_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+}
+
+
+@lru_cache(maxsize=COMPILED_CODE_CACHE_SIZE)
+def _native_template(template: str) -> NativeTemplate | None:
+    """Return the native template of a template, None if it is not supported."""
+    try:
+        body = _NO_HASS_ENV.parse(template).body
+    except jinja2.TemplateSyntaxError:
+        return None
+    if len(body) != 1 or not isinstance(body[0], nodes.Output):
+        return None
+
+    parts: list[Callable[[HomeAssistant], Any]] = []
+    names: set[str] = set()
+    try:
+        for node in body[0].nodes:
+            if isinstance(node, nodes.TemplateData):
+                parts.append(partial(_native_data, node.data))
+            else:
+                parts.append(_native_expression(node, names))
+    except _UnsupportedTemplate:
+        return None
+    return NativeTemplate(parts, names)
+
+
+def _native_data(data: str, hass: HomeAssistant) -> str:
+    """Return the data of a template."""
+    return data
+
+
+def _native_expression(
+    node: nodes.Node, names: set[str]
+) -> Callable[[HomeAssistant], Any]:
+    """Return a function evaluating an expression of a template."""
+    # pylint: disable=too-many-return-statements
+    if isinstance(node, nodes.Const):
+        value = node.value
+        return lambda hass: value
+
+    if isinstance(node, nodes.Call):
+        if (
+            not isinstance(node.node, nodes.Name)
+            or node.node.name not in _NATIVE_FUNCTIONS
+            or node.kwargs
+            or node.dyn_args
+            or node.dyn_kwargs
+        ):
+            raise _UnsupportedTemplate
+        arg_count, func = _NATIVE_FUNCTIONS[node.node.name]
+        if len(node.args) != arg_count:
+            raise _UnsupportedTemplate
+        names.add(node.node.name)
+        args = [_native_expression(arg, names) for arg in node.args]
+        return lambda hass: func(hass, *(arg(hass) for arg in args))
+
+    if isinstance(node, nodes.Filter):
+        if (
+            node.name not in _NATIVE_FILTERS
+            or node.node is None
+            or node.kwargs
+            or node.dyn_args
+            or node.dyn_kwargs
+        ):
+            raise _UnsupportedTemplate
+        arg_count, func = _NATIVE_FILTERS[node.name]
+        if len(node.args) > arg_count:
+            raise _UnsupportedTemplate
+        value = _native_expression(node.node, names)
+        args = [_native_expression(arg, names) for arg in node.args]
+        return lambda hass: func(value(hass), *(arg(hass) for arg in args))
+
+    if isinstance(node, (nodes.And, nodes.Or)):
+        left = _native_expression(node.left, names)
+        right = _native_expression(node.right, names)
+        if isinstance(node, nodes.And):
+            return lambda hass: left(hass) and right(hass)
+        return lambda hass: left(hass) or right(hass)
+
+    if isinstance(node, nodes.BinExpr):
+        if (binary_operator := _NATIVE_BINARY_OPERATORS.get(type(node))) is None:
+            raise _UnsupportedTemplate
+        left = _native_expression(node.left, names)
+        right = _native_expression(node.right, names)
+        return lambda hass: binary_operator(left(hass), right(hass))
+
+    if isinstance(node, (nodes.Not, nodes.Neg)):
+        unary_operator = operator.not_ if isinstance(node, nodes.Not) else operator.neg
+        operand = _native_expression(node.node, names)
+        return lambda hass: unary_operator(operand(hass))
+
+    if isinstance(node, nodes.Compare):
+        if len(node.ops) != 1 or node.ops[0].op not in _NATIVE_COMPARE_OPERATORS:
+            raise _UnsupportedTemplate
+        compare_operator = _NATIVE_COMPARE_OPERATORS[node.ops[0].op]
+        left = _native_expression(node.expr, names)
+        right = _native_expression(node.ops[0].expr, names)
+        return lambda hass: compare_operator(left(hass), right(hass))
+
+    raise _UnsupportedTemplate
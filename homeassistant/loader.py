@@ -7,6 +7,7 @@ documentation as possible to keep it understandable.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Iterable
 from contextlib import suppress
 import functools as ft
 import importlib
@@ -14,6 +15,7 @@ import json
 import logging
 import pathlib
 import sys
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
 
@@ -45,6 +47,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_BUILTIN_MANIFESTS = "builtin_manifests"
+DATA_IMPORT_TIME = "import_time"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -60,6 +64,10 @@ MAX_LOAD_CONCURRENTLY = 4
 
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
+# Bump when the format of the generated manifest index changes
+MANIFEST_INDEX_VERSION = 1
+MANIFEST_INDEX_PATH = pathlib.Path(__file__).parent / "generated" / "manifests.json"
+
 
 class Manifest(TypedDict, total=False):
     """
@@ -164,6 +172,42 @@ async def async_get_custom_components(
     return cast(Dict[str, "Integration"], reg_or_evt)
 
 
+def _load_builtin_manifests() -> dict[str, Manifest]:
+    """Load the manifests of the built-in integrations from the index."""
+    try:
+        index = json.loads(MANIFEST_INDEX_PATH.read_text())
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Unable to load the manifest index: %s", err)
+        return {}
+
+    if index.get("version") != MANIFEST_INDEX_VERSION:
+        _LOGGER.warning(
+            "Ignoring the manifest index, version %s is not supported",
+            index.get("version"),
+        )
+        return {}
+
+    return cast(Dict[str, Manifest], index["manifests"])
+
+
+async def async_get_builtin_manifests(hass: HomeAssistant) -> dict[str, Manifest]:
+    """Return cached manifests of the built-in integrations."""
+    if (reg_or_evt := hass.data.get(DATA_BUILTIN_MANIFESTS)) is None:
+        evt = hass.data[DATA_BUILTIN_MANIFESTS] = asyncio.Event()
+
+        reg = await hass.async_add_executor_job(_load_builtin_manifests)
+
+        hass.data[DATA_BUILTIN_MANIFESTS] = reg
+        evt.set()
+        return reg
+
+    if isinstance(reg_or_evt, asyncio.Event):
+        await reg_or_evt.wait()
+        return cast(Dict[str, Manifest], hass.data.get(DATA_BUILTIN_MANIFESTS))
+
+    return cast(Dict[str, Manifest], reg_or_evt)
+
+
 async def async_get_config_flows(hass: HomeAssistant) -> set[str]:
     """Return cached list of config flows."""
     # pylint: disable=import-outside-toplevel
@@ -542,7 +586,7 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = self._import_module(self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -555,7 +599,56 @@ class Integration:
 
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
-        return importlib.import_module(f"{self.pkg_path}.{platform_name}")
+        return self._import_module(f"{self.pkg_path}.{platform_name}")
+
+    def _import_module(self, name: str) -> ModuleType:
+        """Import a module, recording how long it took the first time."""
+        if name in sys.modules:
+            return importlib.import_module(name)
+
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self.hass.data.setdefault(DATA_IMPORT_TIME, {})[name] = (
+            time.perf_counter() - start
+        )
+        return module
+
+    def preimport(self, platforms: Iterable[str]) -> None:
+        """Import the component and platforms ahead of setting it up.
+
+        The platforms listed in PLATFORMS by the component are imported too.
+        Errors are only logged, they are raised again at setup.
+        """
+        if self.domain in self.hass.data.get(DATA_COMPONENTS, {}):
+            return
+
+        try:
+            component = self._import_module(self.pkg_path)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to import %s ahead of setup: %s", self.domain, err)
+            return
+
+        platforms = set(platforms)
+        if isinstance(
+            component_platforms := getattr(component, "PLATFORMS", None),
+            (list, tuple, set),
+        ):
+            platforms.update(
+                str(platform)
+                for platform in component_platforms
+                if isinstance(platform, str)
+            )
+
+        for platform in platforms:
+            try:
+                self._import_module(f"{self.pkg_path}.{platform}")
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.debug(
+                    "Unable to import %s.%s ahead of setup: %s",
+                    self.domain,
+                    platform,
+                    err,
+                )
 
     def __repr__(self) -> str:
         """Text representation of class."""
@@ -609,6 +702,16 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
+    # Built-in integrations are resolved from the manifest index, without
+    # reading their manifest file
+    if manifest := (await async_get_builtin_manifests(hass)).get(domain):
+        return Integration(
+            hass,
+            f"{PACKAGE_BUILTIN}.{domain}",
+            pathlib.Path(components.__path__[0]) / domain,
+            cast(Manifest, manifest.copy()),
+        )
+
     if integration := await hass.async_add_executor_job(
         Integration.resolve_from_root, hass, components, domain
     ):
@@ -617,6 +720,41 @@ async def _async_get_integration(hass: HomeAssistant, domain: str) -> Integratio
     raise IntegrationNotFound(domain)
 
 
+async def async_preimport_integrations(
+    hass: HomeAssistant,
+    integrations: Iterable[Integration],
+    platforms: dict[str, set[str]],
+) -> None:
+    """Import integrations and their platforms in the executor.
+
+    Integrations are imported after the integrations they depend on, so two
+    imports never wait on the same modules. Platforms are the extra
+    platforms to import by domain.
+    """
+    to_import = {integration.domain: integration for integration in integrations}
+    semaphore = asyncio.Semaphore(MAX_LOAD_CONCURRENTLY)
+
+    async def _async_preimport(integration: Integration) -> None:
+        """Import an integration in the executor."""
+        async with semaphore:
+            await hass.async_add_executor_job(
+                integration.preimport, platforms.get(integration.domain, ())
+            )
+
+    while to_import:
+        ready = [
+            integration
+            for integration in to_import.values()
+            if not to_import.keys() & set(integration.dependencies)
+        ]
+        # Import what remains of circular dependencies together
+        if not ready:
+            ready = list(to_import.values())
+        for integration in ready:
+            del to_import[integration.domain]
+        await asyncio.gather(*(_async_preimport(itg) for itg in ready))
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -5,10 +5,13 @@ import asyncio
 from collections.abc import Iterable
 import logging
 import os
+import site
+import sys
 from typing import Any, cast
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.typing import UNDEFINED, UndefinedType
 from homeassistant.loader import Integration, IntegrationNotFound, async_get_integration
 import homeassistant.util.package as pkg_util
@@ -21,7 +24,11 @@ DATA_PIP_LOCK = "pip_lock"
 DATA_PKG_CACHE = "pkg_cache"
 DATA_INTEGRATIONS_WITH_REQS = "integrations_with_reqs"
 DATA_INSTALL_FAILURE_HISTORY = "install_failure_history"
+DATA_SATISFIED_READ_ONLY = "satisfied_requirements_read_only"
 CONSTRAINT_FILE = "package_constraints.txt"
+STORAGE_KEY = "core.satisfied_requirements"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
 DISCOVERY_INTEGRATIONS: dict[str, Iterable[str]] = {
     "dhcp": ("dhcp",),
     "mqtt": ("mqtt",),
@@ -136,6 +143,96 @@ async def _async_process_integration(
             raise result
 
 
+def _get_environment(config_dir: str) -> dict[str, Any]:
+    """Return what tells if the installed packages changed.
+
+    Installing or removing a package changes the modification time of the
+    directory it is installed in: a site-packages directory or the deps
+    directory of the config.
+    """
+    paths = [
+        *site.getsitepackages(),
+        site.getusersitepackages(),
+        os.path.join(config_dir, "deps"),
+    ]
+    return {
+        "python": sys.version,
+        "paths": {
+            path: os.stat(path).st_mtime_ns for path in paths if os.path.isdir(path)
+        },
+    }
+
+
+class SatisfiedRequirements:
+    """Requirements known to be installed, kept until packages change."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the satisfied requirements."""
+        self.hass = hass
+        self.environment: dict[str, Any] = {}
+        self.requirements: set[str] = set()
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY, private=True)
+
+    async def async_load(self) -> None:
+        """Load the requirements satisfied in the current environment."""
+        try:
+            data = await self._store.async_load()
+        except HomeAssistantError as err:
+            _LOGGER.warning("Unable to load the satisfied requirements: %s", err)
+            data = None
+        self.environment = await self.hass.async_add_executor_job(
+            _get_environment, self.hass.config.config_dir
+        )
+        if data and data["environment"] == self.environment:
+            self.requirements = set(data["requirements"])
+
+    async def async_packages_changed(self) -> None:
+        """Forget the satisfied requirements after installing packages."""
+        self.environment = await self.hass.async_add_executor_job(
+            _get_environment, self.hass.config.config_dir
+        )
+        self.requirements.clear()
+        self._async_schedule_save()
+
+    @callback
+    def async_add(self, requirement: str) -> None:
+        """Add a satisfied requirement."""
+        self.requirements.add(requirement)
+        self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the satisfied requirements."""
+        # The check_config script must not write to the config it checks
+        if not self.hass.data.get(DATA_SATISFIED_READ_ONLY):
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "environment": self.environment,
+            "requirements": sorted(self.requirements),
+        }
+
+
+async def _async_get_satisfied_requirements(
+    hass: HomeAssistant,
+) -> SatisfiedRequirements:
+    """Return the requirements known to be installed."""
+    if (load_task := hass.data.get(DATA_PKG_CACHE)) is None:
+        satisfied = SatisfiedRequirements(hass)
+
+        async def _async_load() -> SatisfiedRequirements:
+            """Load the satisfied requirements."""
+            await satisfied.async_load()
+            return satisfied
+
+        load_task = hass.data[DATA_PKG_CACHE] = hass.async_create_task(_async_load())
+
+    return cast(SatisfiedRequirements, await load_task)
+
+
 @callback
 def async_clear_install_history(hass: HomeAssistant) -> None:
     """Forget the install history."""
@@ -157,13 +254,21 @@ async def async_process_requirements(
     if install_failure_history is None:
         install_failure_history = hass.data[DATA_INSTALL_FAILURE_HISTORY] = set()
 
+    # Requirements satisfied in this environment before don't need the lock
+    satisfied = await _async_get_satisfied_requirements(hass)
+    if satisfied.requirements.issuperset(requirements):
+        return
+
     kwargs = pip_kwargs(hass.config.config_dir)
 
     async with pip_lock:
         for req in requirements:
+            if req in satisfied.requirements:
+                continue
             await _async_process_requirements(
                 hass, name, req, install_failure_history, kwargs
             )
+            satisfied.async_add(req)
 
 
 async def _async_process_requirements(
@@ -190,6 +295,8 @@ async def _async_process_requirements(
 
     for _ in range(MAX_INSTALL_FAILURES):
         if await hass.async_add_executor_job(_install, req, kwargs):
+            satisfied = await _async_get_satisfied_requirements(hass)
+            await satisfied.async_packages_changed()
             return
 
     install_failure_history.add(req)
@@ -11,10 +11,13 @@ import json
 import logging
 from timeit import default_timer as timer
 from typing import TypeVar
+from unittest.mock import patch
 
 from homeassistant import core
+from homeassistant.components.websocket_api import messages
 from homeassistant.components.websocket_api.const import JSON_DUMP
 from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.helpers import template
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
@@ -391,6 +394,98 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def json_serialize_states_stdlib(hass):
+    """Serialize million states with the standard library encoder."""
+    states = [
+        core.State("light.kitchen", "on", {"friendly_name": "Kitchen Lights"})
+        for _ in range(10 ** 6)
+    ]
+
+    start = timer()
+    json.dumps(states, cls=JSONEncoder, allow_nan=False)
+    return timer() - start
+
+
+@benchmark
+async def json_serialize_get_states(hass):
+    """Serialize the states of 5000 entities a hundred times like get_states."""
+    for idx in range(5000):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx}",
+            str(idx),
+            {"friendly_name": f"Sensor {idx}", "unit_of_measurement": "W"},
+        )
+
+    start = timer()
+    for idx in range(100):
+        states = hass.states.async_all()
+        messages.construct_result_message(
+            idx, f'[{",".join(state.as_dict_json for state in states)}]'
+        )
+    return timer() - start
+
+
+@benchmark
+async def json_serialize_state_changed_fan_out(hass):
+    """Serialize 10k state_changed events for 40 websocket subscriptions."""
+    events = []
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    for idx in range(10 ** 4):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx % 100}",
+            str(idx),
+            {"friendly_name": f"Sensor {idx % 100}", "unit_of_measurement": "W"},
+        )
+    await hass.async_block_till_done()
+
+    start = timer()
+    for event in events:
+        for iden in range(40):
+            messages.cached_event_message(iden, event)
+    return timer() - start
+
+
+@benchmark
+async def render_simple_templates(hass):
+    """Render simple templates 100k times without Jinja."""
+    return _render_simple_templates(hass)
+
+
+@benchmark
+async def render_simple_templates_jinja(hass):
+    """Render simple templates 100k times with Jinja."""
+    with patch("homeassistant.helpers.template._native_template", return_value=None):
+        return _render_simple_templates(hass)
+
+
+def _render_simple_templates(hass):
+    """Render simple templates 100k times."""
+    hass.states.async_set("sensor.power", "12.5", {"voltage": 230})
+    hass.states.async_set("switch.heater", "on")
+    templates = [
+        template.Template(template_str, hass)
+        for template_str in (
+            "{{ states('sensor.power') }}",
+            "{{ is_state('switch.heater', 'on') }}",
+            "{{ state_attr('sensor.power', 'voltage') | float * 2 }}",
+            "{{ (states('sensor.power') | float / 1000) | round(3) }}",
+        )
+    ]
+
+    start = timer()
+    for _ in range(25000):
+        for tpl in templates:
+            tpl.async_render_to_info()
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
@@ -16,6 +16,7 @@ from homeassistant.config import get_default_config_dir
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import area_registry, device_registry, entity_registry
 from homeassistant.helpers.check_config import async_check_ha_config_file
+from homeassistant.requirements import DATA_SATISFIED_READ_ONLY
 from homeassistant.util.yaml import Secrets
 import homeassistant.util.yaml.loader as yaml_loader
 
@@ -189,9 +190,13 @@ def check(config_dir, secrets=False):
     for pat in PATCHES.values():
         pat.start()
 
+    # Parse every file again, to see the files and secrets they load
+    yaml_loader.clear_cache()
+
     if secrets:
         # Ensure !secrets point to the patched function
-        yaml_loader.SafeLineLoader.add_constructor("!secret", yaml_loader.secret_yaml)
+        for loader in (yaml_loader.FastSafeLoader, yaml_loader.SafeLineLoader):
+            loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     def secrets_proxy(*args):
         secrets = Secrets(*args)
@@ -219,9 +224,8 @@ def check(config_dir, secrets=False):
             pat.stop()
         if secrets:
             # Ensure !secrets point to the original function
-            yaml_loader.SafeLineLoader.add_constructor(
-                "!secret", yaml_loader.secret_yaml
-            )
+            for loader in (yaml_loader.FastSafeLoader, yaml_loader.SafeLineLoader):
+                loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     return res
 
@@ -230,6 +234,7 @@ async def async_check_config(config_dir):
     """Check the HA config."""
     hass = core.HomeAssistant()
     hass.config.config_dir = config_dir
+    hass.data[DATA_SATISFIED_READ_ONLY] = True
     await area_registry.async_load(hass)
     await device_registry.async_load(hass)
     await entity_registry.async_load(hass)
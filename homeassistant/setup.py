@@ -18,6 +18,11 @@ from homeassistant.const import (
 )
 from homeassistant.core import CALLBACK_TYPE
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.startup_report import (
+    CATEGORY_INTEGRATIONS,
+    CATEGORY_PLATFORMS,
+    async_measure,
+)
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util, ensure_unique_string
 
@@ -178,7 +183,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with async_measure(hass, CATEGORY_INTEGRATIONS, domain, "import"):
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -186,9 +192,10 @@ async def _async_setup_component(
         _LOGGER.exception("Setup failed for %s: unknown error", domain)
         return False
 
-    processed_config = await conf_util.async_process_component_config(
-        hass, config, integration
-    )
+    with async_measure(hass, CATEGORY_INTEGRATIONS, domain, "config"):
+        processed_config = await conf_util.async_process_component_config(
+            hass, config, integration
+        )
 
     if processed_config is None:
         log_error("Invalid config.", integration.documentation)
@@ -225,8 +232,9 @@ async def _async_setup_component(
                 return False
 
             if task:
-                async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
-                    result = await task
+                with async_measure(hass, CATEGORY_INTEGRATIONS, domain, "setup"):
+                    async with hass.timeout.async_timeout(SLOW_SETUP_MAX_WAIT, domain):
+                        result = await task
         except asyncio.TimeoutError:
             _LOGGER.error(
                 "Setup of %s is taking longer than %s seconds."
@@ -306,7 +314,10 @@ async def async_prepare_setup_platform(
         return None
 
     try:
-        platform = integration.get_platform(domain)
+        with async_measure(
+            hass, CATEGORY_PLATFORMS, f"{domain}.{platform_name}", "import"
+        ):
+            platform = integration.get_platform(domain)
     except ImportError as exc:
         log_error(f"Platform not found ({exc}).")
         return None
@@ -345,14 +356,21 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if not await _async_process_dependencies(hass, config, integration):
+    with async_measure(hass, CATEGORY_INTEGRATIONS, integration.domain, "dependencies"):
+        dependencies_processed = await _async_process_dependencies(
+            hass, config, integration
+        )
+    if not dependencies_processed:
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        async with hass.timeout.async_freeze(integration.domain):
-            await requirements.async_get_integration_with_requirements(
-                hass, integration.domain
-            )
+        with async_measure(
+            hass, CATEGORY_INTEGRATIONS, integration.domain, "requirements"
+        ):
+            async with hass.timeout.async_freeze(integration.domain):
+                await requirements.async_get_integration_with_requirements(
+                    hass, integration.domain
+                )
 
     processed.add(integration.domain)
 
@@ -3,15 +3,20 @@ from __future__ import annotations
 
 from collections import deque
 from collections.abc import Callable
+import datetime
 import json
 import logging
-from typing import Any
+from typing import Any, Final
 
-from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
 
 from .file import write_utf8_file, write_utf8_file_atomic
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -68,6 +73,64 @@ def save_json(
         write_utf8_file(filename, json_data, private)
 
 
+def json_encoder_default(obj: Any) -> Any:
+    """Convert Home Assistant objects.
+
+    Used as default hook of both JSON backends.
+    """
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    if hasattr(obj, "keys"):
+        # Mappings which are not a dict, like MappingProxyType
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps_stdlib(data: Any) -> str:
+    """Dump compact json string with the standard library."""
+    return json.dumps(
+        data, default=json_encoder_default, allow_nan=False, separators=(",", ":")
+    )
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Convert Home Assistant objects, splicing in their encoded JSON."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.core import Event, State
+
+    if isinstance(obj, (State, Event)):
+        return orjson.Fragment(obj.as_dict_json)
+    return json_encoder_default(obj)
+
+
+def _json_dumps_orjson(data: Any) -> str:
+    """Dump compact json string with orjson.
+
+    Dataclasses are handed to the default hook like the standard library
+    does. Unlike the standard library, NaN and infinity are encoded as null
+    instead of raising ValueError.
+    """
+    return orjson.dumps(
+        data,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS,
+        default=_orjson_default,
+    ).decode("utf-8")
+
+
+JSON_BACKEND: Final = "json" if orjson is None else "orjson"
+
+if orjson is not None:
+    json_dumps: Callable[[Any], str] = _json_dumps_orjson
+    json_loads: Callable[[str | bytes], Any] = orjson.loads
+else:  # pragma: no cover
+    json_dumps = _json_dumps_stdlib
+    json_loads = json.loads
+
+
 def format_unserializable_data(data: dict[str, Any]) -> str:
     """Format output of find_paths in a friendly way.
 
@@ -83,6 +146,9 @@ def find_paths_unserializable_data(
 
     This method is slow! Only use for error handling.
     """
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.core import Event, State
+
     to_process = deque([(bad_data, "$")])
     invalid = {}
 
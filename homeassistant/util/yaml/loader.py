@@ -3,14 +3,24 @@ from __future__ import annotations
 
 from collections import OrderedDict
 from collections.abc import Iterator
+from copy import deepcopy
 import fnmatch
 import logging
 import os
 from pathlib import Path
+import threading
 from typing import Any, TextIO, TypeVar, Union, overload
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as FastestAvailableSafeLoader
+
+    HAS_C_LOADER = True
+except ImportError:
+    HAS_C_LOADER = False
+    from yaml import SafeLoader as FastestAvailableSafeLoader  # type: ignore[misc]
+
 from homeassistant.exceptions import HomeAssistantError
 
 from .const import SECRET_YAML
@@ -61,6 +71,7 @@ class Secrets:
     def _load_secret_yaml(self, secret_dir: Path) -> dict[str, str]:
         """Load the secrets yaml from path."""
         if (secret_path := secret_dir / SECRET_YAML) in self._cache:
+            _record_dependency(str(secret_path))
             return self._cache[secret_path]
 
         _LOGGER.debug("Loading %s", secret_path)
@@ -88,6 +99,26 @@ class Secrets:
         return secrets
 
 
+class FastSafeLoader(FastestAvailableSafeLoader):
+    """The fastest available safe loader, backed by libyaml when installed.
+
+    The C parser does not report the line being composed, the line of a node
+    is taken from its start mark instead.
+    """
+
+    def __init__(self, stream: Any, secrets: Secrets | None = None) -> None:
+        """Initialize a fast safe loader."""
+        super().__init__(stream)
+        if isinstance(stream, str):
+            self.name = "<unicode string>"
+        elif isinstance(stream, bytes):
+            self.name = "<byte string>"
+        else:
+            self.name = getattr(stream, "name", "<file>")
+        self.stream = stream
+        self.secrets = secrets
+
+
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
@@ -104,52 +135,182 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+LoaderType = Union[FastSafeLoader, SafeLineLoader]
+
+
+class _Dependencies:
+    """The files and directories a YAML file was built from."""
+
+    __slots__ = ("files", "cacheable")
+
+    def __init__(self) -> None:
+        """Initialize the dependencies."""
+        self.files: dict[str, tuple[int, int] | None] = {}
+        self.cacheable = True
+
+    def is_current(self) -> bool:
+        """Return if none of the files changed since they were recorded."""
+        return all(
+            _file_signature(path) == signature for path, signature in self.files.items()
+        )
+
+
+class _CachedYaml:
+    """A parsed YAML file together with what it was built from."""
+
+    __slots__ = ("dependencies", "content")
+
+    def __init__(self, dependencies: _Dependencies, content: JSON_TYPE) -> None:
+        """Initialize the cached YAML."""
+        self.dependencies = dependencies
+        self.content = content
+
+
+# Parsed YAML files by path and secrets directory
+_PARSED_CACHE: dict[tuple[str, Path | None], _CachedYaml] = {}
+# The dependencies of the YAML files being loaded by the current thread
+_LOADING = threading.local()
+
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    """Return the modification time and size of a file, None if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _loading_stack() -> list[_Dependencies]:
+    """Return the dependencies of the YAML files being loaded."""
+    if (stack := getattr(_LOADING, "stack", None)) is None:
+        stack = _LOADING.stack = []
+    return stack
+
+
+def _record_dependency(path: str) -> None:
+    """Record that the YAML file being loaded depends on a path."""
+    if stack := _loading_stack():
+        stack[-1].files[path] = _file_signature(path)
+
+
+def _mark_uncacheable() -> None:
+    """Record that the YAML file being loaded can not be reused."""
+    if stack := _loading_stack():
+        stack[-1].cacheable = False
+
+
+def clear_cache() -> None:
+    """Forget the parsed YAML files."""
+    _PARSED_CACHE.clear()
+
+
 def load_yaml(fname: str, secrets: Secrets | None = None) -> JSON_TYPE:
-    """Load a YAML file."""
+    """Load a YAML file.
+
+    A file is only parsed again when it, or one of the files it includes,
+    changed since it was last loaded.
+    """
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file, secrets)
+            return _load_yaml_file(conf_file, str(fname), secrets)
+    except FileNotFoundError:
+        _record_dependency(str(fname))
+        raise
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
 
 
+def _load_yaml_file(
+    conf_file: TextIO, fname: str, secrets: Secrets | None
+) -> JSON_TYPE:
+    """Load an opened YAML file, reusing the last result if it is current."""
+    stack = _loading_stack()
+    try:
+        stat = os.fstat(conf_file.fileno())
+    except (AttributeError, OSError):
+        # Not a file on disk, we can't tell when it changes
+        _mark_uncacheable()
+        return parse_yaml(conf_file, secrets)
+
+    key = (fname, secrets.config_dir if secrets else None)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    if (
+        (cached := _PARSED_CACHE.get(key)) is not None
+        and cached.dependencies.files[fname] == signature
+        and cached.dependencies.is_current()
+    ):
+        if stack:
+            stack[-1].files.update(cached.dependencies.files)
+        return deepcopy(cached.content)
+
+    dependencies = _Dependencies()
+    dependencies.files[fname] = signature
+    stack.append(dependencies)
+    try:
+        content = parse_yaml(conf_file, secrets)
+    finally:
+        stack.pop()
+
+    if stack:
+        stack[-1].files.update(dependencies.files)
+        stack[-1].cacheable &= dependencies.cacheable
+
+    if dependencies.cacheable:
+        _PARSED_CACHE[key] = _CachedYaml(dependencies, deepcopy(content))
+    else:
+        _PARSED_CACHE.pop(key, None)
+
+    return content
+
+
 def parse_yaml(content: str | TextIO, secrets: Secrets | None = None) -> JSON_TYPE:
     """Load a YAML file."""
     try:
         # If configuration file is empty YAML returns None
         # We convert that to an empty dict
-        return (
-            yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
-            or OrderedDict()
-        )
+        return _parse_yaml(content, secrets) or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
 
 
+def _parse_yaml(content: str | TextIO, secrets: Secrets | None) -> JSON_TYPE:
+    """Parse YAML with the fast loader, and the line loader if it fails."""
+    if HAS_C_LOADER:
+        try:
+            return yaml.load(
+                content, Loader=lambda stream: FastSafeLoader(stream, secrets)
+            )
+        except yaml.YAMLError:
+            # Parse again for the more detailed errors of the line loader
+            if not isinstance(content, str):
+                content.seek(0)
+    return yaml.load(content, Loader=lambda stream: SafeLineLoader(stream, secrets))
+
+
 @overload
 def _add_reference(
-    obj: list | NodeListClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: list | NodeListClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeListClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: str | NodeStrClass, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj: str | NodeStrClass, loader: LoaderType, node: yaml.nodes.Node
 ) -> NodeStrClass:
     ...
 
 
 @overload
-def _add_reference(
-    obj: DICT_T, loader: SafeLineLoader, node: yaml.nodes.Node
-) -> DICT_T:
+def _add_reference(obj: DICT_T, loader: LoaderType, node: yaml.nodes.Node) -> DICT_T:
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore
+def _add_reference(obj, loader: LoaderType, node: yaml.nodes.Node):  # type: ignore
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -160,7 +321,7 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -183,7 +344,9 @@ def _is_file_valid(name: str) -> bool:
 
 def _find_files(directory: str, pattern: str) -> Iterator[str]:
     """Recursively load files in a directory."""
+    _record_dependency(directory)
     for root, dirs, files in os.walk(directory, topdown=True):
+        _record_dependency(root)
         dirs[:] = [d for d in dirs if _is_file_valid(d)]
         for basename in sorted(files):
             if _is_file_valid(basename) and fnmatch.fnmatch(basename, pattern):
@@ -191,9 +354,7 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
                 yield filename
 
 
-def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
-) -> OrderedDict:
+def _include_dir_named_yaml(loader: LoaderType, node: yaml.nodes.Node) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -206,7 +367,7 @@ def _include_dir_named_yaml(
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -221,7 +382,7 @@ def _include_dir_merge_named_yaml(
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> list[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -233,7 +394,7 @@ def _include_dir_list_yaml(
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: LoaderType, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
@@ -247,7 +408,7 @@ def _include_dir_merge_list_yaml(
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: LoaderType, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -279,14 +440,16 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: LoaderType, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
+    # The environment is not tracked for changes
+    _mark_uncacheable()
     args = node.value.split()
 
     # Check for a default value
@@ -298,7 +461,7 @@ def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
     raise HomeAssistantError(node.value)
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: LoaderType, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     if loader.secrets is None:
         raise HomeAssistantError("Secrets not supported in this YAML file")
@@ -306,19 +469,23 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     return loader.secrets.get(loader.name, node.value)
 
 
-SafeLineLoader.add_constructor("!include", _include_yaml)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-SafeLineLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-SafeLineLoader.add_constructor("!env_var", _env_var_yaml)
-SafeLineLoader.add_constructor("!secret", secret_yaml)
-SafeLineLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-SafeLineLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-SafeLineLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-SafeLineLoader.add_constructor("!input", Input.from_node)
+def _add_constructors(loader: type[LoaderType]) -> None:
+    """Add the Home Assistant constructors to a loader."""
+    loader.add_constructor("!include", _include_yaml)
+    loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
+    )
+    loader.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
+    )
+    loader.add_constructor("!env_var", _env_var_yaml)
+    loader.add_constructor("!secret", secret_yaml)
+    loader.add_constructor("!include_dir_list", _include_dir_list_yaml)
+    loader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+    loader.add_constructor("!include_dir_named", _include_dir_named_yaml)
+    loader.add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
+    loader.add_constructor("!input", Input.from_node)
+
+
+_add_constructors(FastSafeLoader)
+_add_constructors(SafeLineLoader)
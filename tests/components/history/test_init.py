@@ -5,8 +5,10 @@ from http import HTTPStatus
 import json
 from unittest.mock import patch, sentinel
 
+from aiohttp import ClientPayloadError
 import pytest
 from pytest import approx
+from sqlalchemy.exc import SQLAlchemyError
 
 from homeassistant.components import history, recorder
 from homeassistant.components.recorder.history import get_significant_states
@@ -614,6 +616,123 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == HTTPStatus.OK
 
 
+@pytest.mark.parametrize("minimal_response", [False, True])
+async def test_fetch_period_api_with_stream(hass, hass_client, minimal_response):
+    """Test the fetch period view for history streaming one entity at a time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await hass.async_add_executor_job(instance.block_till_done)
+    start = dt_util.utcnow()
+    for state in ("on", "off", "on"):
+        hass.states.async_set("light.kitchen", state, {"brightness": 5})
+        hass.states.async_set("sensor.power", state)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    client = await hass_client()
+    query = "?minimal_response" if minimal_response else "?"
+    response = await client.get(f"/api/history/period/{start.isoformat()}{query}")
+    assert response.status == HTTPStatus.OK
+    expected = await response.json()
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}{query}&stream"
+    )
+    assert response.status == HTTPStatus.OK
+    streamed = await response.json()
+    assert len(streamed) == 2
+    assert sorted(streamed, key=lambda states: states[0]["entity_id"]) == sorted(
+        expected, key=lambda states: states[0]["entity_id"]
+    )
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?stream",
+        params={"filter_entity_id": "non.existing"},
+    )
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == []
+
+
+async def test_fetch_period_api_with_stream_nan(hass, hass_client):
+    """Test streaming encodes NaN attributes like the regular response."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await hass.async_add_executor_job(instance.block_till_done)
+    start = dt_util.utcnow()
+    hass.states.async_set("sensor.power", "on", {"value": float("nan")})
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    client = await hass_client()
+    response = await client.get(f"/api/history/period/{start.isoformat()}")
+    assert response.status == HTTPStatus.OK
+    expected = await response.json()
+    assert expected[0][0]["attributes"] == {"value": None}
+
+    response = await client.get(f"/api/history/period/{start.isoformat()}?stream")
+    assert response.status == HTTPStatus.OK
+    assert await response.json() == expected
+
+
+async def test_fetch_period_api_with_stream_error(hass, hass_client, caplog):
+    """Test a database error while streaming truncates the response."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+
+    def _stream_with_error(*args):
+        yield [ha.State("light.kitchen", "on")]
+        raise SQLAlchemyError("Boom")
+
+    client = await hass_client()
+    with patch(
+        "homeassistant.components.recorder.history.stream_significant_states_with_session",
+        _stream_with_error,
+    ):
+        response = await client.get(
+            f"/api/history/period/{dt_util.utcnow().isoformat()}?stream"
+        )
+        assert response.status == HTTPStatus.OK
+        with pytest.raises(ClientPayloadError):
+            await response.read()
+
+    assert "Error streaming the history" in caplog.text
+
+
+async def test_fetch_period_api_with_columnar(hass, hass_client):
+    """Test the fetch period view for history with the columnar format."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await hass.async_add_executor_job(instance.block_till_done)
+    start = dt_util.utcnow()
+    for state in ("on", "off"):
+        hass.states.async_set("light.kitchen", state, {"brightness": 5})
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}",
+        params={"filter_entity_id": "light.kitchen", "columnar": ""},
+    )
+    assert response.status == HTTPStatus.OK
+    response_json = await response.json()
+    assert len(response_json) == 1
+    columns = response_json[0]
+    assert columns["entity_id"] == "light.kitchen"
+    assert columns["state"] == ["on", "off"]
+    assert columns["attributes"] == [{"brightness": 5}, None]
+    assert start.timestamp() < columns["last_updated"][0] < columns["last_updated"][1]
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -922,6 +1041,95 @@ async def test_statistics_during_period(
     }
 
 
+async def test_stream_history_during_period(hass, hass_ws_client):
+    """Test streaming the history over the websocket."""
+    now = dt_util.utcnow()
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    instance = hass.data[recorder.DATA_INSTANCE]
+    await hass.async_add_executor_job(instance.block_till_done)
+    for state in ("on", "off"):
+        hass.states.async_set("light.kitchen", state, {"brightness": 5})
+        hass.states.async_set("sensor.power", state)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(instance.block_till_done)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream_history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["light.kitchen", "sensor.power"],
+            "minimal_response": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    history_by_entity = {}
+    while True:
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert response["type"] == "event"
+        if response["event"] == {"done": True}:
+            break
+        history_by_entity.update(response["event"])
+
+    assert list(history_by_entity) == ["light.kitchen", "sensor.power"]
+    kitchen = history_by_entity["light.kitchen"]
+    assert [state["state"] for state in kitchen] == ["on", "off"]
+    assert kitchen[0]["attributes"] == {"brightness": 5}
+    assert kitchen[1]["entity_id"] == "light.kitchen"
+
+
+async def test_stream_history_during_period_error(hass, hass_ws_client):
+    """Test an error while streaming the history is sent to the client."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+
+    client = await hass_ws_client()
+    with patch(
+        "homeassistant.components.recorder.history.stream_significant_states_with_session",
+        side_effect=ValueError("Boom"),
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/stream_history_during_period",
+                "start_time": dt_util.utcnow().isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert not response["success"]
+        assert response["error"]["code"] == "unknown_error"
+
+
+async def test_stream_history_during_period_bad_start_time(hass, hass_ws_client):
+    """Test streaming the history with a bad start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream_history_during_period",
+            "start_time": "cats",
+        }
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
 async def test_statistics_during_period_bad_start_time(hass, hass_ws_client):
     """Test statistics_during_period."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -43,7 +43,6 @@ from homeassistant.const import (
     __version__,
     __version__ as hass_version,
 )
-from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 
 from tests.common import async_mock_service
 
@@ -59,9 +58,10 @@ async def test_accessory_cancels_track_state_change_on_stop(hass, hk_driver):
         "homeassistant.components.homekit.accessories.HomeAccessory.async_update_state"
     ):
         await acc.run()
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS][entity_id]) == 1
+    keyed_listeners = hass.bus._keyed_listeners["state_changed"]["entity_id"]
+    assert len(keyed_listeners[entity_id]) == 1
     await acc.stop()
-    assert entity_id not in hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+    assert entity_id not in keyed_listeners
 
 
 async def test_home_accessory(hass, hk_driver):
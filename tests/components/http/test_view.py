@@ -1,6 +1,6 @@
 """Tests for Home Assistant View."""
 from http import HTTPStatus
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
@@ -15,6 +15,7 @@ from homeassistant.components.http.view import (
     request_handler_factory,
 )
 from homeassistant.exceptions import ServiceNotFound, Unauthorized
+from homeassistant.util.json import _json_dumps_orjson, _json_dumps_stdlib
 
 
 @pytest.fixture
@@ -33,11 +34,26 @@ async def test_invalid_json(caplog):
     """Test trying to return invalid JSON."""
     view = HomeAssistantView()
 
-    with pytest.raises(HTTPInternalServerError):
+    with patch(
+        "homeassistant.components.http.view.json_dumps", _json_dumps_stdlib
+    ), pytest.raises(HTTPInternalServerError):
         view.json(float("NaN"))
 
     assert str(float("NaN")) in caplog.text
 
+    with pytest.raises(HTTPInternalServerError):
+        view.json(object())
+
+
+async def test_nan_json_orjson():
+    """Test orjson encodes NaN as null."""
+    view = HomeAssistantView()
+
+    with patch("homeassistant.components.http.view.json_dumps", _json_dumps_orjson):
+        response = view.json({"value": float("NaN")})
+
+    assert response.body == b'{"value":null}'
+
 
 async def test_handling_unauthorized(mock_request):
     """Test handling unauth exceptions."""
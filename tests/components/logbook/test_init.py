@@ -1954,3 +1954,176 @@ class MockLazyEventPartialState(ha.Event):
     def time_fired_isoformat(self):
         """Time event was fired in utc isoformat."""
         return process_timestamp_to_utc_isoformat(self.time_fired)
+
+
+async def test_event_stream(hass, hass_ws_client):
+    """Test the logbook event stream sends the history, then live entries."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    start = dt_util.utcnow()
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_ON)
+    hass.states.async_set("switch.other", STATE_OFF)
+    hass.states.async_set("switch.other", STATE_ON)
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "logbook/event_stream",
+            "start_time": start.isoformat(),
+            "entity_ids": ["light.kitchen"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    # The state changes not committed yet are part of the history
+    response = await client.receive_json()
+    assert response["id"] == 1
+    assert response["type"] == "event"
+    assert [
+        (entry["entity_id"], entry["state"]) for entry in response["event"]["events"]
+    ] == [("light.kitchen", STATE_ON)]
+
+    context = ha.Context(id="ac5bd62de45711eaaeb351041eec8dd9")
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_off"},
+        context=context,
+    )
+    hass.states.async_set("switch.other", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_OFF, context=context)
+    logbook.async_log_entry(hass, "Alarm", "is triggered", entity_id="light.kitchen")
+    await hass.async_block_till_done()
+
+    response = await client.receive_json()
+    entry = response["event"]["events"][0]
+    assert entry["entity_id"] == "light.kitchen"
+    assert entry["state"] == STATE_OFF
+    assert entry["context_domain"] == "light"
+    assert entry["context_service"] == "turn_off"
+    assert entry["context_event_type"] == EVENT_CALL_SERVICE
+
+    response = await client.receive_json()
+    assert response["event"]["events"] == [
+        {
+            "when": response["event"]["events"][0]["when"],
+            "name": "Alarm",
+            "message": "is triggered",
+            "domain": "light",
+            "entity_id": "light.kitchen",
+        }
+    ]
+
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert response["id"] == 2
+    assert response["success"]
+
+    hass.states.async_set("light.kitchen", STATE_ON)
+    await hass.async_block_till_done()
+    await client.send_json({"id": 3, "type": "ping"})
+    response = await client.receive_json()
+    assert response == {"id": 3, "type": "pong"}
+
+
+async def test_event_stream_error(hass, hass_ws_client):
+    """Test the logbook event stream stops if the history cannot be read."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_block_till_done()
+
+    client = await hass_ws_client()
+    init_listeners = hass.bus.async_listeners()
+    with patch(
+        "homeassistant.components.logbook._get_events", side_effect=ValueError("Boom")
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "logbook/event_stream",
+                "start_time": dt_util.utcnow().isoformat(),
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        response = await client.receive_json()
+        assert response["id"] == 1
+        assert not response["success"]
+        assert response["error"]["code"] == "unknown_error"
+
+    listeners = hass.bus.async_listeners()
+    for event_type in logbook.ALL_EVENT_TYPES:
+        assert listeners.get(event_type) == init_listeners.get(event_type)
+
+
+async def test_event_stream_bad_start_time(hass, hass_ws_client):
+    """Test the logbook event stream with a bad start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 1, "type": "logbook/event_stream", "start_time": "cats"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_start_time"
+
+
+@pytest.mark.parametrize("entity_param", [{}, {"entity": "switch.test"}])
+async def test_logbook_view_pagination(hass, hass_client, entity_param):
+    """Test the logbook view returns pages of events, newest first."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow()
+    for state in ("0", "1", "2", "3", "4"):
+        hass.states.async_set("switch.test", state)
+    await hass.async_add_executor_job(trigger_db_commit, hass)
+    await hass.async_block_till_done()
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    client = await hass_client()
+    params = {
+        **entity_param,
+        "end_time": (start + timedelta(hours=1)).isoformat(),
+        "limit": "2",
+    }
+    states = []
+    pages = 0
+    cursor = None
+    while True:
+        if cursor is not None:
+            params["cursor"] = cursor
+        response = await client.get(f"/api/logbook/{start.isoformat()}", params=params)
+        assert response.status == HTTPStatus.OK
+        page = await response.json()
+        pages += 1
+        states[:0] = [
+            entry["state"]
+            for entry in page["events"]
+            if entry.get("entity_id") == "switch.test"
+        ]
+        if (cursor := page["next_cursor"]) is None:
+            break
+
+    # The first state has no old state so it is not in the logbook
+    assert states == ["1", "2", "3", "4"]
+    # The last full page is followed by an empty page
+    assert pages == 3
+
+    response = await client.get(
+        f"/api/logbook/{start.isoformat()}", params={"limit": "0"}
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+    response = await client.get(
+        f"/api/logbook/{start.isoformat()}", params={"limit": "2", "cursor": "x|1"}
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
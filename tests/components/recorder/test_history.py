@@ -5,8 +5,11 @@ from datetime import timedelta
 import json
 from unittest.mock import patch, sentinel
 
+import pytest
+
 from homeassistant.components.recorder import history
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -184,6 +187,98 @@ def test_get_significant_states(hass_recorder):
     assert states == hist
 
 
+@pytest.mark.parametrize("minimal_response", [False, True])
+def test_stream_significant_states(hass_recorder, minimal_response):
+    """Test streaming the states yields the same states one entity at a time."""
+    hass = hass_recorder()
+    zero, four, _ = record_states(hass)
+    hist = history.get_significant_states(
+        hass, zero, four, minimal_response=minimal_response
+    )
+
+    with session_scope(hass=hass) as session, patch.object(
+        history, "STREAM_BATCH_SIZE", 2
+    ):
+        streamed = list(
+            history.stream_significant_states_with_session(
+                hass, session, zero, four, minimal_response=minimal_response
+            )
+        )
+
+    assert {states[0].entity_id: states for states in streamed} == hist
+    assert len(streamed) == len(hist)
+
+
+def test_get_significant_states_columnar(hass_recorder):
+    """Test the columnar states match the states, with attributes on change."""
+    hass = hass_recorder()
+    zero, four, _ = record_states(hass)
+    hist = history.get_significant_states(hass, zero, four)
+    columnar = history.get_significant_states(hass, zero, four, columnar=True)
+
+    assert list(columnar) == list(hist)
+    for entity_id, states in hist.items():
+        attributes = []
+        for prev_state, state in zip([None, *states], states):
+            if prev_state is not None and prev_state.attributes == state.attributes:
+                attributes.append(None)
+            else:
+                attributes.append(state.attributes)
+        assert columnar[entity_id] == {
+            "entity_id": entity_id,
+            "state": [state.state for state in states],
+            "last_updated": [state.last_updated.timestamp() for state in states],
+            "attributes": attributes,
+        }
+
+    with session_scope(hass=hass) as session:
+        streamed = list(
+            history.stream_significant_states_with_session(
+                hass, session, zero, four, columnar=True
+            )
+        )
+    assert {states["entity_id"]: states for states in streamed} == columnar
+
+
+def test_get_significant_states_columnar_minimal_response(hass_recorder):
+    """Test minimal columnar states leave out unchanged states and attributes."""
+    hass = hass_recorder()
+    start = dt_util.utcnow()
+    for state, attributes in (
+        ("on", {"brightness": 1}),
+        ("on", {"brightness": 2}),
+        ("off", {"brightness": 2}),
+        ("on", {"brightness": 3}),
+    ):
+        hass.states.set("light.test", state, attributes)
+        wait_recording_done(hass)
+    end = dt_util.utcnow()
+
+    columnar = history.get_significant_states(
+        hass,
+        start,
+        end,
+        significant_changes_only=False,
+        minimal_response=True,
+        columnar=True,
+    )
+    full = history.get_significant_states(
+        hass, start, end, significant_changes_only=False
+    )["light.test"]
+    assert columnar == {
+        "light.test": {
+            "entity_id": "light.test",
+            "state": ["on", "off", "on"],
+            "last_updated": [
+                full[0].last_updated.timestamp(),
+                full[2].last_updated.timestamp(),
+                full[3].last_updated.timestamp(),
+            ],
+            "attributes": [{"brightness": 1}, None, None],
+        }
+    }
+
+
 def test_get_significant_states_minimal_response(hass_recorder):
     """Test that only significant states are returned.
 
@@ -2,10 +2,12 @@
 # pylint: disable=protected-access
 import asyncio
 from datetime import datetime, timedelta
+import json
 import sqlite3
 from unittest.mock import patch
 
 import pytest
+from sqlalchemy import inspect
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -27,21 +29,28 @@ from homeassistant.components.recorder import (
 )
 from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
+    EventData,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
+    with_shared_data,
 )
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
+    ATTR_NOW,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
     MATCH_ALL,
     STATE_LOCKED,
     STATE_UNLOCKED,
 )
+import homeassistant.core as ha
 from homeassistant.core import Context, CoreState, HomeAssistant, callback
 from homeassistant.setup import async_setup_component, setup_component
 from homeassistant.util import dt as dt_util
@@ -74,6 +83,8 @@ def _default_recorder(hass):
         db_retry_wait=3,
         entity_filter=CONFIG_SCHEMA({DOMAIN: {}}),
         exclude_t=[],
+        bulk_insert=False,
+        retention_policies=[],
     )
 
 
@@ -140,10 +151,17 @@ async def test_saving_state(
     await async_wait_recording_done(hass, instance)
 
     with session_scope(hass=hass) as session:
-        db_states = list(session.query(States))
+        db_states = []
+        for db_state, db_state_attributes in session.query(
+            States, StateAttributes
+        ).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        ):
+            db_states.append(db_state)
+            state = db_state.to_native()
+            state.attributes = db_state_attributes.to_native()
         assert len(db_states) == 1
         assert db_states[0].event_id > 0
-        state = db_states[0].to_native()
 
     assert state == _state_empty_context(hass, entity_id)
 
@@ -172,6 +190,12 @@ async def test_saving_many_states(
         db_states = list(session.query(States))
         assert len(db_states) == 6
         assert db_states[0].event_id > 0
+        # The attributes are identical for all states and only stored once
+        assert session.query(StateAttributes).count() == 1
+        assert {db_state.attributes_id for db_state in db_states} == {
+            session.query(StateAttributes.attributes_id).scalar()
+        }
+        assert all(db_state.attributes is None for db_state in db_states)
 
 
 async def test_saving_state_with_intermixed_time_changes(
@@ -333,9 +357,15 @@ def test_saving_event(hass, hass_recorder):
     hass.data[DATA_INSTANCE].block_till_done()
 
     with session_scope(hass=hass) as session:
-        db_events = list(session.query(Events).filter_by(event_type=event_type))
+        db_events = list(
+            session.query(Events, EventData)
+            .filter(Events.event_type == event_type)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+        )
         assert len(db_events) == 1
-        db_event = db_events[0].to_native()
+        db_event, db_event_data = db_events[0]
+        db_event = db_event.to_native()
+        db_event.data = db_event_data.to_native()
 
     assert event.event_type == db_event.event_type
     assert event.data == db_event.data
@@ -347,6 +377,150 @@ def test_saving_event(hass, hass_recorder):
     )
 
 
+def test_saving_event_to_native(hass_recorder):
+    """Test recorded events convert back with their shared data."""
+    hass = hass_recorder()
+
+    event_data = {"test_attr": 5, "test_attr_10": "nice"}
+    hass.bus.fire("EVENT_TEST", event_data)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        query = session.query(Events).filter(Events.event_type == "EVENT_TEST")
+        db_event = query.one()
+        assert db_event.event_data is None
+        assert db_event.data_id is not None
+        assert db_event.to_native().data == event_data
+
+    with session_scope(hass=hass) as session:
+        db_event = with_shared_data(
+            session.query(Events).filter(Events.event_type == "EVENT_TEST")
+        ).one()
+        assert db_event.to_native().data == event_data
+        assert "event_data_rel" in inspect(db_event).unloaded
+
+
+def test_saving_many_events_shares_event_data(hass_recorder):
+    """Test identical event data is only stored once."""
+    hass = hass_recorder()
+
+    event_data = {"test_attr": 5, "test_attr_10": "nice"}
+    for _ in range(3):
+        hass.bus.fire("EVENT_TEST", event_data)
+        hass.bus.fire("EVENT_TEST_2", event_data)
+    hass.bus.fire("EVENT_TEST", {"other": "data"})
+    hass.bus.fire("EVENT_TEST_EMPTY")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        db_events = list(
+            session.query(Events).filter(
+                Events.event_type.in_(["EVENT_TEST", "EVENT_TEST_2"])
+            )
+        )
+        assert len(db_events) == 7
+        assert all(db_event.event_data is None for db_event in db_events)
+        data_ids = {db_event.data_id for db_event in db_events}
+        assert {
+            event_data.shared_data
+            for event_data in session.query(EventData.shared_data).filter(
+                EventData.data_id.in_(data_ids)
+            )
+        } == {'{"test_attr":5,"test_attr_10":"nice"}', '{"other":"data"}'}
+        assert len(data_ids) == 2
+
+        db_event = session.query(Events).filter_by(event_type="EVENT_TEST_EMPTY").one()
+        assert db_event.data_id is None
+        assert db_event.to_native().data == {}
+
+
+@pytest.mark.parametrize("commit_interval", [0, 1])
+def test_saving_with_bulk_insert(hass_recorder, commit_interval):
+    """Test saving states and events with executemany inserts."""
+    hass = hass_recorder({"bulk_insert": True, "commit_interval": commit_interval})
+    assert hass.data[DATA_INSTANCE].using_bulk_insert
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    hass.states.set("test.one", "on", attributes)
+    hass.states.set("test.two", "on", attributes)
+    hass.bus.fire("EVENT_TEST", {"test_attr": 5})
+    hass.states.set("test.one", "off", attributes)
+    wait_recording_done(hass)
+    hass.states.set("test.one", "on", {"other": "attr"})
+    hass.bus.fire("EVENT_TEST", {"test_attr": 5})
+    hass.states.remove("test.two")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(
+            session.query(States, StateAttributes)
+            .filter(States.entity_id.in_(["test.one", "test.two"]))
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+        )
+        assert [
+            (db_state.entity_id, db_state.state, db_attributes.to_native())
+            for db_state, db_attributes in db_states
+        ] == [
+            ("test.one", "on", attributes),
+            ("test.two", "on", attributes),
+            ("test.one", "off", attributes),
+            ("test.one", "on", {"other": "attr"}),
+            ("test.two", "", {}),
+        ]
+        state_ids = [db_state.state_id for db_state, _ in db_states]
+        assert [db_state.old_state_id for db_state, _ in db_states] == [
+            None,
+            None,
+            state_ids[0],
+            state_ids[2],
+            state_ids[1],
+        ]
+        assert len({db_state.attributes_id for db_state, _ in db_states}) == 3
+        for db_state, _ in db_states:
+            event = session.query(Events).filter_by(event_id=db_state.event_id).one()
+            assert event.event_type == EVENT_STATE_CHANGED
+            assert event.data_id is None
+
+        db_events = list(session.query(Events).filter_by(event_type="EVENT_TEST"))
+        assert len(db_events) == 2
+        assert db_events[0].data_id == db_events[1].data_id
+        assert (
+            session.query(EventData.shared_data)
+            .filter_by(data_id=db_events[0].data_id)
+            .scalar()
+            == '{"test_attr":5}'
+        )
+
+
+def test_bulk_insert_continues_after_database_error(hass_recorder):
+    """Test bulk inserts pick up the ids again after the session is reopened."""
+    hass = hass_recorder({"bulk_insert": True})
+    instance = hass.data[DATA_INSTANCE]
+
+    hass.states.set("test.one", "on")
+    wait_recording_done(hass)
+
+    with patch.object(instance.event_session, "commit", side_effect=SQLAlchemyError):
+        hass.states.set("test.one", "off")
+        wait_recording_done(hass)
+
+    hass.states.set("test.one", "unknown")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(
+            session.query(States)
+            .filter(States.entity_id == "test.one")
+            .order_by(States.state_id)
+        )
+        assert [db_state.state for db_state in db_states] == ["on", "unknown"]
+        # The old state is no longer known after the failed commit
+        assert db_states[1].old_state_id is None
+
+
 def test_saving_state_with_commit_interval_zero(hass_recorder):
     """Test saving a state with a commit interval of zero."""
     hass = hass_recorder({"commit_interval": 0})
@@ -374,7 +548,14 @@ def _add_entities(hass, entity_ids):
     wait_recording_done(hass)
 
     with session_scope(hass=hass) as session:
-        return [st.to_native() for st in session.query(States)]
+        states = []
+        for state, state_attributes in session.query(States, StateAttributes).outerjoin(
+            StateAttributes, States.attributes_id == StateAttributes.attributes_id
+        ):
+            native_state = state.to_native()
+            native_state.attributes = state_attributes.to_native()
+            states.append(native_state)
+        return states
 
 
 def _add_events(hass, events):
@@ -946,9 +1127,15 @@ def test_service_disable_events_not_recording(hass, hass_recorder):
     assert events[0].data != events[1].data
 
     with session_scope(hass=hass) as session:
-        db_events = list(session.query(Events).filter_by(event_type=event_type))
+        db_events = list(
+            session.query(Events, EventData)
+            .filter(Events.event_type == event_type)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+        )
         assert len(db_events) == 1
-        db_event = db_events[0].to_native()
+        db_event, db_event_data = db_events[0]
+        db_event = db_event.to_native()
+        db_event.data = db_event_data.to_native()
 
     event = events[1]
 
@@ -1172,13 +1359,14 @@ async def test_database_lock_and_unlock(hass: HomeAssistant, tmp_path):
 
 
 async def test_database_lock_and_overflow(hass: HomeAssistant, tmp_path):
-    """Test writing events during lock leading to overflow the queue causes the database to unlock."""
+    """Test overflowing the queue during lock unlocks the database without a journal."""
     # Use file DB, in memory DB cannot do write locks.
     config = {recorder.CONF_DB_URL: "sqlite:///" + str(tmp_path / "pytest.db")}
     await async_init_recorder_component(hass, config)
     await hass.async_block_till_done()
 
     instance: Recorder = hass.data[DATA_INSTANCE]
+    instance.journal.failed = True
 
     with patch.object(recorder, "MAX_QUEUE_BACKLOG", 1), patch.object(
         recorder, "DB_LOCK_QUEUE_CHECK_TIMEOUT", 0.1
@@ -1200,6 +1388,127 @@ async def test_database_lock_and_overflow(hass: HomeAssistant, tmp_path):
         assert not instance.unlock_database()
 
 
+async def test_database_lock_and_spill_to_journal(hass: HomeAssistant, tmp_path):
+    """Test events which do not fit in the queue during lock are replayed after unlocking."""
+    hass.config.config_dir = str(tmp_path)
+    # Use file DB, in memory DB cannot do write locks.
+    config = {recorder.CONF_DB_URL: "sqlite:///" + str(tmp_path / "pytest.db")}
+    await async_init_recorder_component(hass, config)
+    await hass.async_block_till_done()
+
+    instance: Recorder = hass.data[DATA_INSTANCE]
+    journal_path = tmp_path / recorder.JOURNAL_FILE
+
+    with patch.object(recorder, "MAX_QUEUE_BACKLOG", 1), patch.object(
+        recorder, "DB_LOCK_QUEUE_CHECK_TIMEOUT", 0.1
+    ):
+        await instance.lock_database()
+
+        for idx in range(3):
+            hass.bus.async_fire("EVENT_TEST", {"idx": idx})
+        hass.states.async_set("test.spilled", "on", {"attr": 1})
+        await hass.async_block_till_done()
+
+        # The first event fits in the queue, the others are spilled
+        assert instance.journal.spilling
+        assert len(journal_path.read_text().splitlines()) == 3
+        await asyncio.sleep(0.2)
+        assert instance.queue.qsize() == 2
+
+        # Time changed events keep the commits going while spilling
+        hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+        await hass.async_block_till_done()
+        assert len(journal_path.read_text().splitlines()) == 3
+        assert instance.queue.qsize() == 3
+
+        assert instance.unlock_database()
+        await async_wait_recording_done(hass, instance)
+
+    assert not instance.journal.spilling
+    assert not journal_path.exists()
+
+    with session_scope(hass=hass) as session:
+        db_events = list(
+            session.query(EventData.shared_data)
+            .join(Events, Events.data_id == EventData.data_id)
+            .filter(Events.event_type == "EVENT_TEST")
+            .order_by(Events.event_id)
+        )
+        assert [db_event.shared_data for db_event in db_events] == [
+            '{"idx":0}',
+            '{"idx":1}',
+            '{"idx":2}',
+        ]
+        db_state = session.query(States).filter_by(entity_id="test.spilled").one()
+        assert db_state.state == "on"
+
+
+async def test_queue_watcher_keeps_listening_while_spilling(
+    hass: HomeAssistant, tmp_path
+):
+    """Test time changed events past the backlog do not stop recording while spilling."""
+    hass.config.config_dir = str(tmp_path)
+    config = {recorder.CONF_DB_URL: "sqlite:///" + str(tmp_path / "pytest.db")}
+    await async_init_recorder_component(hass, config)
+    await hass.async_block_till_done()
+
+    instance: Recorder = hass.data[DATA_INSTANCE]
+
+    with patch.object(recorder, "MAX_QUEUE_BACKLOG", 1), patch.object(
+        recorder, "DB_LOCK_QUEUE_CHECK_TIMEOUT", 0.1
+    ):
+        await instance.lock_database()
+
+        for idx in range(3):
+            hass.bus.async_fire("EVENT_TEST", {"idx": idx})
+        for _ in range(3):
+            hass.bus.async_fire(EVENT_TIME_CHANGED, {ATTR_NOW: dt_util.utcnow()})
+        await hass.async_block_till_done()
+
+        assert instance.journal.spilling
+        assert instance.queue.qsize() > recorder.MAX_QUEUE_BACKLOG
+
+        instance._async_check_queue()
+        assert instance._event_listener is not None
+
+        # Without a working journal the queue would exhaust the memory
+        instance.journal.failed = True
+        instance._async_check_queue()
+        assert instance._event_listener is None
+        instance.journal.failed = False
+
+        assert instance.unlock_database()
+        await async_wait_recording_done(hass, instance)
+
+
+async def test_journal_replayed_on_start(hass: HomeAssistant, tmp_path):
+    """Test events left in the journal by the previous run are recorded."""
+    hass.config.config_dir = str(tmp_path)
+    event = ha.Event("EVENT_TEST_JOURNAL", {"left": "behind"})
+    (tmp_path / recorder.JOURNAL_FILE).write_text(
+        json.dumps(event.as_dict()) + "\n" + "not json\n"
+    )
+
+    await async_init_recorder_component(hass)
+    instance: Recorder = hass.data[DATA_INSTANCE]
+    # Events fired during startup are spilled until the replay has finished
+    assert await hass.async_add_executor_job(instance.journal.replayed.wait, 10)
+
+    assert not instance.journal.spilling
+    assert not (tmp_path / recorder.JOURNAL_FILE).exists()
+    with session_scope(hass=hass) as session:
+        db_event = (
+            session.query(Events).filter_by(event_type="EVENT_TEST_JOURNAL").one()
+        )
+        assert db_event.context_id == event.context.id
+        assert (
+            session.query(EventData.shared_data)
+            .filter_by(data_id=db_event.data_id)
+            .scalar()
+            == '{"left":"behind"}'
+        )
+
+
 async def test_database_lock_timeout(hass):
     """Test locking database timeout when recorder stopped."""
     await async_init_recorder_component(hass)
@@ -22,7 +22,12 @@ from homeassistant.bootstrap import async_setup_component
 from homeassistant.components import persistent_notification as pn, recorder
 from homeassistant.components.recorder import RecorderRuns, migration, models
 from homeassistant.components.recorder.const import DATA_INSTANCE
-from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.models import (
+    EventData,
+    Events,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.util import session_scope
 import homeassistant.util.dt as dt_util
 
@@ -195,8 +200,10 @@ async def test_events_during_migration_are_queued(hass):
     assert len(db_states) == 2
 
 
-async def test_events_during_migration_queue_exhausted(hass):
+async def test_events_during_migration_queue_exhausted(hass, tmp_path):
     """Test that events during migration takes so long the queue is exhausted."""
+    # The journal cannot be written, so the events are not spilled
+    hass.config.config_dir = str(tmp_path / "missing")
 
     assert recorder.util.async_migration_in_progress(hass) is False
 
@@ -225,7 +232,7 @@ async def test_events_during_migration_queue_exhausted(hass):
     assert len(db_states) == 2
 
 
-@pytest.mark.parametrize("start_version", [0, 16, 18, 22])
+@pytest.mark.parametrize("start_version", [0, 16, 18, 22, 23])
 async def test_schema_migrate(hass, start_version):
     """Test the full schema migration logic.
 
@@ -306,6 +313,88 @@ async def test_schema_migrate(hass, start_version):
         assert recorder.util.async_migration_in_progress(hass) is not True
 
 
+def test_migrate_states_to_shared_attributes():
+    """Test the attributes of existing states are moved to state_attributes."""
+    module = "tests.components.recorder.models_schema_23"
+    importlib.import_module(module)
+    old_models = sys.modules[module]
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    old_models.Base.metadata.create_all(engine)
+    models.Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for idx, attributes in enumerate(('{"attr":1}', '{"attr":1}', '{"attr":2}')):
+            session.add(
+                old_models.States(
+                    entity_id="sensor.test",
+                    domain="sensor",
+                    state=str(idx),
+                    attributes=attributes,
+                )
+            )
+        session.commit()
+        migration._add_columns(session, "states", ["attributes_id INTEGER"])
+        migration._migrate_states_to_shared_attributes(session)
+        session.commit()
+
+        assert session.query(StateAttributes).count() == 2
+        rows = (
+            session.query(
+                States.attributes, States.attributes_id, StateAttributes.shared_attrs
+            )
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+            .all()
+        )
+        assert [row.shared_attrs for row in rows] == [
+            '{"attr":1}',
+            '{"attr":1}',
+            '{"attr":2}',
+        ]
+        assert rows[0].attributes_id == rows[1].attributes_id
+        assert all(row.attributes is None for row in rows)
+
+
+def test_migrate_events_to_shared_data():
+    """Test the data of existing events is moved to event_data."""
+    module = "tests.components.recorder.models_schema_23"
+    importlib.import_module(module)
+    old_models = sys.modules[module]
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    old_models.Base.metadata.create_all(engine)
+    models.Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for event_data in ('{"data":1}', '{"data":1}', '{"data":2}', "{}"):
+            session.add(
+                old_models.Events(
+                    event_type="test_event",
+                    event_data=event_data,
+                    origin="LOCAL",
+                )
+            )
+        session.commit()
+        migration._add_columns(session, "events", ["data_id INTEGER"])
+        migration._migrate_events_to_shared_data(session)
+        session.commit()
+
+        assert session.query(EventData).count() == 2
+        rows = (
+            session.query(Events.event_data, Events.data_id, EventData.shared_data)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .order_by(Events.event_id)
+            .all()
+        )
+        assert [row.shared_data for row in rows] == [
+            '{"data":1}',
+            '{"data":1}',
+            '{"data":2}',
+            None,
+        ]
+        assert rows[0].data_id == rows[1].data_id
+        assert [row.event_data for row in rows] == [None, None, None, "{}"]
+
+
 def test_invalid_update():
     """Test that an invalid new version raises an exception."""
     with pytest.raises(ValueError):
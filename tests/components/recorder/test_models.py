@@ -2,28 +2,45 @@
 from datetime import datetime
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from homeassistant.components.recorder.models import (
     Base,
+    EventData,
     Events,
+    LazyState,
     RecorderRuns,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
+    with_shared_attrs,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.util import dt
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_dumps, json_loads
 
 
 def test_from_event_to_db_event():
     """Test converting event to db event."""
     event = ha.Event("test_event", {"some_data": 15})
-    assert event == Events.from_event(event).to_native()
+    db_event = Events.from_event(event)
+    assert db_event.event_data is None
+    db_event.event_data = EventData.from_event(event).shared_data
+    assert event == db_event.to_native()
+
+
+def test_from_event_to_db_event_data():
+    """Test converting event to db event data."""
+    event = ha.Event("test_event", {"some_data": 15})
+    db_data = EventData.from_event(event)
+    assert db_data.shared_data == '{"some_data":15}'
+    assert db_data.hash == EventData.hash_shared_data('{"some_data":15}')
+    assert db_data.to_native() == {"some_data": 15}
 
 
 def test_from_event_to_db_state():
@@ -40,6 +57,81 @@ def test_from_event_to_db_state():
     assert state == States.from_event(event).to_native()
 
 
+def test_from_event_to_db_state_attributes():
+    """Test converting event to db state attributes."""
+    attrs = {"this_attr": True}
+    state = ha.State("sensor.temperature", "18", attrs)
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    db_attrs = StateAttributes.from_event(event)
+    assert db_attrs.shared_attrs == '{"this_attr":true}'
+    assert db_attrs.hash == StateAttributes.hash_shared_attrs('{"this_attr":true}')
+    assert db_attrs.to_native() == attrs
+    assert States.from_event(event).attributes is None
+
+
+def test_states_to_native_shared_attributes():
+    """Test converting a db state with shared attributes to native."""
+    attrs = {"this_attr": True}
+    state = ha.State("sensor.temperature", "18", attrs)
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    db_state = States.from_event(event)
+    db_state.state_attributes = StateAttributes.from_event(event)
+    db_state.attributes_id = 1
+    assert db_state.to_native().attributes == attrs
+
+
+def test_states_to_native_with_shared_attrs():
+    """Test converting db states selected with their shared attributes."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = scoped_session(sessionmaker(bind=engine))
+
+    attrs = {"this_attr": True}
+    state = ha.State("sensor.temperature", "18", attrs)
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    db_state = States.from_event(event)
+    db_state.state_attributes = StateAttributes.from_event(event)
+    session.add(db_state)
+    session.add(States(entity_id="sensor.legacy", state="5", attributes="{}"))
+    session.commit()
+    session.remove()
+
+    db_states = list(with_shared_attrs(session.query(States)).order_by(States.state_id))
+    native_states = [db_state.to_native() for db_state in db_states]
+    assert native_states[0].attributes == attrs
+    assert native_states[1].attributes == {}
+    for db_state in db_states:
+        assert "state_attributes" in inspect(db_state).unloaded
+
+
+def test_lazy_state_as_dict_json():
+    """Test the JSON of a lazy state is encoded like its dict."""
+    state = ha.State("sensor.temperature", "18", {"unit_of_measurement": "°C"})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+    )
+    row = States.from_event(event)
+    row.attributes = StateAttributes.from_event(event).shared_attrs
+    lazy_state = LazyState(row)
+
+    assert json_loads(lazy_state.as_dict_json) == lazy_state.as_dict()
+    assert json_loads(json_dumps([lazy_state])) == [lazy_state.as_dict()]
+    assert lazy_state.as_dict()["attributes"] == {"unit_of_measurement": "°C"}
+
+
 def test_from_event_to_delete_state():
     """Test converting deleting state event to db state."""
     event = ha.Event(
@@ -209,9 +301,11 @@ async def test_event_to_db_model():
     event = ha.Event(
         "state_changed", {"some": "attr"}, ha.EventOrigin.local, dt_util.utcnow()
     )
-    native = Events.from_event(event).to_native()
+    db_event = Events.from_event(event)
+    db_event.event_data = EventData.from_event(event).shared_data
+    native = db_event.to_native()
     assert native == event
 
-    native = Events.from_event(event, event_data="{}").to_native()
+    native = Events.from_event(event).to_native()
     event.data = {}
     assert native == event
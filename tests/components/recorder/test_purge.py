@@ -11,9 +11,12 @@ from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
 from homeassistant.components.recorder.models import (
+    EventData,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
+    StatisticsMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -91,6 +94,189 @@ async def test_purge_old_states(
         assert "test.recorder2" in instance._old_states
 
 
+async def test_purge_downsampled_states(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test raw states covered by statistics are purged after their retention."""
+    config: ConfigType = {
+        "retention": [
+            {"entity_globs": "sensor.*_power", "keep_days": 2},
+            {"entities": "sensor.energy", "keep_days": 5},
+        ]
+    }
+    instance = await async_setup_recorder_instance(hass, config)
+
+    utcnow = dt_util.utcnow()
+    timestamps = {
+        "sensor.house_power": [utcnow - timedelta(days=5)] * 3
+        + [utcnow - timedelta(days=3), utcnow],
+        "sensor.stale_power": [utcnow - timedelta(days=5)] * 3,
+        "sensor.no_statistics_power": [utcnow - timedelta(days=5)] * 3,
+        "sensor.energy": [utcnow - timedelta(days=3)] * 3,
+        "sensor.temperature": [utcnow - timedelta(days=5)] * 3,
+    }
+    for entity_id, entity_timestamps in timestamps.items():
+        for idx, timestamp in enumerate(entity_timestamps):
+            with patch(
+                "homeassistant.components.recorder.dt_util.utcnow",
+                return_value=timestamp,
+            ):
+                hass.states.async_set(entity_id, str(idx))
+                await hass.async_block_till_done()
+                await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        for entity_id, last_start in (
+            ("sensor.house_power", utcnow - timedelta(hours=1)),
+            ("sensor.stale_power", utcnow - timedelta(days=6)),
+            ("sensor.energy", utcnow - timedelta(hours=1)),
+            ("sensor.temperature", utcnow - timedelta(hours=1)),
+        ):
+            metadata = StatisticsMeta(
+                statistic_id=entity_id,
+                source="recorder",
+                has_mean=True,
+                has_sum=False,
+            )
+            session.add(metadata)
+            session.flush()
+            session.add(
+                StatisticsShortTerm(
+                    metadata_id=metadata.id, start=last_start, mean=1, min=0, max=2
+                )
+            )
+
+    with session_scope(hass=hass) as session:
+        purge_before = utcnow - timedelta(days=10)
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert purge_old_data(instance, purge_before, repack=False)
+
+        states = session.query(States.entity_id, States.state)
+        assert {
+            entity_id: sorted(
+                state.state for state in states.filter_by(entity_id=entity_id)
+            )
+            for entity_id in timestamps
+        } == {
+            "sensor.house_power": ["3", "4"],
+            "sensor.stale_power": ["0", "1", "2"],
+            "sensor.no_statistics_power": ["0", "1", "2"],
+            "sensor.energy": ["0", "1", "2"],
+            "sensor.temperature": ["0", "1", "2"],
+        }
+        assert (
+            session.query(Events)
+            .filter(Events.event_type == EVENT_STATE_CHANGED)
+            .count()
+            == states.count()
+        )
+        assert "sensor.house_power" in instance._old_states
+
+
+async def test_purge_old_states_with_bulk_insert(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test purged states are no longer used as old state by bulk inserts."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_insert": True})
+    assert instance.using_bulk_insert
+
+    await _add_test_states(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States).order_by(States.state_id)
+        assert states.count() == 6
+        assert states[-1].old_state_id == states[-2].state_id
+
+        finished = purge_old_data(instance, dt_util.utcnow(), repack=False)
+        assert not finished
+        assert states.count() == 0
+
+    hass.states.async_set("test.recorder2", "new")
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        states = session.query(States)
+        assert states.count() == 1
+        assert states[0].state == "new"
+        assert states[0].old_state_id is None
+
+
+async def test_purge_old_states_removes_unused_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test shared attributes are removed once no state refers to them."""
+    instance = await async_setup_recorder_instance(hass)
+
+    utcnow = dt_util.utcnow()
+    five_days_ago = utcnow - timedelta(days=5)
+
+    for timestamp, entity_id, state, attr in (
+        (five_days_ago, "test.old", "on", 1),
+        (five_days_ago, "test.shared", "on", 2),
+        (utcnow, "test.shared", "off", 2),
+        (utcnow, "test.new", "on", 3),
+    ):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow", return_value=timestamp
+        ):
+            hass.states.async_set(entity_id, state, {"attr": attr})
+            await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 4
+        assert session.query(StateAttributes).count() == 3
+        assert len(instance._state_attributes_ids) == 3
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+
+        assert session.query(States).count() == 2
+        assert {
+            attributes.shared_attrs
+            for attributes in session.query(StateAttributes.shared_attrs)
+        } == {'{"attr":2}', '{"attr":3}'}
+        assert '{"attr":1}' not in instance._state_attributes_ids
+        assert '{"attr":2}' in instance._state_attributes_ids
+
+
+async def test_purge_old_events_removes_unused_event_data(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test shared event data is removed once no event refers to it."""
+    instance = await async_setup_recorder_instance(hass)
+
+    utcnow = dt_util.utcnow()
+    five_days_ago = utcnow - timedelta(days=5)
+
+    for timestamp, data in (
+        (five_days_ago, 1),
+        (five_days_ago, 2),
+        (utcnow, 2),
+        (utcnow, 3),
+    ):
+        hass.bus.async_fire("EVENT_TEST_PURGE", {"data": data}, time_fired=timestamp)
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        events = session.query(Events).filter(Events.event_type == "EVENT_TEST_PURGE")
+        assert events.count() == 4
+        test_data = EventData.shared_data.like('{"data":%')
+        assert session.query(EventData).filter(test_data).count() == 3
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert not finished
+
+        assert events.count() == 2
+        assert {
+            event_data.shared_data
+            for event_data in session.query(EventData.shared_data).filter(test_data)
+        } == {'{"data":2}', '{"data":3}'}
+        assert '{"data":1}' not in instance._event_data_ids
+        assert '{"data":2}' in instance._event_data_ids
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
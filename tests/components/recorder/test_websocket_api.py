@@ -2,7 +2,7 @@
 # pylint: disable=protected-access,invalid-name
 from datetime import timedelta
 import threading
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 import pytest
 from pytest import approx
@@ -263,11 +263,14 @@ async def test_recorder_info(hass, hass_ws_client):
     assert response["success"]
     assert response["result"] == {
         "backlog": 0,
+        "bulk_insert": False,
         "max_backlog": 30000,
         "migration_in_progress": False,
         "recording": True,
+        "rows_per_second": ANY,
         "thread_running": True,
     }
+    assert response["result"]["rows_per_second"] > 0
 
 
 async def test_recorder_info_no_recorder(hass, hass_ws_client):
@@ -303,8 +306,10 @@ async def test_recorder_info_bad_recorder_config(hass, hass_ws_client):
     assert response["result"]["thread_running"] is False
 
 
-async def test_recorder_info_migration_queue_exhausted(hass, hass_ws_client):
+async def test_recorder_info_migration_queue_exhausted(hass, hass_ws_client, tmp_path):
     """Test getting recorder status when recorder queue is exhausted."""
+    # The journal cannot be written, so the events are not spilled
+    hass.config.config_dir = str(tmp_path / "missing")
     assert recorder.util.async_migration_in_progress(hass) is False
 
     migration_done = threading.Event()
@@ -0,0 +1,88 @@
+"""Test the broadcaster of websocket event subscriptions."""
+import json
+import logging
+from unittest.mock import Mock, patch
+
+from homeassistant import core
+from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api.broadcast import async_get_event_broadcaster
+from homeassistant.const import EVENT_STATE_CHANGED
+
+from tests.common import MockUser
+
+
+def _connection(hass, user):
+    """Return a connection collecting the messages sent to it."""
+    send_messages = []
+    connection = websocket_api.ActiveConnection(
+        logging.getLogger(__name__), hass, send_messages.append, user, Mock()
+    )
+    return connection, send_messages
+
+
+async def test_broadcast_events(hass):
+    """Test one listener serves the subscriptions of all connections."""
+    broadcaster = async_get_event_broadcaster(hass)
+    init_count = sum(hass.bus.async_listeners().values())
+    user = MockUser()
+    connection_1, messages_1 = _connection(hass, user)
+    connection_2, messages_2 = _connection(hass, user)
+
+    unsub_1 = broadcaster.async_subscribe("test_event", connection_1, 5)
+    unsub_2 = broadcaster.async_subscribe("test_event", connection_2, 7)
+    assert sum(hass.bus.async_listeners().values()) == init_count + 1
+
+    with patch(
+        "homeassistant.core.json_dumps", wraps=core.json_dumps
+    ) as mock_json_dumps:
+        hass.bus.async_fire("test_event", {"hello": "world"})
+        await hass.async_block_till_done()
+
+    assert mock_json_dumps.call_count == 1
+    assert len(messages_1) == 1
+    assert len(messages_2) == 1
+    msg_1 = json.loads(messages_1[0])
+    msg_2 = json.loads(messages_2[0])
+    assert msg_1["id"] == 5
+    assert msg_2["id"] == 7
+    assert msg_1["event"] == msg_2["event"]
+    assert msg_1["event"]["data"] == {"hello": "world"}
+
+    unsub_1()
+    hass.bus.async_fire("test_event", {"hello": "again"})
+    await hass.async_block_till_done()
+    assert len(messages_1) == 1
+    assert len(messages_2) == 2
+
+    unsub_2()
+    assert sum(hass.bus.async_listeners().values()) == init_count
+
+
+async def test_broadcast_state_changed_permissions(hass):
+    """Test state changes are checked once per permission profile."""
+    broadcaster = async_get_event_broadcaster(hass)
+    user = MockUser()
+    user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    owner = MockUser(is_owner=True)
+    connection_1, messages_1 = _connection(hass, user)
+    connection_2, messages_2 = _connection(hass, user)
+    connection_3, messages_3 = _connection(hass, owner)
+    for connection in (connection_1, connection_2, connection_3):
+        broadcaster.async_subscribe(EVENT_STATE_CHANGED, connection, 5)
+
+    with patch.object(
+        user.permissions, "check_entity", wraps=user.permissions.check_entity
+    ) as mock_check_entity:
+        hass.states.async_set("light.not_permitted", "on")
+        hass.states.async_set("light.permitted", "on")
+        await hass.async_block_till_done()
+
+    assert mock_check_entity.call_count == 2
+    for messages in (messages_1, messages_2):
+        assert [json.loads(msg)["event"]["data"]["entity_id"] for msg in messages] == [
+            "light.permitted"
+        ]
+    assert [json.loads(msg)["event"]["data"]["entity_id"] for msg in messages_3] == [
+        "light.not_permitted",
+        "light.permitted",
+    ]
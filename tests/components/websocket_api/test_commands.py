@@ -14,12 +14,19 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_REQUIRED,
 )
 from homeassistant.components.websocket_api.const import URL
+from homeassistant.const import __version__
 from homeassistant.core import Context, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import entity
+from homeassistant.helpers import entity, startup_report
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.loader import async_get_integration
+from homeassistant.helpers.event import (
+    async_get_point_in_time_scheduler,
+    async_track_point_in_utc_time,
+)
+from homeassistant.loader import DATA_IMPORT_TIME, async_get_integration
 from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import _json_dumps_orjson, _json_dumps_stdlib
 
 from tests.common import MockEntity, MockEntityPlatform, async_mock_service
 
@@ -530,15 +537,28 @@ async def test_states_filters_visible(hass, hass_admin_user, websocket_client):
 
 async def test_get_states_not_allows_nan(hass, websocket_client):
     """Test get_states command not allows NaN floats."""
-    hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
+    with patch("homeassistant.core.json_dumps", _json_dumps_stdlib):
+        hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
 
-    await websocket_client.send_json({"id": 5, "type": "get_states"})
+        await websocket_client.send_json({"id": 5, "type": "get_states"})
 
-    msg = await websocket_client.receive_json()
+        msg = await websocket_client.receive_json()
     assert not msg["success"]
     assert msg["error"]["code"] == const.ERR_UNKNOWN_ERROR
 
 
+async def test_get_states_nan_orjson(hass, websocket_client):
+    """Test get_states command sends NaN floats as null with orjson."""
+    with patch("homeassistant.core.json_dumps", _json_dumps_orjson):
+        hass.states.async_set("greeting.hello", "world", {"hello": float("NaN")})
+
+        await websocket_client.send_json({"id": 5, "type": "get_states"})
+
+        msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"][0]["attributes"] == {"hello": None}
+
+
 async def test_subscribe_unsubscribe_events_whitelist(
     hass, websocket_client, hass_admin_user
 ):
@@ -602,6 +622,99 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities(hass, websocket_client, hass_admin_user):
+    """Test subscribe_entities sends compact states and state diffs."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy(
+        {"entities": {"entity_ids": {"light.permitted": True, "light.other": True}}}
+    )
+    hass.states.async_set("light.permitted", "off", {"color": "red", "old": 1})
+    hass.states.async_set("light.not_permitted", "off")
+    original_state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red", "old": 1},
+                "c": original_state.context.id,
+                "lc": original_state.last_changed.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    new_state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "s": "on",
+                    "a": {"color": "blue"},
+                    "c": new_state.context.id,
+                    "lc": new_state.last_changed.timestamp(),
+                },
+                "-": {"a": ["old"]},
+            }
+        }
+    }
+
+    hass.states.async_set("light.other", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"]["light.other"]["s"] == "on"
+
+    hass.states.async_remove("light.permitted")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+
+async def test_subscribe_entities_with_entity_ids(hass, websocket_client):
+    """Test subscribe_entities limited to some entities."""
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.two", "off")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.one"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.one"]
+
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.one", "off", {"brightness": 10})
+    state = hass.states.get("light.one")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {
+            "light.one": {
+                "+": {
+                    "a": {"brightness": 10},
+                    "c": state.context.id,
+                    "lu": state.last_updated.timestamp(),
+                }
+            }
+        }
+    }
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
@@ -1197,3 +1310,53 @@ async def test_integration_setup_info(hass, websocket_client, hass_admin_user):
         {"domain": "august", "seconds": 12.5},
         {"domain": "isy994", "seconds": 12.8},
     ]
+
+
+async def test_integration_import_info(hass, websocket_client):
+    """Test getting the module import times."""
+    hass.data[DATA_IMPORT_TIME] = {
+        "homeassistant.components.august": 1.5,
+        "homeassistant.components.august.lock": 0.25,
+    }
+    await websocket_client.send_json({"id": 7, "type": "integration/import_info"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {"module": "homeassistant.components.august", "seconds": 1.5},
+        {"module": "homeassistant.components.august.lock", "seconds": 0.25},
+    ]
+
+
+async def test_scheduler_stats(hass, websocket_client):
+    """Test getting the stats of the point in time scheduler."""
+    async_track_point_in_utc_time(
+        hass, callback(lambda now: None), dt_util.utcnow() + datetime.timedelta(10)
+    )
+
+    await websocket_client.send_json({"id": 7, "type": "scheduler/stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    stats = async_get_point_in_time_scheduler(hass).async_stats()
+    assert stats["scheduled_jobs"] >= 1
+    assert msg["result"] == {**stats, "next_tick": stats["next_tick"].isoformat()}
+
+
+async def test_integration_startup_reports(hass, websocket_client, hass_storage):
+    """Test getting the reports of the last startups."""
+    startup_report.async_start_report(hass)
+    await startup_report.async_save_report(hass)
+
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_reports"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert len(msg["result"]) == 1
+    assert msg["result"][0]["version"] == __version__
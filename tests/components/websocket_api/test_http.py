@@ -1,9 +1,11 @@
 """Test Websocket API http module."""
 import asyncio
 from datetime import timedelta
-from unittest.mock import patch
+from ipaddress import ip_network
+from unittest.mock import Mock, patch
 
 from aiohttp import ServerDisconnectedError, WSMsgType, web
+from aiohttp.hdrs import X_FORWARDED_FOR
 import pytest
 
 from homeassistant.components.websocket_api import const, http
@@ -67,6 +69,37 @@ async def test_pending_msg_peak(hass, mock_low_peak, hass_ws_client, caplog):
     assert "Client unable to keep up with pending messages" in caplog.text
 
 
+async def test_wait_writable(hass, hass_ws_client):
+    """Test senders can wait until the client has read the pending messages."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    connection = instance._connection
+    assert connection.writable.is_set()
+
+    with patch("homeassistant.components.websocket_api.http.PENDING_MSG_WRITABLE", 2):
+        connection.send_result(1)
+        connection.send_result(2)
+        assert not connection.writable.is_set()
+
+        await asyncio.wait_for(connection.async_wait_writable(), 1)
+
+    for msg_id in (1, 2):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == msg_id
+
+
 async def test_non_json_message(hass, websocket_client, caplog):
     """Test trying to serialize non JSON objects."""
     bad_data = object()
@@ -92,3 +125,59 @@ async def test_prepare_fail(hass, hass_ws_client, caplog):
         await hass_ws_client(hass)
 
     assert "Timeout preparing request" in caplog.text
+
+
+async def test_coalesce_messages(hass, websocket_client):
+    """Test queued messages are sent as one frame once the client supports it."""
+    await websocket_client.send_json(
+        {"id": 1, "type": "supported_features", "features": {"coalesce_messages": 1}}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"]
+
+    await websocket_client.send_json(
+        {"id": 2, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 2
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+
+    msgs = await websocket_client.receive_json()
+    assert [msg["event"]["data"]["idx"] for msg in msgs] == [0, 1, 2]
+
+    hass.bus.async_fire("test_event", {"idx": 3})
+
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["data"]["idx"] == 3
+
+
+async def test_compress_remote_clients(hass):
+    """Test permessage-deflate is only offered to remote clients."""
+    request = Mock(remote="192.168.1.10", headers={})
+    assert http.WebSocketHandler(hass, request).wsock.compress is False
+
+    request = Mock(remote="203.0.113.10", headers={})
+    assert http.WebSocketHandler(hass, request).wsock.compress is True
+
+
+async def test_compress_clients_behind_proxy(hass):
+    """Test permessage-deflate is offered based on the forwarded client address."""
+    hass.http = Mock(trusted_proxies=[ip_network("192.168.1.1")])
+
+    # The forwarded middleware resolved the client address
+    request = Mock(remote="203.0.113.10", headers={X_FORWARDED_FOR: "203.0.113.10"})
+    assert http.WebSocketHandler(hass, request).wsock.compress is True
+
+    request = Mock(remote="192.168.1.10", headers={X_FORWARDED_FOR: "192.168.1.10"})
+    assert http.WebSocketHandler(hass, request).wsock.compress is False
+
+    # The proxy did not send the client address
+    request = Mock(remote="192.168.1.1", headers={})
+    assert http.WebSocketHandler(hass, request).wsock.compress is True
+
+    request = Mock(remote="192.168.1.10", headers={})
+    assert http.WebSocketHandler(hass, request).wsock.compress is False
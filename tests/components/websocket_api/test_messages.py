@@ -1,9 +1,13 @@
 """Test Websocket API messages module."""
 
+import json
+
 from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     cached_event_message,
+    construct_result_message,
     message_to_json,
+    result_message,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import callback
@@ -83,16 +87,44 @@ async def test_message_to_json(caplog):
 
     json_str = message_to_json({"id": 1, "message": "xyz"})
 
-    assert json_str == '{"id": 1, "message": "xyz"}'
+    assert json_str == '{"id":1,"message":"xyz"}'
 
     json_str2 = message_to_json({"id": 1, "message": _Unserializeable()})
 
     assert (
         json_str2
-        == '{"id": 1, "type": "result", "success": false, "error": {"code": "unknown_error", "message": "Invalid JSON in response"}}'
+        == '{"id":1,"type":"result","success":false,"error":{"code":"unknown_error","message":"Invalid JSON in response"}}'
     )
     assert "Unable to serialize to JSON" in caplog.text
 
 
+async def test_construct_result_message(hass):
+    """Test the result message with the JSON of its result spliced in."""
+    hass.states.async_set("light.window", "on", {"color": "red"})
+    state = hass.states.get("light.window")
+
+    assert json.loads(
+        construct_result_message(5, f"[{state.as_dict_json}]")
+    ) == json.loads(message_to_json(result_message(5, [state])))
+
+
+async def test_cached_event_message_bad_data(hass, caplog):
+    """Test an event which cannot be serialized results in an error message."""
+    events = []
+
+    @callback
+    def _event_listener(event):
+        events.append(event)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, _event_listener)
+    hass.states.async_set("light.window", "on", {"bad": _Unserializeable()})
+    await hass.async_block_till_done()
+
+    msg = json.loads(cached_event_message(2, events[0]))
+    assert msg["id"] == 2
+    assert msg["success"] is False
+    assert "Unable to serialize to JSON" in caplog.text
+
+
 class _Unserializeable:
     """A class that cannot be serialized."""
@@ -676,6 +676,35 @@ async def test_not_condition_with_template(hass):
     assert not test(hass)
 
 
+async def test_template_condition_memoized(hass):
+    """Test a template condition is not rendered while its inputs are the same."""
+    config = {
+        "condition": "template",
+        "value_template": "{{ is_state('sensor.temperature', '100') and ok }}",
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature", 100, {"noise": 1})
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        wraps=config["value_template"].async_render_to_info,
+    ) as mock_render:
+        assert test(hass, {"ok": True})
+        hass.states.async_set("sensor.temperature", 100, {"noise": 2})
+        assert test(hass, {"ok": True})
+        assert mock_render.call_count == 1
+
+        assert not test(hass, {"ok": False})
+        assert mock_render.call_count == 2
+
+        hass.states.async_set("sensor.temperature", 101)
+        assert not test(hass, {"ok": False})
+        assert mock_render.call_count == 3
+
+
 async def test_time_window(hass):
     """Test time condition windows."""
     sixam = "06:00:00"
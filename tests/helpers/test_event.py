@@ -20,6 +20,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_point_in_time_scheduler,
     async_track_point_in_time,
     async_track_point_in_utc_time,
     async_track_same_state,
@@ -126,6 +127,76 @@ async def test_track_point_in_time_drift_rearm(hass):
     assert len(specific_runs) == 1
 
 
+async def test_point_in_time_scheduler_batches_ticks(hass):
+    """Test jobs due at the same time share one loop timer."""
+    scheduler = async_get_point_in_time_scheduler(hass)
+    now = dt_util.utcnow()
+    runs = []
+    point_1 = now.replace(microsecond=0) + timedelta(seconds=10)
+    point_2 = point_1 + timedelta(seconds=1)
+
+    for point in (point_1, point_1, point_2):
+        async_track_point_in_utc_time(
+            hass, callback(lambda now: runs.append(now)), point
+        )
+    unsub = async_track_point_in_utc_time(
+        hass, callback(lambda now: runs.append(now)), point_1
+    )
+
+    assert scheduler.async_stats() == {
+        "scheduled_jobs": 4,
+        "scheduled_ticks": 2,
+        "next_tick": point_1,
+        "ticks_run": 0,
+        "jobs_run": 0,
+    }
+    assert (
+        len(
+            [
+                handle
+                for handle in hass.loop._scheduled
+                if not handle.cancelled()
+                and getattr(handle, "_callback", None) == scheduler._async_run
+            ]
+        )
+        == 1
+    )
+
+    unsub()
+    async_fire_time_changed(hass, point_1 + timedelta(milliseconds=500))
+    await hass.async_block_till_done()
+    assert runs == [point_1, point_1]
+
+    stats = scheduler.async_stats()
+    assert stats["scheduled_jobs"] == 1
+    assert stats["next_tick"] == point_2
+    assert stats["ticks_run"] == 1
+    assert stats["jobs_run"] == 2
+
+    async_fire_time_changed(hass, point_2 + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert runs == [point_1, point_1, point_2]
+    assert scheduler.async_stats()["scheduled_jobs"] == 0
+
+
+async def test_point_in_time_scheduler_job_error(hass, caplog):
+    """Test an error in a job does not stop the other jobs of the tick."""
+    point = dt_util.utcnow() + timedelta(seconds=10)
+    runs = []
+
+    @callback
+    def _bad_job(now):
+        raise ValueError("bad job")
+
+    async_track_point_in_utc_time(hass, _bad_job, point)
+    async_track_point_in_utc_time(hass, callback(lambda now: runs.append(now)), point)
+
+    async_fire_time_changed(hass, point + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert runs == [point]
+    assert "Error running point in time job" in caplog.text
+
+
 async def test_track_state_change_from_to_state_match(hass):
     """Test track_state_change with from and to state matchers."""
     from_and_to_state_runs = []
@@ -2811,6 +2882,36 @@ async def test_track_template_result_refresh_cancel(hass):
     assert refresh_runs == ["duck"]
 
 
+async def test_track_template_result_inputs_unchanged(hass):
+    """Test a template is not rendered again while the states it reads are the same."""
+    template = Template(
+        "{{ states('sensor.power') }} {{ state_attr('sensor.power', 'unit') }}"
+    )
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(event, updates):
+        refresh_runs.append(updates[0].result)
+
+    hass.states.async_set("sensor.power", "5", {"unit": "W", "noise": 1})
+    async_track_template_result(hass, [TrackTemplate(template, None)], refresh_listener)
+    await hass.async_block_till_done()
+
+    with patch.object(
+        Template, "async_render_to_info", wraps=template.async_render_to_info
+    ) as mock_render:
+        for noise in range(2, 10):
+            hass.states.async_set("sensor.power", "5", {"unit": "W", "noise": noise})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 0
+
+        hass.states.async_set("sensor.power", "6", {"unit": "W", "noise": 10})
+        await hass.async_block_till_done()
+        assert mock_render.call_count == 1
+
+    assert refresh_runs == ["6 W"]
+
+
 async def test_async_track_template_result_multiple_templates(hass):
     """Test tracking multiple templates."""
 
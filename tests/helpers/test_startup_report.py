@@ -0,0 +1,103 @@
+"""Test the startup report."""
+from unittest.mock import AsyncMock, patch
+
+from homeassistant import config_entries
+from homeassistant.const import __version__
+from homeassistant.helpers import startup_report
+from homeassistant.loader import DATA_IMPORT_TIME
+from homeassistant.setup import async_setup_component
+
+from tests.common import (
+    MockConfigEntry,
+    MockEntity,
+    MockEntityPlatform,
+    MockModule,
+    MockPlatform,
+    mock_entity_platform,
+    mock_integration,
+)
+
+
+async def test_measure(hass):
+    """Test steps are only measured while starting up."""
+    with startup_report.async_measure(
+        hass, startup_report.CATEGORY_STAGES, "stage_1", "setup"
+    ):
+        pass
+    assert startup_report.async_get_report(hass) is None
+
+    startup_report.async_start_report(hass)
+    report = startup_report.async_get_report(hass)
+    with patch.object(startup_report, "timer", side_effect=[1, 3, 4, 4.5]):
+        for _ in range(2):
+            with startup_report.async_measure(
+                hass, startup_report.CATEGORY_STAGES, "stage_1", "setup"
+            ):
+                pass
+
+    assert report.categories[startup_report.CATEGORY_STAGES] == {
+        "stage_1": {"setup": 2.5}
+    }
+
+
+async def test_save_report(hass, hass_storage):
+    """Test reports of the last startups are stored."""
+    hass.data[DATA_IMPORT_TIME] = {"homeassistant.components.hue": 0.5}
+
+    for _ in range(startup_report.MAX_REPORTS + 1):
+        startup_report.async_start_report(hass)
+        await startup_report.async_save_report(hass)
+
+    assert startup_report.async_get_report(hass) is None
+    reports = await startup_report.async_get_reports(hass)
+    assert len(reports) == startup_report.MAX_REPORTS
+    assert reports == hass_storage[startup_report.STORAGE_KEY]["data"]["reports"]
+    assert reports[-1]["version"] == __version__
+    assert reports[-1]["modules"] == {"homeassistant.components.hue": 0.5}
+    assert reports[-1]["integrations"] == {}
+
+
+async def test_report_integration_setup(hass):
+    """Test the steps of setting up integrations and config entries."""
+    mock_integration(
+        hass,
+        MockModule(
+            "comp", async_setup_entry=AsyncMock(return_value=True), dependencies=[]
+        ),
+    )
+    mock_entity_platform(hass, "config_flow.comp", None)
+    config_entry = MockConfigEntry(domain="comp", entry_id="mock-id", title="Mock")
+    config_entry.add_to_hass(hass)
+
+    async def async_setup_entry(hass, config_entry, async_add_entities):
+        """Mock setup entry method."""
+        async_add_entities([MockEntity(name="test1"), MockEntity(name="test2")])
+        return True
+
+    startup_report.async_start_report(hass)
+    report = startup_report.async_get_report(hass)
+
+    with patch.dict(config_entries.HANDLERS, {"comp": config_entries.ConfigFlow}):
+        assert await async_setup_component(hass, "comp", {})
+    entity_platform = MockEntityPlatform(
+        hass,
+        platform_name="comp",
+        platform=MockPlatform(async_setup_entry=async_setup_entry),
+    )
+    assert await entity_platform.async_setup_entry(config_entry)
+
+    assert report.categories[startup_report.CATEGORY_INTEGRATIONS]["comp"].keys() == {
+        "dependencies",
+        "import",
+        "config",
+        "setup",
+    }
+    entry_steps = report.categories[startup_report.CATEGORY_CONFIG_ENTRIES]["mock-id"]
+    assert entry_steps["domain"] == "comp"
+    assert entry_steps["title"] == "Mock"
+    assert entry_steps["setup"] >= 0
+    platform_steps = report.categories[startup_report.CATEGORY_PLATFORMS][
+        "test_domain.comp"
+    ]
+    assert platform_steps.keys() == {"setup", "add_entities", "entities"}
+    assert platform_steps["entities"] == 2
@@ -2594,6 +2594,122 @@ def test_async_render_to_info_with_branching(hass):
     assert info.rate_limit is None
 
 
+def test_async_render_to_info_inputs_unchanged(hass):
+    """Test render info tells if the states read by a render changed."""
+    hass.states.async_set("sensor.a", "1", {"noisy": 1, "unit": "W"})
+    hass.states.async_set("sensor.b", "2", {"noisy": 1})
+
+    info = render_to_info(
+        hass, "{{ states('sensor.a') }} {{ state_attr('sensor.b', 'unit') }}"
+    )
+    assert info.memoizable
+    assert info.async_inputs_unchanged(hass)
+
+    hass.states.async_set("sensor.a", "1", {"noisy": 2, "unit": "W"})
+    hass.states.async_set("sensor.b", "2", {"noisy": 2})
+    assert info.async_inputs_unchanged(hass)
+
+    hass.states.async_set("sensor.b", "2", {"noisy": 2, "unit": "kW"})
+    assert not info.async_inputs_unchanged(hass)
+
+    info = render_to_info(hass, "{{ states.sensor.a.attributes.unit }}")
+    assert info.async_inputs_unchanged(hass)
+    hass.states.async_set("sensor.a", "2", {"noisy": 2, "unit": "W"})
+    assert info.async_inputs_unchanged(hass)
+    hass.states.async_set("sensor.a", "2", {"noisy": 3, "unit": "W"})
+    assert not info.async_inputs_unchanged(hass)
+
+    info = render_to_info(hass, "{{ states('sensor.missing') }}")
+    assert info.async_inputs_unchanged(hass)
+    hass.states.async_set("sensor.missing", "on")
+    assert not info.async_inputs_unchanged(hass)
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states.sensor | count }}",
+        "{{ states('sensor.a') }} {{ now() }}",
+        "{{ states('sensor.a') }} {{ [1, 2] | random }}",
+        "{{ states('sensor.a') }} {{ area_entities('kitchen') }}",
+        "{{ states('sensor.a') }} {{ 'sensor.a' | device_id }}",
+        "{{ states('sensor.a') }} {{ relative_time(now()) }}",
+    ],
+)
+def test_async_render_to_info_not_memoizable(hass, template_str):
+    """Test renders reading more than specific states cannot be memoized."""
+    hass.states.async_set("sensor.a", "1")
+
+    info = render_to_info(hass, template_str)
+    assert not info.memoizable
+    assert not info.async_inputs_unchanged(hass)
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.a') }}",
+        "{{ states('sensor.missing') }}",
+        "{{ is_state('sensor.a', '1.5') }}",
+        "{{ is_state_attr('sensor.a', 'unit', 'W') }}",
+        "{{ state_attr('sensor.a', 'power') | float * 2 }}",
+        "{{ state_attr('sensor.a', 'unit') | float }}",
+        "{{ (states('sensor.a') | float + 1) | round(1) }}",
+        "{{ states('sensor.a') | int(5) // 2 - -1 }}",
+        "{{ states('sensor.a') | float / 4 > 0.3 and not is_state('sensor.b', 'on') }}",
+        "{{ states('sensor.b') == 'off' or states('sensor.a') }}",
+        "Power: {{ state_attr('sensor.a', 'power') }} {{ state_attr('sensor.a', 'unit') }}",
+        "{{ state_attr('sensor.a', 'power') * none }}",
+    ],
+)
+def test_native_template(hass, template_str):
+    """Test simple templates render without Jinja like they do with Jinja."""
+    hass.states.async_set("sensor.a", "1.5", {"power": 12, "unit": "W"})
+    hass.states.async_set("sensor.b", "off")
+    assert template._native_template(template_str) is not None
+
+    with patch("homeassistant.helpers.template._native_template", return_value=None):
+        jinja_info = render_to_info(hass, template_str)
+    with patch(
+        "homeassistant.helpers.template._render_with_context",
+        side_effect=AssertionError,
+    ):
+        native_info = render_to_info(hass, template_str)
+
+    if jinja_info.exception:
+        assert str(native_info.exception) == str(jinja_info.exception)
+    else:
+        assert native_info.result() == jinja_info.result()
+    assert native_info.entities == jinja_info.entities
+    assert native_info.state_reads == jinja_info.state_reads
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states.sensor.a.state }}",
+        "{{ states('sensor.a', 'extra') }}",
+        "{{ states('sensor.a') | float(default=0) }}",
+        "{{ states('sensor.a') | lower }}",
+        "{{ now() }}",
+        "{{ value }}",
+        "{{ 2 ** 8 }}",
+        "{% if is_state('sensor.a', 'on') %}on{% endif %}",
+    ],
+)
+def test_native_template_not_supported(template_str):
+    """Test templates outside of the supported subset are rendered by Jinja."""
+    assert template._native_template(template_str) is None
+
+
+def test_native_template_shadowed_by_variables(hass):
+    """Test variables shadowing a function are rendered by Jinja."""
+    hass.states.async_set("sensor.a", "on")
+    tpl = template.Template("{{ is_state('sensor.a', 'on') }}", hass)
+    assert tpl.async_render() is True
+    assert tpl.async_render({"is_state": lambda *args: "shadowed"}) == "shadowed"
+
+
 def test_async_render_to_info_with_complex_branching(hass):
     """Test async_render_to_info function by domain."""
     hass.states.async_set("light.a", "off")
@@ -3101,35 +3217,55 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_code_cache(hass):
+    """Test compiled template code is shared between templates."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    tpl = template.Template(template_string, hass)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    key = (tpl._env.compile_cache_key, template_string)
+    assert key in template._COMPILED_CODE_CACHE
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string, hass)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert tpl2._compiled_code is tpl._compiled_code
 
+    # The code outlives the templates using it
     del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
     del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert key in template._COMPILED_CODE_CACHE
+
+    # Environments of the same kind share the code
+    limited = template.Template(template_string, hass)
+    limited._limited = True
+    limited.ensure_valid()
+    assert limited._env.compile_cache_key != key[0]
+    assert (limited._env.compile_cache_key, template_string) in (
+        template._COMPILED_CODE_CACHE
+    )
+    assert limited.async_render(limited=True) == "foo=x%26y&bar=42"
+
+
+def test_compiled_code_cache_eviction():
+    """Test the compiled code cache evicts the least recently used code."""
+    cache = template.CompiledCodeCache(2)
+    code_1 = compile("1", "<test>", "eval")
+    code_2 = compile("2", "<test>", "eval")
+    code_3 = compile("3", "<test>", "eval")
+
+    assert cache.set(((True, False, False), "1"), code_1) is code_1
+    cache.set(((True, False, False), "2"), code_2)
+    assert cache.get(((True, False, False), "1")) is code_1
+    cache.set(((True, False, False), "3"), code_3)
+
+    assert len(cache) == 2
+    assert cache.get(((True, False, False), "2")) is None
+    assert cache.get(((True, False, False), "1")) is code_1
+    assert cache.get(((True, False, False), "3")) is code_3
+
+    cache.clear()
+    assert len(cache) == 0
 
 
 def test_is_template_string():
@@ -7,11 +7,13 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, core, runner
+from homeassistant import bootstrap, core, loader, runner
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import startup_report
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.setup import DATA_SETUP
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
@@ -213,6 +215,100 @@ async def test_setup_after_deps_in_stage_1_ignored(hass):
     assert order == ["cloud", "an_after_dep", "normal_integration"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_preimports_integrations(hass):
+    """Test integrations and their configured platforms are imported first."""
+    mock_integration(hass, MockModule(domain="root"))
+    mock_integration(hass, MockModule(domain="platform_int"))
+
+    with patch("homeassistant.loader.async_preimport_integrations") as mock_preimport:
+        await bootstrap._async_set_up_integrations(
+            hass, {"root": [{"platform": "platform_int"}, {"platform": "missing"}]}
+        )
+
+    assert len(mock_preimport.mock_calls) == 1
+    _, integrations, platforms = mock_preimport.mock_calls[0][1]
+    assert sorted(integration.domain for integration in integrations) == [
+        "platform_int",
+        "root",
+    ]
+    assert platforms == {"platform_int": {"root"}, "missing": {"root"}}
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_saves_startup_report(hass, hass_storage):
+    """Test the startup report is stored when the setup is done."""
+    mock_integration(hass, MockModule(domain="root"))
+
+    await bootstrap._async_set_up_integrations(hass, {"root": {}})
+
+    report = hass_storage[startup_report.STORAGE_KEY]["data"]["reports"][-1]
+    assert report["integrations"]["root"].keys() == {
+        "dependencies",
+        "import",
+        "config",
+        "setup",
+    }
+    assert report["stages"].keys() == {"stage_2", "wrap_up"}
+    assert report["stages"]["stage_2"].keys() == {"preimport", "setup"}
+    assert startup_report.async_get_report(hass) is None
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_startup_report_error(hass, caplog):
+    """Test an error storing the startup report does not fail the setup."""
+    mock_integration(hass, MockModule(domain="root"))
+
+    with patch(
+        "homeassistant.helpers.startup_report.async_save_report",
+        side_effect=HomeAssistantError("Boom"),
+    ):
+        await bootstrap._async_set_up_integrations(hass, {"root": {}})
+
+    assert "root" in hass.config.components
+    assert "Error saving the startup report" in caplog.text
+
+
+async def test_preimport_skips_busy_integrations(hass):
+    """Test integrations being set up or in a config flow are not pre-imported."""
+    for domain, dependencies in (
+        ("root", []),
+        ("pending", []),
+        ("flowing", []),
+        ("needs_pending", ["pending"]),
+        ("platform_int", []),
+    ):
+        mock_integration(hass, MockModule(domain=domain, dependencies=dependencies))
+    integration_cache = {
+        domain: await loader.async_get_integration(hass, domain)
+        for domain in ("root", "pending", "flowing", "needs_pending")
+    }
+    pending = hass.loop.create_future()
+    done = hass.loop.create_future()
+    done.set_result(True)
+    hass.data[DATA_SETUP] = {"pending": pending, "done": done}
+
+    with patch.object(
+        hass.config_entries.flow,
+        "async_progress",
+        return_value=[{"handler": "flowing"}],
+    ), patch("homeassistant.loader.async_preimport_integrations") as mock_preimport:
+        await bootstrap._async_preimport_integrations(
+            hass,
+            {"root", "pending", "flowing", "needs_pending"},
+            integration_cache,
+            {"root": [{"platform": "platform_int"}, {"platform": "pending"}]},
+        )
+    pending.cancel()
+
+    _, integrations, platforms = mock_preimport.mock_calls[0][1]
+    assert sorted(integration.domain for integration in integrations) == [
+        "platform_int",
+        "root",
+    ]
+    assert platforms == {"platform_int": {"root"}}
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_via_platform(hass):
     """Test after_dependencies set up via platform."""
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -26,6 +27,7 @@ from homeassistant.const import (
     EVENT_SERVICE_REGISTERED,
     EVENT_SERVICE_REMOVED,
     EVENT_STATE_CHANGED,
+    EVENT_STATE_CHANGED_BATCH,
     EVENT_TIME_CHANGED,
     EVENT_TIMER_OUT_OF_SYNC,
     MATCH_ALL,
@@ -38,6 +40,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -383,6 +386,43 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_as_dict_json():
+    """Test the JSON of a State is encoded once."""
+    last_time = datetime(1984, 12, 8, 12, 0, 0)
+    state = ha.State(
+        "happy.happy",
+        "on",
+        {"pig": "dog"},
+        last_updated=last_time,
+        last_changed=last_time,
+    )
+    assert json.loads(state.as_dict_json) == state.as_dict()
+    assert state.as_dict_json is state.as_dict_json
+
+
+def test_state_changed_event_as_dict_json():
+    """Test the JSON of a state_changed event splices in the states."""
+    old_state = ha.State("happy.happy", "off")
+    new_state = ha.State("happy.happy", "on", {"pig": "dog"})
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "happy.happy", "old_state": old_state, "new_state": new_state},
+    )
+    expected = json.loads(json.dumps(event.as_dict(), cls=JSONEncoder))
+    assert json.loads(event.as_dict_json) == expected
+    assert new_state.as_dict_json in event.as_dict_json
+    assert event.as_dict_json is event.as_dict_json
+
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "happy.happy", "old_state": new_state, "new_state": None},
+    )
+    assert json.loads(event.as_dict_json)["data"]["new_state"] is None
+
+    event = ha.Event("some_event", {"some": "data"})
+    assert json.loads(event.as_dict_json) == event.as_dict()
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -431,6 +471,52 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass):
+    """Test we can listen for events with a value in their data."""
+    calls = []
+    other_calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener."""
+        other_calls.append(event)
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_keyed("test", "device_id", "abc", listener)
+    unsub_other = hass.bus.async_listen_keyed(
+        "test", "device_id", "def", other_listener
+    )
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    hass.bus.async_fire("test", {"device_id": ["abc"]})
+    hass.bus.async_fire("test", {"other": "abc"})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"device_id": "abc"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert calls[0].data == {"device_id": "abc"}
+    assert len(other_calls) == 0
+
+    unsub()
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    hass.bus.async_fire("test", {"device_id": "def"})
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert len(other_calls) == 1
+
+    unsub_other()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+    assert not hass.bus._keyed_listeners
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -728,6 +814,65 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass):
+    """Test setting the states of many entities at once."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    hass.states.async_set("light.desk", "off")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    batches = async_capture_events(hass, EVENT_STATE_CHANGED_BATCH)
+    all_events = async_capture_events(hass, MATCH_ALL)
+    context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ("light.bowl", "on", {"brightness": 200}),
+            ("light.desk", "off", None),
+            ("Light.New", "on", None),
+            ("light.new", "off", None),
+        ],
+        context=context,
+    )
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in events] == [
+        "light.bowl",
+        "light.new",
+        "light.new",
+    ]
+    assert events[1].data["old_state"] is None
+    assert events[2].data["old_state"] is events[1].data["new_state"]
+    assert hass.states.get("light.new").state == "off"
+    assert hass.states.get("light.bowl").attributes == {"brightness": 200}
+    assert len({event.time_fired for event in events}) == 1
+    assert all(event.context is context for event in events)
+    assert hass.states.get("light.bowl").last_updated == events[0].time_fired
+
+    assert len(batches) == 1
+    assert batches[0].data["events"] == events
+    assert batches[0] not in all_events
+    assert len(all_events) == 3
+
+
+async def test_statemachine_set_many_atomic(hass):
+    """Test no state is set when a state of the batch is invalid."""
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [("light.bowl", "on", None), ("invalid_entity", "on", None)]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl") is None
+    assert not events
+
+    hass.states.async_set_many([])
+    hass.states.async_set_many([("light.bowl", "on", None)])
+    hass.states.async_set_many([("light.bowl", "on", None)])
+    await hass.async_block_till_done()
+    assert len(events) == 1
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
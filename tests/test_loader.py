@@ -1,4 +1,7 @@
 """Test to verify that we can load components."""
+import json
+import pathlib
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -157,6 +160,96 @@ async def test_get_integration(hass):
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_from_manifest_index(hass):
+    """Test built-in integrations are resolved from the manifest index."""
+    with patch.object(loader.Integration, "resolve_from_root") as mock_resolve:
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert not mock_resolve.called
+    assert integration.is_built_in
+    assert integration.file_path == pathlib.Path(hue.__file__).parent
+    assert integration.manifest == {
+        **json.loads((integration.file_path / "manifest.json").read_text()),
+        "is_built_in": True,
+    }
+    assert "is_built_in" not in (await loader.async_get_builtin_manifests(hass))["hue"]
+
+
+async def test_get_integration_manifest_index_version(hass, caplog):
+    """Test a manifest index of another version is ignored."""
+    with patch.object(loader, "MANIFEST_INDEX_VERSION", 0):
+        assert await loader.async_get_builtin_manifests(hass) == {}
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert "Ignoring the manifest index, version 1 is not supported" in caplog.text
+    assert integration.domain == "hue"
+
+
+async def test_get_component_import_time(hass):
+    """Test the time to import a component is recorded."""
+    integration = await loader.async_get_integration(hass, "cert_expiry")
+
+    with patch.dict(sys.modules):
+        sys.modules.pop("homeassistant.components.cert_expiry", None)
+        integration.get_component()
+
+    assert (
+        hass.data[loader.DATA_IMPORT_TIME]["homeassistant.components.cert_expiry"] > 0
+    )
+    integration.get_component()
+    assert len(hass.data[loader.DATA_IMPORT_TIME]) == 1
+
+
+async def test_preimport_integrations(hass):
+    """Test integrations are imported with their platforms."""
+    integration = await loader.async_get_integration(hass, "cert_expiry")
+    modules = (
+        "homeassistant.components.cert_expiry",
+        "homeassistant.components.cert_expiry.sensor",
+        "homeassistant.components.cert_expiry.config_flow",
+    )
+
+    with patch.dict(sys.modules):
+        for module in modules:
+            sys.modules.pop(module, None)
+        await loader.async_preimport_integrations(
+            hass, [integration], {"cert_expiry": {"config_flow", "not_a_platform"}}
+        )
+        assert all(module in sys.modules for module in modules)
+
+    assert hass.data[loader.DATA_IMPORT_TIME].keys() == set(modules)
+    assert loader.DATA_COMPONENTS not in hass.data
+
+
+async def test_preimport_integrations_order(hass):
+    """Test integrations are imported after their dependencies."""
+    integrations = [
+        loader.Integration(
+            hass,
+            f"homeassistant.components.{domain}",
+            None,
+            {"domain": domain, "dependencies": dependencies},
+        )
+        for domain, dependencies in (
+            ("mod3", ["mod2"]),
+            ("mod2", ["mod1", "http"]),
+            ("mod1", []),
+            ("circ1", ["circ2"]),
+            ("circ2", ["circ1"]),
+        )
+    ]
+    imported = []
+
+    def mock_preimport(self, platforms):
+        imported.append(self.domain)
+
+    with patch.object(loader.Integration, "preimport", mock_preimport):
+        await loader.async_preimport_integrations(hass, integrations, {})
+
+    assert imported[:3] == ["mod1", "mod2", "mod3"]
+    assert sorted(imported[3:]) == ["circ1", "circ2"]
+
+
 async def test_get_integration_legacy(hass, enable_custom_integrations):
     """Test resolving integration."""
     integration = await loader.async_get_integration(hass, "test_embedded")
@@ -1,5 +1,6 @@
 """Test requirements module."""
 import os
+import sys
 from unittest.mock import call, patch
 
 import pytest
@@ -7,6 +8,9 @@ import pytest
 from homeassistant import loader, setup
 from homeassistant.requirements import (
     CONSTRAINT_FILE,
+    DATA_PKG_CACHE,
+    DATA_SATISFIED_READ_ONLY,
+    STORAGE_KEY,
     RequirementsNotFound,
     async_clear_install_history,
     async_get_integration_with_requirements,
@@ -213,16 +217,11 @@ async def test_get_integration_with_requirements_pip_install_fails_two_passes(ha
         assert integration
         assert integration.domain == "test_component"
 
-    assert len(mock_is_installed.mock_calls) == 1
-    assert sorted(mock_call[1][0] for mock_call in mock_is_installed.mock_calls) == [
-        "test-comp==1.0.0",
-    ]
+    # The installed requirement is known to be satisfied
+    assert len(mock_is_installed.mock_calls) == 0
 
     # On another attempt we remember failures and don't try again
-    assert len(mock_inst.mock_calls) == 1
-    assert sorted(mock_call[1][0] for mock_call in mock_inst.mock_calls) == [
-        "test-comp==1.0.0"
-    ]
+    assert len(mock_inst.mock_calls) == 0
 
     # Now clear the history and so we try again
     async_clear_install_history(hass)
@@ -239,14 +238,13 @@ async def test_get_integration_with_requirements_pip_install_fails_two_passes(ha
         assert integration
         assert integration.domain == "test_component"
 
-    assert len(mock_is_installed.mock_calls) == 3
+    assert len(mock_is_installed.mock_calls) == 2
     assert sorted(mock_call[1][0] for mock_call in mock_is_installed.mock_calls) == [
         "test-comp-after-dep==1.0.0",
         "test-comp-dep==1.0.0",
-        "test-comp==1.0.0",
     ]
 
-    assert len(mock_inst.mock_calls) == 7
+    assert len(mock_inst.mock_calls) == 6
     assert sorted(mock_call[1][0] for mock_call in mock_inst.mock_calls) == [
         "test-comp-after-dep==1.0.0",
         "test-comp-after-dep==1.0.0",
@@ -254,7 +252,6 @@ async def test_get_integration_with_requirements_pip_install_fails_two_passes(ha
         "test-comp-dep==1.0.0",
         "test-comp-dep==1.0.0",
         "test-comp-dep==1.0.0",
-        "test-comp==1.0.0",
     ]
 
     # Now clear the history and mock success
@@ -272,18 +269,141 @@ async def test_get_integration_with_requirements_pip_install_fails_two_passes(ha
         assert integration
         assert integration.domain == "test_component"
 
-    assert len(mock_is_installed.mock_calls) == 3
+    assert len(mock_is_installed.mock_calls) == 2
     assert sorted(mock_call[1][0] for mock_call in mock_is_installed.mock_calls) == [
         "test-comp-after-dep==1.0.0",
         "test-comp-dep==1.0.0",
-        "test-comp==1.0.0",
     ]
 
-    assert len(mock_inst.mock_calls) == 3
+    assert len(mock_inst.mock_calls) == 2
     assert sorted(mock_call[1][0] for mock_call in mock_inst.mock_calls) == [
         "test-comp-after-dep==1.0.0",
         "test-comp-dep==1.0.0",
-        "test-comp==1.0.0",
+    ]
+
+
+async def test_satisfied_requirements_skip_check(hass, hass_storage):
+    """Test satisfied requirements are not checked again."""
+    with patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+        await async_process_requirements(
+            hass, "test_component", ["hello==1.0.0", "world==1.0.0"]
+        )
+
+    assert [mock_call[1][0] for mock_call in mock_is_installed.mock_calls] == [
+        "hello==1.0.0",
+        "world==1.0.0",
+    ]
+
+    await hass.async_stop(force=True)
+    assert hass_storage[STORAGE_KEY]["data"]["requirements"] == [
+        "hello==1.0.0",
+        "world==1.0.0",
+    ]
+
+
+async def test_satisfied_requirements_loaded(hass, hass_storage):
+    """Test satisfied requirements are loaded if the environment is unchanged."""
+    with patch(
+        "homeassistant.requirements._get_environment", return_value={"python": "3.9"}
+    ):
+        hass_storage[STORAGE_KEY] = {
+            "version": 1,
+            "data": {
+                "environment": {"python": "3.9"},
+                "requirements": ["hello==1.0.0"],
+            },
+        }
+        with patch("homeassistant.util.package.is_installed") as mock_is_installed:
+            await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 0
+
+
+async def test_satisfied_requirements_environment_changed(hass, hass_storage):
+    """Test satisfied requirements are checked again if the environment changed."""
+    with patch(
+        "homeassistant.requirements._get_environment", return_value={"python": "3.10"}
+    ):
+        hass_storage[STORAGE_KEY] = {
+            "version": 1,
+            "data": {
+                "environment": {"python": "3.9"},
+                "requirements": ["hello==1.0.0"],
+            },
+        }
+        with patch(
+            "homeassistant.util.package.is_installed", return_value=True
+        ) as mock_is_installed:
+            await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 1
+
+
+async def test_satisfied_requirements_after_restart(hass, hass_storage, tmp_path):
+    """Test files created in the config dir keep the requirements satisfied."""
+    hass.config.config_dir = str(tmp_path)
+    with patch("homeassistant.util.package.is_installed", return_value=True):
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+    await hass.async_stop(force=True)
+    assert hass_storage[STORAGE_KEY]["data"]["requirements"] == ["hello==1.0.0"]
+
+    # Restart after Home Assistant wrote to its config dir, which is on the path
+    (tmp_path / "home-assistant.log").write_text("Started")
+    hass.data.pop(DATA_PKG_CACHE)
+    with patch("sys.path", [str(tmp_path), *sys.path]), patch(
+        "homeassistant.util.package.is_installed"
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 0
+
+    # Installing a package in the deps dir changes the environment
+    (tmp_path / "deps").mkdir()
+    hass.data.pop(DATA_PKG_CACHE)
+    with patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 1
+
+
+async def test_satisfied_requirements_read_only(hass, hass_storage):
+    """Test satisfied requirements are not stored when read only."""
+    hass.data[DATA_SATISFIED_READ_ONLY] = True
+    with patch("homeassistant.util.package.is_installed", return_value=True):
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    await hass.async_stop(force=True)
+    assert STORAGE_KEY not in hass_storage
+
+
+async def test_install_forgets_satisfied_requirements(hass):
+    """Test installing a package checks the other requirements again."""
+    hass.config.skip_pip = False
+    with patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    with patch("homeassistant.util.package.is_installed", return_value=False), patch(
+        "homeassistant.util.package.install_package", return_value=True
+    ):
+        await async_process_requirements(hass, "test_component", ["world==1.0.0"])
+
+    with patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(
+            hass, "test_component", ["hello==1.0.0", "world==1.0.0"]
+        )
+
+    assert [mock_call[1][0] for mock_call in mock_is_installed.mock_calls] == [
+        "hello==1.0.0"
     ]
 
 
@@ -1,4 +1,5 @@
 """Test Home Assistant json utility functions."""
+from dataclasses import dataclass
 from datetime import datetime
 from functools import partial
 from json import JSONEncoder, dumps
@@ -6,6 +7,7 @@ import math
 import os
 import sys
 from tempfile import mkdtemp
+from types import MappingProxyType
 import unittest
 from unittest.mock import Mock
 
@@ -13,9 +15,14 @@ import pytest
 
 from homeassistant.core import Event, State
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import (
     SerializationError,
+    _json_dumps_orjson,
+    _json_dumps_stdlib,
     find_paths_unserializable_data,
+    json_encoder_default,
+    json_loads,
     load_json,
     save_json,
 )
@@ -27,6 +34,10 @@ TEST_JSON_B = {"a": "one", "B": 2}
 TEST_BAD_SERIALIED = "THIS IS NOT JSON\n"
 TMP_DIR = None
 
+JSON_DUMPS = pytest.mark.parametrize(
+    "json_dumps", (_json_dumps_stdlib, _json_dumps_orjson), ids=("json", "orjson")
+)
+
 
 def setup():
     """Set up for tests."""
@@ -179,3 +190,79 @@ def test_find_unserializable_data():
         )
         == {"$(BadData).bla": bad_data}
     )
+
+
+def test_json_encoder_default():
+    """Test the default hook of the JSON backends."""
+    state = State("test.test", "hello")
+
+    assert sorted(json_encoder_default({"milk", "beer"})) == ["beer", "milk"]
+    assert json_encoder_default(("milk", "beer")) == ["milk", "beer"]
+    assert json_encoder_default(state) == state.as_dict()
+    now = dt_util.utcnow()
+    assert json_encoder_default(now) == now.isoformat()
+    assert json_encoder_default(MappingProxyType({"a": 1})) == {"a": 1}
+
+    with pytest.raises(TypeError):
+        json_encoder_default(object())
+
+
+@JSON_DUMPS
+def test_json_dumps_and_loads(json_dumps):
+    """Test dumping and loading with the JSON backends."""
+    now = dt_util.utcnow()
+    state = State("test.test", "hello", {"beers": {"pils"}}, now, now)
+    data = {"state": state, "time": now, "ids": ("a", 1)}
+
+    assert json_loads(json_dumps(data)) == {
+        "state": {
+            "entity_id": "test.test",
+            "state": "hello",
+            "attributes": {"beers": ["pils"]},
+            "last_changed": now.isoformat(),
+            "last_updated": now.isoformat(),
+            "context": state.context.as_dict(),
+        },
+        "time": now.isoformat(),
+        "ids": ["a", 1],
+    }
+
+    with pytest.raises((TypeError, ValueError)):
+        json_dumps({"bad": object()})
+
+
+def test_json_dumps_backends_match():
+    """Test both JSON backends produce the same compact output."""
+
+    @dataclass
+    class WithAsDict:
+        value: int
+
+        def as_dict(self):
+            return {"as_dict": self.value}
+
+    @dataclass
+    class Plain:
+        value: int
+
+    data = {
+        "id": 1,
+        "message": "xyz",
+        "time": datetime(2022, 1, 2, 3, 4, 5, 6, tzinfo=dt_util.UTC),
+        "dataclass": WithAsDict(2),
+        "state": State("test.test", "hello", {"beers": ("pils",)}),
+    }
+    assert _json_dumps_orjson(data) == _json_dumps_stdlib(data)
+    assert _json_dumps_stdlib({"id": 1}) == '{"id":1}'
+
+    for json_dumps in (_json_dumps_stdlib, _json_dumps_orjson):
+        with pytest.raises(TypeError):
+            json_dumps(Plain(1))
+
+
+def test_json_dumps_nan():
+    """Test NaN is rejected by the standard library and encoded as null by orjson."""
+    with pytest.raises(ValueError):
+        _json_dumps_stdlib({"value": float("nan")})
+
+    assert _json_dumps_orjson({"value": float("nan")}) == '{"value":null}'
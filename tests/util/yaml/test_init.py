@@ -445,3 +445,90 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+@pytest.mark.parametrize(
+    "loader", [yaml_loader.FastSafeLoader, yaml_loader.SafeLineLoader]
+)
+def test_loaders_add_references(loader):
+    """Test both loaders add the file and line of the loaded data."""
+    conf = "key:\n  - value\n  - other: value\nname: !input name\n"
+    with io.StringIO(conf) as file:
+        file.name = "config.yaml"
+        doc = yaml_loader.yaml.load(file, Loader=loader)
+    assert doc == {"key": ["value", {"other": "value"}], "name": yaml.Input("name")}
+    assert doc["key"].__config_file__ == "config.yaml"
+    assert doc["key"].__line__ == 1
+    assert doc["key"][1].__line__ == 2
+
+
+def test_parse_yaml_error(caplog):
+    """Test the error of the line loader is raised when parsing fails."""
+    with pytest.raises(HomeAssistantError) as exc_info:
+        yaml.parse_yaml("key: [value")
+    assert str(exc_info.value).startswith("while parsing a flow sequence")
+    assert caplog.text.count("while parsing a flow sequence") == 1
+
+
+def test_load_yaml_cache(tmp_path):
+    """Test files are only parsed again when they changed."""
+    yaml_loader.clear_cache()
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text(
+        "homeassistant: !include core.yaml\n"
+        "sensor: !include_dir_merge_list sensors\n"
+        "password: !secret password\n"
+    )
+    (tmp_path / "core.yaml").write_text("name: Home\n")
+    (tmp_path / yaml.SECRET_YAML).write_text("password: pw1\n")
+    (tmp_path / "sensors").mkdir()
+    (tmp_path / "sensors" / "one.yaml").write_text("- platform: one\n")
+
+    def load():
+        with patch.object(
+            yaml_loader, "_parse_yaml", wraps=yaml_loader._parse_yaml
+        ) as mock_parse:
+            config = yaml.load_yaml(str(config_path), yaml.Secrets(tmp_path))
+        return config, mock_parse.call_count
+
+    expected = {
+        "homeassistant": {"name": "Home"},
+        "sensor": [{"platform": "one"}],
+        "password": "pw1",
+    }
+    config, parsed = load()
+    assert config == expected
+    assert parsed == 4
+
+    config["homeassistant"]["name"] = "Changed"
+    config, parsed = load()
+    assert config == expected
+    assert config["homeassistant"].__config_file__ == str(config_path)
+    assert parsed == 0
+
+    (tmp_path / "core.yaml").write_text("name: Other home\n")
+    config, parsed = load()
+    assert config["homeassistant"] == {"name": "Other home"}
+    assert parsed == 2
+
+    (tmp_path / "sensors" / "two.yaml").write_text("- platform: two\n")
+    config, parsed = load()
+    assert config["sensor"] == [{"platform": "one"}, {"platform": "two"}]
+    assert parsed == 2
+
+    (tmp_path / yaml.SECRET_YAML).write_text("password: pw22\n")
+    config, parsed = load()
+    assert config["password"] == "pw22"
+    assert parsed == 2
+
+
+def test_load_yaml_cache_env_var(tmp_path):
+    """Test files reading the environment are always parsed again."""
+    yaml_loader.clear_cache()
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text("password: !env_var PASSWORD\n")
+
+    with patch.dict(os.environ, {"PASSWORD": "pw1"}):
+        assert yaml.load_yaml(str(config_path)) == {"password": "pw1"}
+    with patch.dict(os.environ, {"PASSWORD": "pw2"}):
+        assert yaml.load_yaml(str(config_path)) == {"password": "pw2"}